@@ -1,9 +1,42 @@
 """Smart catalog: ~80 curated targets + SIMBAD lookups + solar-system ephemerides."""
 
+from auto_telescope.catalog.columnar import CatalogTable
 from auto_telescope.catalog.curated import CURATED_TARGETS, get_curated_target
+from auto_telescope.catalog.ephemeris import EphemerisCoordinates, SolarSystemEphemeris
 from auto_telescope.catalog.feasibility import (
+    FeasibilityNote,
+    FeasibilityReason,
+    FeasibilityTable,
     FeasibilityVerdict,
     assess_feasibility,
+    assess_feasibility_many,
+)
+from auto_telescope.catalog.minor_bodies import (
+    MinorBodyCatalog,
+    OrbitalElements,
+    lookup_minor_body,
+    parse_mpc_elements,
+    register_minor_bodies,
+    screen_minor_bodies,
+)
+from auto_telescope.catalog.name_index import (
+    NameIndex,
+    NameMatch,
+    normalize_name,
+    register_targets,
+    search_targets,
+)
+from auto_telescope.catalog.resolve_cache import (
+    ResolveCache,
+    ResolveCacheStats,
+    clear_resolve_cache,
+    resolve_cache_stats,
+)
+from auto_telescope.catalog.resolver import (
+    Resolution,
+    ResolutionStatus,
+    TargetPendingError,
+    TargetResolver,
 )
 from auto_telescope.catalog.simbad import lookup_simbad
 from auto_telescope.catalog.solar_system import (
@@ -11,19 +44,52 @@ from auto_telescope.catalog.solar_system import (
     is_solar_system_body,
     lookup_solar_system,
 )
-from auto_telescope.catalog.targets import Target, TargetType, Tier, resolve_target
+from auto_telescope.catalog.targets import (
+    Target,
+    TargetType,
+    Tier,
+    resolve_local,
+    resolve_target,
+)
 
 __all__ = [
     "CURATED_TARGETS",
     "SOLAR_SYSTEM_BODIES",
+    "CatalogTable",
+    "EphemerisCoordinates",
+    "FeasibilityNote",
+    "FeasibilityReason",
+    "FeasibilityTable",
     "FeasibilityVerdict",
+    "MinorBodyCatalog",
+    "NameIndex",
+    "NameMatch",
+    "OrbitalElements",
+    "Resolution",
+    "ResolutionStatus",
+    "ResolveCache",
+    "ResolveCacheStats",
+    "SolarSystemEphemeris",
     "Target",
+    "TargetPendingError",
+    "TargetResolver",
     "TargetType",
     "Tier",
     "assess_feasibility",
+    "assess_feasibility_many",
+    "clear_resolve_cache",
     "get_curated_target",
     "is_solar_system_body",
+    "lookup_minor_body",
     "lookup_simbad",
     "lookup_solar_system",
+    "normalize_name",
+    "parse_mpc_elements",
+    "register_minor_bodies",
+    "register_targets",
+    "resolve_cache_stats",
+    "resolve_local",
     "resolve_target",
+    "screen_minor_bodies",
+    "search_targets",
 ]
@@ -0,0 +1,64 @@
+"""Columnar view of a target catalog for whole-catalog NumPy passes.
+
+A list of ``Target`` objects is the right shape for one lookup and the wrong shape
+for "which of these 100k objects can we image from here?". ``CatalogTable`` holds
+the same fields as parallel arrays (missing magnitudes / sizes as NaN), built once
+per catalog, so feasibility filters and sky queries are array expressions instead
+of Python loops.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+
+import numpy as np
+
+from auto_telescope.catalog.targets import Target
+
+
+@dataclass(frozen=True, slots=True)
+class CatalogTable:
+    """Parallel arrays, one row per target. Row ``i`` is ``targets[i]``."""
+
+    targets: tuple[Target, ...]
+    ra_deg: np.ndarray  # float64
+    dec_deg: np.ndarray  # float64
+    magnitude: np.ndarray  # float64, NaN where unknown
+    angular_size_arcmin: np.ndarray  # float64, NaN where unknown
+    tier: np.ndarray  # int8, Tier values
+
+    @classmethod
+    def from_targets(cls, targets: Iterable[Target]) -> CatalogTable:
+        rows = tuple(targets)
+
+        def column(values: Sequence[float | None]) -> np.ndarray:
+            return np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+
+        return cls(
+            targets=rows,
+            ra_deg=np.array([t.ra_deg % 360.0 for t in rows], dtype=np.float64),
+            dec_deg=np.array([t.dec_deg for t in rows], dtype=np.float64),
+            magnitude=column([t.magnitude for t in rows]),
+            angular_size_arcmin=column([t.angular_size_arcmin for t in rows]),
+            tier=np.array([int(t.tier) for t in rows], dtype=np.int8),
+        )
+
+    def __len__(self) -> int:
+        return len(self.targets)
+
+    @property
+    def ids(self) -> tuple[str, ...]:
+        return tuple(t.id for t in self.targets)
+
+    def take(self, rows: np.ndarray) -> CatalogTable:
+        """Sub-table for a boolean mask or index array."""
+        idx = np.flatnonzero(rows) if rows.dtype == bool else rows
+        return CatalogTable(
+            targets=tuple(self.targets[int(i)] for i in idx),
+            ra_deg=self.ra_deg[idx],
+            dec_deg=self.dec_deg[idx],
+            magnitude=self.magnitude[idx],
+            angular_size_arcmin=self.angular_size_arcmin[idx],
+            tier=self.tier[idx],
+        )
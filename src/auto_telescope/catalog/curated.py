@@ -15,6 +15,7 @@ cross-checked against the Wikipedia Messier list and SEDS.org. Best-months is th
 
 from __future__ import annotations
 
+from auto_telescope.catalog.name_index import normalize_name
 from auto_telescope.catalog.targets import Target, TargetType, Tier
 
 
@@ -151,13 +152,20 @@ CURATED_TARGETS: tuple[Target, ...] = _TIER1 + _TIER2 + _TIER3_REJECTED
 
 
 _BY_KEY: dict[str, Target] = {}
+# Same keys run through normalize_name, so "m 13" / "Messier 13" / "ngc6205" hit too.
+_BY_NORMALIZED: dict[str, Target] = {}
 for _tgt in CURATED_TARGETS:
-    _BY_KEY[_tgt.id.lower()] = _tgt
-    _BY_KEY[_tgt.display_name.lower()] = _tgt
-    for _alias in _tgt.aliases:
-        _BY_KEY[_alias.lower()] = _tgt
+    for _name in (_tgt.id, _tgt.display_name, *_tgt.aliases):
+        _BY_KEY[_name.lower()] = _tgt
+        _BY_NORMALIZED.setdefault(normalize_name(_name), _tgt)
 
 
 def get_curated_target(name: str) -> Target | None:
-    """Look up a curated target by id, display name, or alias (case-insensitive)."""
-    return _BY_KEY.get(name.strip().lower())
+    """Look up a curated target by id, display name, or alias (case-insensitive).
+
+    Spacing, punctuation and long-form catalog prefixes are forgiven.
+    """
+    hit = _BY_KEY.get(name.strip().lower())
+    if hit is not None:
+        return hit
+    return _BY_NORMALIZED.get(normalize_name(name))
@@ -0,0 +1,226 @@
+"""Chebyshev-interpolated solar-system ephemeris tables.
+
+``lookup_solar_system`` calls ``get_body`` once per request, which costs milliseconds.
+Window scans and tracking need positions at hundreds of instants, so we precompute:
+
+1. Sample each body's topocentric position (the same ``get_body`` / ``get_sun`` values
+   ``lookup_solar_system`` returns) at Chebyshev nodes inside one-day segments. All
+   samples for a body go through astropy in one vectorized call.
+2. Fit a Chebyshev polynomial per segment to the *unit vector* (x, y, z) rather than
+   to RA/Dec, so the RA wrap at 0/360 deg and the poles need no special casing.
+3. Evaluate any array of instants with one ``chebval`` over the selected segments.
+
+A 14-day table for the Sun, Moon and seven planets is ~40 KB of float64 coefficients,
+reproduces ``get_body`` to a few milliarcseconds, and costs microseconds per instant.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+
+import numpy as np
+from astropy import units as u
+from astropy.coordinates import get_body, get_sun
+from astropy.time import Time
+from numpy.polynomial import chebyshev
+
+from auto_telescope.catalog.solar_system import SOLAR_SYSTEM_BODIES
+from auto_telescope.config.site import Site
+
+SEGMENT_SECONDS = 86_400.0
+# The Moon moves ~13 deg/day with ~1 deg of diurnal parallax; it needs more terms.
+_DEGREE = {"moon": 12}
+_DEFAULT_DEGREE = 8
+
+TimesLike = datetime | Sequence[datetime] | np.ndarray | float
+
+
+def to_unix_seconds(times: TimesLike) -> np.ndarray:
+    """Convert datetimes / datetime64 / unix floats to a float64 array of unix seconds.
+
+    Naive datetimes are taken as UTC, as everywhere else in the codebase.
+    """
+    if isinstance(times, datetime):
+        times = [times]
+    arr = np.asarray(times)
+    if arr.dtype.kind == "M":
+        return arr.astype("datetime64[us]").astype(np.int64) / 1e6
+    if arr.dtype == object:
+        return np.array(
+            [(t if t.tzinfo else t.replace(tzinfo=UTC)).timestamp() for t in arr.ravel()],
+            dtype=np.float64,
+        ).reshape(arr.shape)
+    return arr.astype(np.float64)
+
+
+def unit_vectors_to_radec(vec: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """(..., 3) direction vectors → (ra_deg in [0, 360), dec_deg)."""
+    norm = np.linalg.norm(vec, axis=-1)
+    ra = np.degrees(np.arctan2(vec[..., 1], vec[..., 0])) % 360.0
+    dec = np.degrees(np.arcsin(np.clip(vec[..., 2] / norm, -1.0, 1.0)))
+    return ra, dec
+
+
+def radec_to_unit_vectors(ra_deg: np.ndarray, dec_deg: np.ndarray) -> np.ndarray:
+    """Inverse of :func:`unit_vectors_to_radec`; returns shape (..., 3)."""
+    ra = np.radians(ra_deg)
+    dec = np.radians(dec_deg)
+    cos_dec = np.cos(dec)
+    return np.stack([cos_dec * np.cos(ra), cos_dec * np.sin(ra), np.sin(dec)], axis=-1)
+
+
+def _sample_body(key: str, unix: np.ndarray, site: Site) -> np.ndarray:
+    t = Time(unix, format="unix", scale="utc")
+    coord = get_sun(t) if key == "sun" else get_body(key, t, site.to_earth_location())
+    return radec_to_unit_vectors(coord.ra.to(u.deg).value, coord.dec.to(u.deg).value)
+
+
+@dataclass(frozen=True, slots=True)
+class ChebyshevTable:
+    """Piecewise-Chebyshev fit of one body's apparent direction over a time range."""
+
+    body: str
+    start_unix: float
+    segment_seconds: float
+    coeffs: np.ndarray  # (n_segments, degree + 1, 3)
+
+    @property
+    def end_unix(self) -> float:
+        return self.start_unix + self.segment_seconds * self.coeffs.shape[0]
+
+    def covers(self, unix: np.ndarray) -> bool:
+        return bool(np.all((unix >= self.start_unix) & (unix <= self.end_unix)))
+
+    def unit_vectors(self, unix: np.ndarray) -> np.ndarray:
+        """Evaluate at ``unix`` seconds (any shape); returns shape ``unix.shape + (3,)``."""
+        if not self.covers(unix):
+            raise ValueError(f"{self.body} ephemeris does not cover the requested times")
+        rel = (unix - self.start_unix) / self.segment_seconds
+        seg = np.minimum(rel.astype(np.int64), self.coeffs.shape[0] - 1)
+        x = 2.0 * (rel - seg) - 1.0
+        # chebval wants coefficients on axis 0; tensor=False pairs each x with its segment.
+        c = np.moveaxis(self.coeffs[seg], -2, 0)
+        return chebyshev.chebval(x[..., None], c, tensor=False)
+
+    def radec(self, unix: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        return unit_vectors_to_radec(self.unit_vectors(unix))
+
+    @classmethod
+    def fit(
+        cls,
+        key: str,
+        site: Site,
+        start_unix: float,
+        n_segments: int,
+        *,
+        segment_seconds: float = SEGMENT_SECONDS,
+        degree: int | None = None,
+    ) -> ChebyshevTable:
+        deg = degree if degree is not None else _DEGREE.get(key, _DEFAULT_DEGREE)
+        n_nodes = 2 * (deg + 1)  # oversample for a well-conditioned least-squares fit
+        nodes = np.cos(np.pi * (np.arange(n_nodes) + 0.5) / n_nodes)
+        offsets = np.arange(n_segments)[:, None] + (nodes[None, :] + 1.0) / 2.0
+        samples = _sample_body(key, start_unix + offsets.ravel() * segment_seconds, site)
+        samples = samples.reshape(n_segments, n_nodes, 3)
+        # chebfit fits many columns sharing one x: (n_nodes, n_segments*3).
+        y = samples.transpose(1, 0, 2).reshape(n_nodes, -1)
+        coeffs = chebyshev.chebfit(nodes, y, deg).reshape(deg + 1, n_segments, 3)
+        return cls(
+            body=key,
+            start_unix=float(start_unix),
+            segment_seconds=float(segment_seconds),
+            coeffs=np.ascontiguousarray(coeffs.transpose(1, 0, 2)),
+        )
+
+
+class SolarSystemEphemeris:
+    """Precomputed topocentric Sun/Moon/planet positions for one site and date range."""
+
+    def __init__(self, site: Site, tables: dict[str, ChebyshevTable]) -> None:
+        self.site = site
+        self._tables = tables
+
+    @classmethod
+    def build(
+        cls,
+        site: Site,
+        start_utc: datetime,
+        end_utc: datetime,
+        *,
+        bodies: Iterable[str] | None = None,
+    ) -> SolarSystemEphemeris:
+        """Fit tables covering [start_utc, end_utc], padded out to whole days."""
+        start, end = to_unix_seconds([start_utc, end_utc])
+        if end <= start:
+            raise ValueError("end_utc must be after start_utc")
+        start = np.floor(start / SEGMENT_SECONDS) * SEGMENT_SECONDS
+        n_segments = int(np.ceil((end - start) / SEGMENT_SECONDS))
+        keys = list(bodies) if bodies is not None else list(SOLAR_SYSTEM_BODIES)
+        unknown = [k for k in keys if k not in SOLAR_SYSTEM_BODIES]
+        if unknown:
+            raise KeyError(f"not solar-system bodies: {unknown}")
+        return cls(site, {k: ChebyshevTable.fit(k, site, start, n_segments) for k in keys})
+
+    @property
+    def bodies(self) -> tuple[str, ...]:
+        return tuple(self._tables)
+
+    def covers(self, body: str, times: TimesLike) -> bool:
+        table = self._tables.get(body)
+        return table is not None and table.covers(to_unix_seconds(times))
+
+    def radec(self, body: str, times: TimesLike) -> tuple[np.ndarray, np.ndarray]:
+        """RA/Dec in degrees for ``body`` at every instant in ``times`` (vectorized)."""
+        return self._tables[body].radec(to_unix_seconds(times))
+
+    def radec_at(self, body: str, when_utc: datetime) -> tuple[float, float]:
+        ra, dec = self.radec(body, when_utc)
+        return float(ra[0]), float(dec[0])
+
+    def provider(self, body: str) -> EphemerisCoordinates:
+        """A ``CoordinateProvider`` for ``body`` (for ``compute_windows``)."""
+        if body not in self._tables:
+            raise KeyError(f"{body!r} is not in this ephemeris")
+        return EphemerisCoordinates(self, body)
+
+    def save(self, path: Path) -> None:
+        """Write the coefficient tables to a compressed ``.npz``."""
+        arrays: dict[str, np.ndarray] = {
+            "site": np.array([self.site.name, self.site.timezone], dtype=np.str_),
+            "site_coords": np.array(
+                [self.site.latitude, self.site.longitude, self.site.elevation_m]
+            ),
+        }
+        for key, table in self._tables.items():
+            arrays[f"{key}_coeffs"] = table.coeffs
+            arrays[f"{key}_span"] = np.array([table.start_unix, table.segment_seconds])
+        np.savez_compressed(path, **arrays)  # type: ignore[arg-type]
+
+    @classmethod
+    def load(cls, path: Path) -> SolarSystemEphemeris:
+        with np.load(path) as data:
+            name, tz = (str(v) for v in data["site"])
+            lat, lon, elev = (float(v) for v in data["site_coords"])
+            site = Site(name=name, latitude=lat, longitude=lon, elevation_m=elev, timezone=tz)
+            tables = {}
+            for field in data.files:
+                if not field.endswith("_coeffs"):
+                    continue
+                key = field.removesuffix("_coeffs")
+                start, seg = (float(v) for v in data[f"{key}_span"])
+                tables[key] = ChebyshevTable(key, start, seg, data[field])
+        return cls(site, tables)
+
+
+@dataclass(frozen=True, slots=True)
+class EphemerisCoordinates:
+    """Moving-body ``CoordinateProvider`` backed by a ``SolarSystemEphemeris``."""
+
+    ephemeris: SolarSystemEphemeris
+    body: str
+
+    def radec_many(self, unix_seconds: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        return self.ephemeris.radec(self.body, unix_seconds)
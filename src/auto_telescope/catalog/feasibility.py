@@ -10,12 +10,20 @@ We model three independent constraints:
    safety horizon (20 deg). Hard reject.
 
 Each rejection comes with a human-readable reason for the operator UI.
+
+``assess_feasibility_many`` applies the same rules to a whole ``CatalogTable`` as NumPy
+masks and returns compact reason codes; ``FeasibilityTable.verdict(i)`` expands a row
+back into the exact ``FeasibilityVerdict`` the scalar function would give.
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass
+from enum import IntEnum, IntFlag
+
+import numpy as np
 
+from auto_telescope.catalog.columnar import CatalogTable
 from auto_telescope.catalog.targets import Target, Tier
 from auto_telescope.config.site import Site
 
@@ -27,6 +35,23 @@ CAMERA_FOV_HEIGHT_ARCMIN = 10.85
 DEFAULT_MAG_LIMIT = 12.0
 
 
+class FeasibilityReason(IntEnum):
+    """Row reason code in a ``FeasibilityTable``; the first failing rule wins."""
+
+    OK = 0
+    TIER_SKIP = 1
+    TOO_FAINT = 2
+    BELOW_HORIZON = 3
+
+
+class FeasibilityNote(IntFlag):
+    """Non-blocking notes, as bit flags."""
+
+    NONE = 0
+    LARGER_THAN_FOV = 1
+    POINT_SOURCE = 2
+
+
 @dataclass(frozen=True, slots=True)
 class FeasibilityVerdict:
     """Whether a target is feasible from this site, with explanation."""
@@ -48,19 +73,12 @@ def assess_feasibility(
 
     # --- Tier explicit reject ---
     if target.tier == Tier.SKIP:
-        return FeasibilityVerdict(
-            feasible=False,
-            reason=f"target tier=SKIP ({target.description or 'curated rejection'})",
-        )
+        return FeasibilityVerdict(feasible=False, reason=_tier_skip_reason(target))
 
     # --- Magnitude floor ---
     if target.magnitude is not None and target.magnitude > magnitude_limit:
         return FeasibilityVerdict(
-            feasible=False,
-            reason=(
-                f"mag {target.magnitude:.1f} fainter than detection limit "
-                f"{magnitude_limit:.1f} for 30-s exposures at Bortle 7"
-            ),
+            feasible=False, reason=_too_faint_reason(target.magnitude, magnitude_limit)
         )
 
     # --- Declination / horizon constraint ---
@@ -69,21 +87,135 @@ def assess_feasibility(
     if max_altitude < safety_horizon_deg:
         return FeasibilityVerdict(
             feasible=False,
-            reason=(
-                f"max altitude from {site.name} is {max_altitude:.1f} deg, "
-                f"below safety horizon {safety_horizon_deg:.0f} deg"
-            ),
+            reason=_below_horizon_reason(site, max_altitude, safety_horizon_deg),
         )
 
     # --- Angular size note (does not block, just informs) ---
     size = target.angular_size_arcmin
     if size is not None:
         if size > CAMERA_FOV_WIDTH_ARCMIN:
-            notes.append(
-                f"target spans {size:.1f}' but FOV is {CAMERA_FOV_WIDTH_ARCMIN:.1f}'; "
-                "image will be cropped to a region of interest"
-            )
+            notes.append(_larger_than_fov_note(size))
         elif size < 0.5:
-            notes.append("target is < 0.5' — point-source / star-like at our resolution")
+            notes.append(_POINT_SOURCE_NOTE)
 
     return FeasibilityVerdict(feasible=True, reason="ok", notes=tuple(notes))
+
+
+def _tier_skip_reason(target: Target) -> str:
+    return f"target tier=SKIP ({target.description or 'curated rejection'})"
+
+
+def _too_faint_reason(magnitude: float, magnitude_limit: float) -> str:
+    return (
+        f"mag {magnitude:.1f} fainter than detection limit "
+        f"{magnitude_limit:.1f} for 30-s exposures at Bortle 7"
+    )
+
+
+def _below_horizon_reason(site: Site, max_altitude: float, safety_horizon_deg: float) -> str:
+    return (
+        f"max altitude from {site.name} is {max_altitude:.1f} deg, "
+        f"below safety horizon {safety_horizon_deg:.0f} deg"
+    )
+
+
+def _larger_than_fov_note(size: float) -> str:
+    return (
+        f"target spans {size:.1f}' but FOV is {CAMERA_FOV_WIDTH_ARCMIN:.1f}'; "
+        "image will be cropped to a region of interest"
+    )
+
+
+_POINT_SOURCE_NOTE = "target is < 0.5' — point-source / star-like at our resolution"
+
+
+# ---- Whole-catalog assessment --------------------------------------------------------
+
+
+@dataclass(frozen=True, slots=True)
+class FeasibilityTable:
+    """Per-row result of ``assess_feasibility_many``; row ``i`` is ``catalog.targets[i]``."""
+
+    catalog: CatalogTable
+    reason: np.ndarray  # uint8 FeasibilityReason codes
+    notes: np.ndarray  # uint8 FeasibilityNote bit flags (0 for rejected rows)
+    max_altitude_deg: np.ndarray  # float64, altitude at upper culmination
+    site: Site
+    magnitude_limit: float
+    safety_horizon_deg: float
+
+    def __len__(self) -> int:
+        return len(self.catalog)
+
+    @property
+    def feasible(self) -> np.ndarray:
+        return self.reason == FeasibilityReason.OK
+
+    def feasible_targets(self) -> list[Target]:
+        return [self.catalog.targets[int(i)] for i in np.flatnonzero(self.feasible)]
+
+    def counts(self) -> dict[FeasibilityReason, int]:
+        """How many rows landed on each reason code."""
+        tally = np.bincount(self.reason, minlength=len(FeasibilityReason))
+        return {code: int(tally[code]) for code in FeasibilityReason}
+
+    def verdict(self, i: int) -> FeasibilityVerdict:
+        """Row ``i`` as the ``FeasibilityVerdict`` ``assess_feasibility`` would return."""
+        target = self.catalog.targets[i]
+        code = FeasibilityReason(int(self.reason[i]))
+        if code == FeasibilityReason.TIER_SKIP:
+            return FeasibilityVerdict(feasible=False, reason=_tier_skip_reason(target))
+        if code == FeasibilityReason.TOO_FAINT:
+            reason = _too_faint_reason(float(self.catalog.magnitude[i]), self.magnitude_limit)
+            return FeasibilityVerdict(feasible=False, reason=reason)
+        if code == FeasibilityReason.BELOW_HORIZON:
+            reason = _below_horizon_reason(
+                self.site, float(self.max_altitude_deg[i]), self.safety_horizon_deg
+            )
+            return FeasibilityVerdict(feasible=False, reason=reason)
+
+        flags = FeasibilityNote(int(self.notes[i]))
+        notes: list[str] = []
+        if FeasibilityNote.LARGER_THAN_FOV in flags:
+            notes.append(_larger_than_fov_note(float(self.catalog.angular_size_arcmin[i])))
+        if FeasibilityNote.POINT_SOURCE in flags:
+            notes.append(_POINT_SOURCE_NOTE)
+        return FeasibilityVerdict(feasible=True, reason="ok", notes=tuple(notes))
+
+
+def assess_feasibility_many(
+    catalog: CatalogTable,
+    *,
+    site: Site,
+    magnitude_limit: float = DEFAULT_MAG_LIMIT,
+    safety_horizon_deg: float = 20.0,
+) -> FeasibilityTable:
+    """``assess_feasibility`` for every row of ``catalog`` at once.
+
+    Only array comparisons run here; build the ``CatalogTable`` once and call this
+    again whenever the site or thresholds change.
+    """
+    max_altitude = 90.0 - np.abs(site.latitude - catalog.dec_deg)
+
+    # Later rules must not overwrite an earlier rejection, so assign in reverse order.
+    reason = np.full(len(catalog), FeasibilityReason.OK, dtype=np.uint8)
+    reason[max_altitude < safety_horizon_deg] = FeasibilityReason.BELOW_HORIZON
+    # NaN (unknown magnitude) compares False, matching the scalar ``is not None`` check.
+    reason[catalog.magnitude > magnitude_limit] = FeasibilityReason.TOO_FAINT
+    reason[catalog.tier == Tier.SKIP] = FeasibilityReason.TIER_SKIP
+
+    size = catalog.angular_size_arcmin
+    notes = np.zeros(len(catalog), dtype=np.uint8)
+    notes[size > CAMERA_FOV_WIDTH_ARCMIN] = FeasibilityNote.LARGER_THAN_FOV
+    notes[size < 0.5] = FeasibilityNote.POINT_SOURCE
+    notes[reason != FeasibilityReason.OK] = FeasibilityNote.NONE
+
+    return FeasibilityTable(
+        catalog=catalog,
+        reason=reason,
+        notes=notes,
+        max_altitude_deg=max_altitude,
+        site=site,
+        magnitude_limit=magnitude_limit,
+        safety_horizon_deg=safety_horizon_deg,
+    )
@@ -0,0 +1,501 @@
+"""Comets and asteroids from MPC orbital elements, propagated locally.
+
+``solar_system`` covers the Sun, Moon and planets through astropy's builtin
+ephemeris; everything smaller used to need a JPL Horizons call per instant. Instead we
+load Minor Planet Center elements from a local file (``MPCORB.DAT`` / ``NEA.txt``
+asteroid lines or ``CometEls.txt`` comet lines) and propagate them as two-body
+heliocentric orbits:
+
+* Every orbit is stored as perihelion distance, eccentricity, orientation and time of
+  perihelion, so elliptic (``e < 1``), parabolic (``e == 1``) and hyperbolic
+  (``e > 1``) objects share one columnar table.
+* Kepler's equation is solved with vectorized Newton iterations for all objects and
+  all instants at once (Barker's equation in closed form for parabolas).
+* The Earth and the observer come from astropy (``get_body_barycentric`` plus the
+  site's GCRS offset), with a light-time correction, giving topocentric astrometric
+  RA/Dec. That is within ~20" (aberration) of ``get_body``'s apparent place — plenty
+  for pointing a 14' field.
+
+Perturbations are ignored, so keep elements fresh (the MPC re-osculates monthly).
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import threading
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+from astropy import units as u
+from astropy.coordinates import AltAz, SkyCoord, get_body_barycentric, get_sun
+from astropy.time import Time
+
+from auto_telescope.catalog.ephemeris import to_unix_seconds, unit_vectors_to_radec
+from auto_telescope.catalog.name_index import normalize_name
+from auto_telescope.catalog.resolve_cache import clear_resolve_cache
+from auto_telescope.catalog.targets import Target, TargetType, Tier
+from auto_telescope.config.site import MVHS_SITE, Site
+
+log = logging.getLogger(__name__)
+
+GAUSS_K = 0.01720209895  # rad/day; sqrt(GM_sun) in AU^1.5/day
+C_AU_PER_DAY = 173.1446326846693
+OBLIQUITY_J2000_DEG = 23.439291111  # MPC elements are J2000 ecliptic
+# |e - 1| below this is treated as exactly parabolic (MPC prints 1.000000).
+PARABOLIC_TOLERANCE = 1e-8
+_MAX_NEWTON = 100
+
+
+@dataclass(frozen=True, slots=True)
+class OrbitalElements:
+    """Heliocentric osculating elements, J2000 ecliptic, in perihelion form."""
+
+    designation: str  # e.g. "(1) Ceres", "1P/Halley", "C/2023 A3 (Tsuchinshan-ATLAS)"
+    kind: TargetType  # ASTEROID or COMET
+    perihelion_au: float  # q
+    eccentricity: float
+    inclination_deg: float
+    node_deg: float  # longitude of the ascending node
+    peri_deg: float  # argument of perihelion
+    perihelion_jd_tt: float  # time of perihelion passage
+    abs_magnitude: float | None = None  # H
+    slope: float | None = None  # G for asteroids, n for comets (m = H + 5 log D + 2.5 n log r)
+
+    @property
+    def name(self) -> str:
+        """Short name: "Ceres" for "(1) Ceres", "Halley" for "1P/Halley"."""
+        text = self.designation
+        if text.startswith("(") and ") " in text:
+            return text.split(") ", 1)[1]
+        if "(" in text and text.endswith(")"):
+            return text[text.index("(") + 1 : -1]
+        if "/" in text and text.split("/", 1)[0][:-1].isdigit():
+            return text.split("/", 1)[1]
+        return text
+
+
+# ---- MPC export formats --------------------------------------------------------------
+
+
+def _unpack_digit(c: str) -> int:
+    """MPC packed-date digit: 1-9, then A=10 ... V=31."""
+    return int(c) if c.isdigit() else ord(c) - ord("A") + 10
+
+
+def _calendar_jd(year: int, month: int, day: float) -> float:
+    """Julian Date of a Gregorian calendar date (day may be fractional)."""
+    if month <= 2:
+        year -= 1
+        month += 12
+    a = year // 100
+    b = 2 - a + a // 4
+    return math.floor(365.25 * (year + 4716)) + math.floor(30.6001 * (month + 1)) + day + b - 1524.5
+
+
+def _packed_epoch_jd(packed: str) -> float:
+    century = {"I": 1800, "J": 1900, "K": 2000}[packed[0]]
+    year = century + int(packed[1:3])
+    return _calendar_jd(year, _unpack_digit(packed[3]), _unpack_digit(packed[4]))
+
+
+def _optional_float(text: str) -> float | None:
+    text = text.strip()
+    return float(text) if text else None
+
+
+def _parse_asteroid(line: str) -> OrbitalElements:
+    """One MPCORB.DAT line (fixed columns, see the MPC "Export Format" page)."""
+    epoch = _packed_epoch_jd(line[20:25])
+    mean_anomaly = float(line[26:35])
+    e = float(line[70:79])
+    daily_motion = float(line[80:91])  # deg/day
+    a = float(line[92:103])
+    readable = line[166:194].strip() or line[0:7].strip()
+    return OrbitalElements(
+        designation=readable,
+        kind=TargetType.ASTEROID,
+        perihelion_au=a * (1.0 - e),
+        eccentricity=e,
+        inclination_deg=float(line[59:68]),
+        node_deg=float(line[48:57]),
+        peri_deg=float(line[37:46]),
+        perihelion_jd_tt=epoch - mean_anomaly / daily_motion,
+        abs_magnitude=_optional_float(line[8:13]),
+        slope=_optional_float(line[14:19]),
+    )
+
+
+def _parse_comet(line: str) -> OrbitalElements:
+    """One CometEls.txt line (fixed columns)."""
+    return OrbitalElements(
+        designation=line[102:158].strip(),
+        kind=TargetType.COMET,
+        perihelion_au=float(line[30:39]),
+        eccentricity=float(line[41:49]),
+        inclination_deg=float(line[71:79]),
+        node_deg=float(line[61:69]),
+        peri_deg=float(line[51:59]),
+        perihelion_jd_tt=_calendar_jd(int(line[14:18]), int(line[19:21]), float(line[22:29])),
+        abs_magnitude=_optional_float(line[91:95]),
+        slope=_optional_float(line[96:100]),
+    )
+
+
+def parse_mpc_elements(lines: Iterable[str]) -> list[OrbitalElements]:
+    """Parse MPCORB-style asteroid lines and CometEls-style comet lines (may be mixed).
+
+    Headers, blank lines and anything that doesn't parse are skipped.
+    """
+    out: list[OrbitalElements] = []
+    for raw in lines:
+        line = raw.rstrip("\n")
+        try:
+            if len(line) >= 103 and line[20] in "IJK" and line[21:25].isalnum():
+                out.append(_parse_asteroid(line))
+            elif len(line) >= 103 and line[14:18].isdigit() and line[4] in "CPDXIA":
+                out.append(_parse_comet(line))
+        except (ValueError, KeyError, ZeroDivisionError):
+            log.debug("skipping unparseable MPC line: %r", line[:40])
+    return out
+
+
+# ---- Two-body propagation ------------------------------------------------------------
+
+
+def _elliptic(q: np.ndarray, e: np.ndarray, dt: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    a = q / (1.0 - e)
+    mean = GAUSS_K * dt / a**1.5
+    # Wrap to [-pi, pi] without adding pi first: near-parabolic orbits have tiny M.
+    mean -= 2.0 * np.pi * np.round(mean / (2.0 * np.pi))
+    # Starting at +/-pi converges for any e (Newton from above the root on a convex arc).
+    ecc = np.where(e < 0.8, mean, np.pi * np.sign(mean))
+    for _ in range(_MAX_NEWTON):
+        step = (ecc - e * np.sin(ecc) - mean) / (1.0 - e * np.cos(ecc))
+        ecc -= step
+        if np.all(np.abs(step) < 1e-12):
+            break
+    return a * (np.cos(ecc) - e), q * np.sqrt((1.0 + e) / (1.0 - e)) * np.sin(ecc)
+
+
+def _hyperbolic(q: np.ndarray, e: np.ndarray, dt: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    a = q / (e - 1.0)
+    mean = GAUSS_K * dt / a**1.5
+    m_abs = np.abs(mean)
+    # Both are upper bounds on |H|, so Newton descends monotonically onto the root.
+    h = np.sign(mean) * np.minimum(np.cbrt(6.0 * m_abs), np.arcsinh(m_abs / (e - 1.0)))
+    for _ in range(_MAX_NEWTON):
+        step = (e * np.sinh(h) - h - mean) / (e * np.cosh(h) - 1.0)
+        h -= step
+        if np.all(np.abs(step) < 1e-12):
+            break
+    return a * (e - np.cosh(h)), q * np.sqrt((e + 1.0) / (e - 1.0)) * np.sinh(h)
+
+
+def _parabolic(q: np.ndarray, dt: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    # Barker's equation s^3 + 3s = W, s = tan(nu/2), solved in closed form.
+    w = 3.0 * GAUSS_K * dt / np.sqrt(2.0 * q**3)
+    w_abs = np.abs(w)
+    y = np.cbrt(w_abs / 2.0 + np.sqrt(w_abs**2 / 4.0 + 1.0))
+    s = np.sign(w) * (y - 1.0 / y)
+    return q * (1.0 - s**2), 2.0 * q * s
+
+
+def perifocal_position(
+    q: np.ndarray, e: np.ndarray, dt_days: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """(x, y) in AU in the orbital plane, x toward perihelion, ``dt_days`` after it.
+
+    Arguments broadcast against each other.
+    """
+    q, e, dt = np.broadcast_arrays(
+        np.asarray(q, dtype=np.float64),
+        np.asarray(e, dtype=np.float64),
+        np.asarray(dt_days, dtype=np.float64),
+    )
+    x = np.empty(dt.shape)
+    y = np.empty(dt.shape)
+    para = np.abs(e - 1.0) < PARABOLIC_TOLERANCE
+    ell = (e < 1.0) & ~para
+    hyp = (e > 1.0) & ~para
+    if ell.any():
+        x[ell], y[ell] = _elliptic(q[ell], e[ell], dt[ell])
+    if hyp.any():
+        x[hyp], y[hyp] = _hyperbolic(q[hyp], e[hyp], dt[hyp])
+    if para.any():
+        x[para], y[para] = _parabolic(q[para], dt[para])
+    return x, y
+
+
+def _orientation(
+    incl_deg: np.ndarray, node_deg: np.ndarray, peri_deg: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Perihelion (P) and in-plane normal (Q) unit vectors, equatorial J2000, shape (n, 3)."""
+    i, node, peri = np.radians(incl_deg), np.radians(node_deg), np.radians(peri_deg)
+    ci, si, cn, sn, cw, sw = (
+        np.cos(i),
+        np.sin(i),
+        np.cos(node),
+        np.sin(node),
+        np.cos(peri),
+        np.sin(peri),
+    )
+    p_ecl = np.stack([cw * cn - sw * sn * ci, cw * sn + sw * cn * ci, sw * si], axis=-1)
+    q_ecl = np.stack([-sw * cn - cw * sn * ci, -sw * sn + cw * cn * ci, cw * si], axis=-1)
+    eps = math.radians(OBLIQUITY_J2000_DEG)
+    rot = np.array(
+        [[1.0, 0.0, 0.0], [0.0, math.cos(eps), -math.sin(eps)], [0.0, math.sin(eps), math.cos(eps)]]
+    )
+    return p_ecl @ rot.T, q_ecl @ rot.T
+
+
+def _observer_heliocentric(unix: np.ndarray, site: Site) -> tuple[np.ndarray, np.ndarray]:
+    """(observer position in AU, shape (m, 3); Julian Date TT, shape (m,))."""
+    t = Time(unix, format="unix", scale="utc")
+    earth = get_body_barycentric("earth", t) - get_body_barycentric("sun", t)
+    offset, _ = site.to_earth_location().get_gcrs_posvel(t)
+    observer = (earth + offset).xyz.to(u.au).value.T
+    return np.atleast_2d(observer), np.atleast_1d(t.tt.jd)
+
+
+# ---- Columnar catalog ----------------------------------------------------------------
+
+
+class MinorBodyCatalog:
+    """Many orbits as parallel arrays; positions for all rows x all instants at once."""
+
+    def __init__(self, elements: Sequence[OrbitalElements]) -> None:
+        self.elements = tuple(elements)
+
+        def column(values: Iterable[float | None]) -> np.ndarray:
+            return np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+
+        self.q = column(el.perihelion_au for el in self.elements)
+        self.e = column(el.eccentricity for el in self.elements)
+        self.perihelion_jd = column(el.perihelion_jd_tt for el in self.elements)
+        self.abs_magnitude = column(el.abs_magnitude for el in self.elements)
+        self.slope = column(el.slope for el in self.elements)
+        self.is_comet = np.array([el.kind == TargetType.COMET for el in self.elements], dtype=bool)
+        self._p, self._q = _orientation(
+            column(el.inclination_deg for el in self.elements),
+            column(el.node_deg for el in self.elements),
+            column(el.peri_deg for el in self.elements),
+        )
+        self._keys: dict[str, int] = {}
+        for idx, el in enumerate(self.elements):
+            for key in (el.designation, el.name):
+                self._keys.setdefault(normalize_name(key), idx)
+
+    @classmethod
+    def load(cls, path: Path) -> MinorBodyCatalog:
+        with Path(path).open(encoding="utf-8", errors="replace") as fh:
+            return cls(parse_mpc_elements(fh))
+
+    def __len__(self) -> int:
+        return len(self.elements)
+
+    def find(self, name: str) -> int | None:
+        """Row index for a designation or short name ("(1) Ceres", "ceres", "1P/Halley")."""
+        return self._keys.get(normalize_name(name))
+
+    def merged(self, other: MinorBodyCatalog) -> MinorBodyCatalog:
+        return MinorBodyCatalog([*self.elements, *other.elements])
+
+    def _heliocentric(self, rows: np.ndarray, dt_days: np.ndarray) -> np.ndarray:
+        x, y = perifocal_position(self.q[rows, None], self.e[rows, None], dt_days)
+        return x[..., None] * self._p[rows, None, :] + y[..., None] * self._q[rows, None, :]
+
+    def geometry(
+        self, unix_seconds: np.ndarray, *, site: Site, rows: np.ndarray | None = None
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(topocentric vectors (n, m, 3) AU, sun distance r (n, m), observer distance (n, m)).
+
+        ``n`` is the number of selected rows (default: all), ``m`` the number of instants.
+        Positions are light-time corrected.
+        """
+        sel = np.arange(len(self)) if rows is None else np.atleast_1d(rows)
+        observer, jd_tt = _observer_heliocentric(np.atleast_1d(unix_seconds), site)
+        dt = jd_tt[None, :] - self.perihelion_jd[sel, None]
+        obj = self._heliocentric(sel, dt)
+        for _ in range(2):
+            light_days = np.linalg.norm(obj - observer[None], axis=-1) / C_AU_PER_DAY
+            obj = self._heliocentric(sel, dt - light_days)
+        delta = obj - observer[None]
+        return delta, np.linalg.norm(obj, axis=-1), np.linalg.norm(delta, axis=-1)
+
+    def radec(
+        self, times: np.ndarray | datetime, *, site: Site, rows: np.ndarray | None = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Topocentric RA/Dec in degrees, shape (n_rows, n_times)."""
+        delta, _, _ = self.geometry(to_unix_seconds(times), site=site, rows=rows)
+        return unit_vectors_to_radec(delta)
+
+    def magnitudes(
+        self, r_au: np.ndarray, delta_au: np.ndarray, rows: np.ndarray | None = None
+    ) -> np.ndarray:
+        """Rough visual magnitudes (asteroids without the phase term; NaN if H is unknown)."""
+        sel = np.arange(len(self)) if rows is None else np.atleast_1d(rows)
+        h = self.abs_magnitude[sel, None]
+        n = np.nan_to_num(self.slope[sel, None], nan=4.0)
+        comet = h + 5.0 * np.log10(delta_au) + 2.5 * n * np.log10(r_au)
+        asteroid = h + 5.0 * np.log10(r_au * delta_au)
+        return np.where(self.is_comet[sel, None], comet, asteroid)
+
+    def provider(self, name: str, *, site: Site) -> MinorBodyCoordinates:
+        """A ``CoordinateProvider`` for one object (for ``compute_windows``)."""
+        row = self.find(name)
+        if row is None:
+            raise KeyError(f"{name!r} is not in this minor-body catalog")
+        return MinorBodyCoordinates(self, row, site)
+
+    def target(self, name: str, *, when_utc: datetime, site: Site) -> Target:
+        row = self.find(name)
+        if row is None:
+            raise KeyError(f"{name!r} is not in this minor-body catalog")
+        el = self.elements[row]
+        delta, r, dist = self.geometry(to_unix_seconds(when_utc), site=site, rows=np.array([row]))
+        ra, dec = unit_vectors_to_radec(delta)
+        mag = float(self.magnitudes(r, dist, np.array([row]))[0, 0])
+        return Target(
+            id=el.designation,
+            display_name=el.name,
+            target_type=el.kind,
+            ra_deg=float(ra[0, 0]),
+            dec_deg=float(dec[0, 0]),
+            magnitude=None if math.isnan(mag) else round(mag, 1),
+            angular_size_arcmin=None,
+            tier=Tier.CHALLENGING,
+            best_months=tuple(range(1, 13)),
+            description=f"{el.kind.value} from local MPC elements (q={el.perihelion_au:.3f} AU)",
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class MinorBodyCoordinates:
+    """Moving-body ``CoordinateProvider`` for one row of a ``MinorBodyCatalog``."""
+
+    catalog: MinorBodyCatalog
+    row: int
+    site: Site
+
+    def radec_many(self, unix_seconds: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        ra, dec = self.catalog.radec(unix_seconds, site=self.site, rows=np.array([self.row]))
+        return ra[0], dec[0]
+
+
+# ---- Batch screening -----------------------------------------------------------------
+
+
+@dataclass(frozen=True, slots=True)
+class MinorBodyVisibility:
+    """Screening result for one object over a night."""
+
+    designation: str
+    visible_minutes: float
+    peak_altitude_deg: float
+    peak_time_utc: datetime
+    magnitude: float | None  # at the peak
+
+
+def screen_minor_bodies(
+    catalog: MinorBodyCatalog,
+    *,
+    site: Site,
+    start_utc: datetime,
+    end_utc: datetime,
+    step_minutes: int = 10,
+    min_altitude_deg: float = 20.0,
+    require_sun_below_deg: float = 6.0,
+    magnitude_limit: float | None = None,
+) -> list[MinorBodyVisibility]:
+    """Which objects are above ``min_altitude_deg`` in darkness, best first.
+
+    Positions for every object at every step come from one propagation and one
+    Alt/Az transform, so screening 1,000 objects over a night takes well under a second.
+    """
+    step = timedelta(minutes=step_minutes)
+    n_steps = int((end_utc - start_utc) // step) + 1
+    unix = to_unix_seconds(start_utc) + np.arange(n_steps) * step.total_seconds()
+    times = Time(unix, format="unix", scale="utc")
+    frame = AltAz(obstime=times, location=site.to_earth_location())
+    dark = get_sun(times).transform_to(frame).alt.to(u.deg).value < -require_sun_below_deg
+
+    delta, r, dist = catalog.geometry(unix, site=site)
+    ra, dec = unit_vectors_to_radec(delta)
+    coords = SkyCoord(ra=ra * u.deg, dec=dec * u.deg, frame="icrs")
+    # (n, m) coordinates broadcast against the (m,) obstime.
+    alt = coords.transform_to(frame).alt.to(u.deg).value
+    mags = catalog.magnitudes(r, dist)
+
+    ok = (alt >= min_altitude_deg) & dark[None, :]
+    if magnitude_limit is not None:
+        ok &= ~(mags > magnitude_limit)
+    masked_alt = np.where(ok, alt, -np.inf)
+    peak = np.argmax(masked_alt, axis=1)
+
+    results = []
+    for row in np.flatnonzero(ok.any(axis=1)):
+        j = int(peak[row])
+        mag = float(mags[row, j])
+        results.append(
+            MinorBodyVisibility(
+                designation=catalog.elements[row].designation,
+                visible_minutes=float(ok[row].sum() * step_minutes),
+                peak_altitude_deg=float(alt[row, j]),
+                peak_time_utc=start_utc + j * step,
+                magnitude=None if math.isnan(mag) else mag,
+            )
+        )
+    results.sort(key=lambda v: (-v.visible_minutes, -v.peak_altitude_deg))
+    return results
+
+
+# ---- Process-wide registry -----------------------------------------------------------
+
+
+_DEFAULT: MinorBodyCatalog | None = None
+_DEFAULT_LOCK = threading.Lock()
+
+
+def default_minor_bodies() -> MinorBodyCatalog:
+    """The shared catalog: ``settings.minor_body_elements_path`` plus anything registered."""
+    global _DEFAULT
+    with _DEFAULT_LOCK:
+        if _DEFAULT is None:
+            from auto_telescope.config.settings import get_settings
+
+            path = get_settings().minor_body_elements_path
+            _DEFAULT = MinorBodyCatalog.load(path) if path is not None else MinorBodyCatalog([])
+            log.info("loaded %d minor-body orbits", len(_DEFAULT))
+        return _DEFAULT
+
+
+def register_minor_bodies(elements: Iterable[OrbitalElements] | MinorBodyCatalog) -> None:
+    """Add orbits to the shared catalog (and so to ``resolve_target``)."""
+    global _DEFAULT
+    extra = elements if isinstance(elements, MinorBodyCatalog) else MinorBodyCatalog(list(elements))
+    default_minor_bodies()  # load the configured file first
+    with _DEFAULT_LOCK:
+        _DEFAULT = (_DEFAULT or MinorBodyCatalog([])).merged(extra)
+    clear_resolve_cache()
+
+
+def is_minor_body(name: str) -> bool:
+    return default_minor_bodies().find(name) is not None
+
+
+def lookup_minor_body(
+    name: str, *, when_utc: datetime | None = None, site: Site | None = None
+) -> Target:
+    """Target with RA/Dec at ``when_utc`` (default: now) for a registered comet/asteroid.
+
+    Raises:
+        KeyError: if ``name`` is not in the shared catalog.
+    """
+    when = when_utc or datetime.now(UTC)
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=UTC)
+    return default_minor_bodies().target(name, when_utc=when, site=site or MVHS_SITE)
@@ -0,0 +1,343 @@
+"""Normalized-name index for target search and operator-UI autocomplete.
+
+Exact lowercase matching misses most of what people actually type: "m 13",
+"Messier 13", "ngc6205", "andromeda". Every one of those used to fall through to a
+SIMBAD round trip. This index fixes that locally:
+
+* ``normalize_name`` canonicalizes spacing, punctuation and catalog prefixes
+  ("Messier 13" → "m13", "NGC 6205" → "ngc6205", "Caldwell 23" → "c23").
+* Prefix matches come from a sorted list of word-start keys searched with ``bisect``,
+  so "andro" finds "Andromeda Galaxy (M31)".
+* Fuzzy matches come from a trigram inverted index (over whole names and their
+  words) scored with the Dice coefficient, so "andromda" still lands on M31.
+
+Curated search over ~80 targets is well under a millisecond; ingested offline
+catalogs go through ``register_targets`` and share the same index.
+"""
+
+from __future__ import annotations
+
+import bisect
+import re
+import threading
+import unicodedata
+from collections import Counter
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from auto_telescope.catalog.targets import Target, TargetType, Tier
+
+# Long-form catalog names → the short prefix used in designations (before a number).
+_CATALOG_PREFIXES = {
+    "messier": "m",
+    "caldwell": "c",
+    "melotte": "mel",
+    "collinder": "cr",
+    "herschel": "h",
+}
+
+_SPLIT = re.compile(r"[^0-9a-z]+")
+# "ngc6205" → ("ngc", "6205") so the token stream looks like "ngc 6205".
+_PREFIX_NUMBER = re.compile(r"^([a-z]+)(\d+)$")
+
+# Fuzzy matches are only accepted by ``best_match`` when they clear this bar...
+FUZZY_ACCEPT_SCORE = 0.6
+# ...and beat the runner-up (a different target) by at least this much.
+FUZZY_ACCEPT_MARGIN = 0.1
+# Shorter word prefixes ("sa", "cat") are too ambiguous for ``best_match`` to accept.
+PREFIX_ACCEPT_LENGTH = 4
+_LATER_WORD_WEIGHT = 0.85
+
+
+def _tokens(name: str) -> list[str]:
+    folded = unicodedata.normalize("NFKD", name)
+    folded = "".join(c for c in folded if not unicodedata.combining(c)).lower()
+    out: list[str] = []
+    for tok in _SPLIT.split(folded):
+        if not tok:
+            continue
+        m = _PREFIX_NUMBER.match(tok)
+        out.extend(m.groups() if m else (tok,))
+    # Only a catalog number makes a designation: "Herschel 400" is "h400", but
+    # "Herschel's Garnet Star" keeps its "herschel".
+    return [
+        _CATALOG_PREFIXES.get(tok, tok) if i + 1 < len(out) and out[i + 1].isdigit() else tok
+        for i, tok in enumerate(out)
+    ]
+
+
+def normalize_name(name: str) -> str:
+    """Canonical compact key: lowercase, no spaces/punctuation, short catalog prefixes."""
+    return "".join(_tokens(name))
+
+
+def _trigrams(key: str) -> set[str]:
+    padded = f"  {key} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+@dataclass(frozen=True, slots=True)
+class NameMatch:
+    """One search hit."""
+
+    target: Target
+    matched_name: str  # the id / display name / alias that matched
+    kind: str  # "exact" | "prefix" | "fuzzy"
+    score: float  # 0..1, higher is better
+
+
+_KIND_RANK = {"exact": 0, "prefix": 1, "fuzzy": 2}
+
+
+@dataclass(frozen=True, slots=True)
+class _Tables:
+    """One generation of a ``NameIndex``; never changed once published."""
+
+    targets: list[Target]
+    names: list[tuple[str, str, int]]  # (normalized key, raw name, target idx)
+    exact: dict[str, list[int]]  # key → name entries
+    # sorted (word-start key, name entry, starts at the first word)
+    prefix: list[tuple[str, int, bool]]
+    # Fuzzy units are whole name keys plus their individual words, so a typo in one
+    # word of a long display name ("andromda") still scores well.
+    fuzzy_units: list[tuple[int, int, float]]  # (name entry, trigrams, weight)
+    trigrams: dict[str, list[int]]  # trigram → fuzzy units
+
+
+class NameIndex:
+    """Searchable index over target ids, display names and aliases. Thread-safe.
+
+    ``add`` builds the next generation of tables and swaps it in with one assignment,
+    so readers never take the lock and never see a half-added catalog.
+    """
+
+    def __init__(self, targets: Iterable[Target] = ()) -> None:
+        self._lock = threading.Lock()  # serializes add()
+        self._tables = _Tables([], [], {}, [], [], {})
+        self.add(targets)
+
+    def __len__(self) -> int:
+        return len(self._tables.targets)
+
+    def add(self, targets: Iterable[Target]) -> None:
+        """Index more targets (e.g. an ingested offline catalog)."""
+        with self._lock:
+            old = self._tables
+            all_targets, names = list(old.targets), list(old.names)
+            fuzzy_units = list(old.fuzzy_units)
+            new_exact: dict[str, list[int]] = {}
+            new_prefix: list[tuple[str, int, bool]] = []
+            new_trigrams: dict[str, list[int]] = {}
+            for target in targets:
+                t_idx = len(all_targets)
+                all_targets.append(target)
+                seen: set[str] = set()
+                for raw in (target.id, target.display_name, *target.aliases):
+                    tokens = _tokens(raw)
+                    key = "".join(tokens)
+                    if not key or key in seen:
+                        continue
+                    seen.add(key)
+                    n_idx = len(names)
+                    names.append((key, raw, t_idx))
+                    new_exact.setdefault(key, []).append(n_idx)
+                    for i in range(len(tokens)):
+                        new_prefix.append(("".join(tokens[i:]), n_idx, i == 0))
+                    units = {key: 1.0}
+                    for i, tok in enumerate(tokens):
+                        if len(tok) >= 3 and not tok.isdigit():
+                            # A typo in the leading word outranks one mid-name.
+                            units.setdefault(tok, 1.0 if i == 0 else _LATER_WORD_WEIGHT)
+                    for unit, weight in units.items():
+                        tris = _trigrams(unit)
+                        u_idx = len(fuzzy_units)
+                        fuzzy_units.append((n_idx, len(tris), weight))
+                        for tri in tris:
+                            new_trigrams.setdefault(tri, []).append(u_idx)
+            self._tables = _Tables(
+                targets=all_targets,
+                names=names,
+                exact=_extended(old.exact, new_exact),
+                prefix=sorted(old.prefix + new_prefix),
+                fuzzy_units=fuzzy_units,
+                trigrams=_extended(old.trigrams, new_trigrams),
+            )
+
+    def lookup(self, name: str) -> Target | None:
+        """Exact match on the normalized name, or ``None``."""
+        tables = self._tables
+        hits = tables.exact.get(normalize_name(name))
+        return tables.targets[tables.names[hits[0]][2]] if hits else None
+
+    def search(self, query: str, *, limit: int = 10) -> list[NameMatch]:
+        """Ranked exact, then prefix, then fuzzy matches; one hit per target."""
+        key = normalize_name(query)
+        if not key or limit <= 0:
+            return []
+
+        tables = self._tables
+        best: dict[int, NameMatch] = {}
+
+        def offer(n_idx: int, kind: str, score: float) -> None:
+            _, raw, t_idx = tables.names[n_idx]
+            current = best.get(t_idx)
+            cand = NameMatch(tables.targets[t_idx], raw, kind, score)
+            if current is None or _sort_key(cand) < _sort_key(current):
+                best[t_idx] = cand
+
+        for n_idx in tables.exact.get(key, ()):
+            offer(n_idx, "exact", 1.0)
+
+        start = bisect.bisect_left(tables.prefix, (key, -1, False))
+        for word_key, n_idx, at_start in tables.prefix[start:]:
+            if not word_key.startswith(key):
+                break
+            # Shorter completions rank higher ("m1" prefers "m13" over "m101"), and a
+            # match on the first word beats one mid-name.
+            score = len(key) / len(tables.names[n_idx][0])
+            offer(n_idx, "prefix", score if at_start else 0.5 * score)
+
+        query_tris = _trigrams(key)
+        common: Counter[int] = Counter()
+        for tri in query_tris:
+            common.update(tables.trigrams.get(tri, ()))
+        for u_idx, shared in common.items():
+            n_idx, n_tris, weight = tables.fuzzy_units[u_idx]
+            score = weight * 2.0 * shared / (len(query_tris) + n_tris)
+            if score >= 0.3:
+                offer(n_idx, "fuzzy", score)
+
+        return sorted(best.values(), key=_sort_key)[:limit]
+
+    def best_match(self, query: str) -> Target | None:
+        """Single confident match, or ``None`` if the query is ambiguous.
+
+        Stricter than ``search`` ranking, since a wrong answer here is slewed to:
+
+        * a prefix match must start the name and, unless it is a designation, be at
+          least ``PREFIX_ACCEPT_LENGTH`` characters ("andro" finds M31, "sa" nothing);
+        * a fuzzy match must line up word for word with the start of the name, each
+          word equal or a typo of it, with no query word left over: "whirlpol" finds
+          M51, but "Saturn Nebula" is not Saturn and "Andromeda II" is not M31;
+        * numbered designations never match fuzzily, and a prefix match may not split
+          a number: "M42" finds "M42_core", but "M10" does not find "M101".
+        """
+        hits = self.search(query, limit=3)
+        if not hits:
+            return None
+        top = hits[0]
+        if top.kind == "exact":
+            return top.target
+        rivals = [h for h in hits[1:] if h.kind == top.kind]
+        if rivals and top.score - rivals[0].score < FUZZY_ACCEPT_MARGIN:
+            return None
+
+        query_tokens = _tokens(query)
+        key = "".join(query_tokens)
+        has_digits = any(c.isdigit() for c in key)
+        if top.kind == "prefix":
+            name_key = normalize_name(top.matched_name)
+            if not name_key.startswith(key):
+                return None  # mid-name: "cygnus" in "Veil Nebula (Cygnus Loop)"
+            if has_digits:
+                if len(key) < len(name_key) and name_key[len(key)].isdigit():
+                    return None
+            elif len(key) < PREFIX_ACCEPT_LENGTH:
+                return None
+            return top.target
+        if has_digits or top.score < FUZZY_ACCEPT_SCORE:
+            return None
+        if not _leads_name(query_tokens, _tokens(top.matched_name)):
+            return None
+        return top.target
+
+
+def _leads_name(query_tokens: list[str], name_tokens: list[str]) -> bool:
+    """Whether the query words are the name's first words, allowing typos.
+
+    The last query word may also be the start of its name word ("whirlpool gal").
+    """
+    if len(query_tokens) > len(name_tokens):
+        return False
+    last = len(query_tokens) - 1
+    for i, (word, name_word) in enumerate(zip(query_tokens, name_tokens, strict=False)):
+        if word == name_word or (i == last and name_word.startswith(word)):
+            continue
+        if min(len(word), len(name_word)) < 3 or _dice(word, name_word) < FUZZY_ACCEPT_SCORE:
+            return False
+    return True
+
+
+def _extended(postings: dict[str, list[int]], more: dict[str, list[int]]) -> dict[str, list[int]]:
+    """``postings`` with ``more`` appended, leaving ``postings`` and its lists untouched."""
+    out = dict(postings)
+    for key, entries in more.items():
+        out[key] = [*out.get(key, ()), *entries]
+    return out
+
+
+def _dice(a: str, b: str) -> float:
+    ta, tb = _trigrams(a), _trigrams(b)
+    return 2.0 * len(ta & tb) / (len(ta) + len(tb))
+
+
+def _sort_key(m: NameMatch) -> tuple[int, float, int, str]:
+    return (_KIND_RANK[m.kind], -m.score, int(m.target.tier), m.target.id)
+
+
+# ---- Process-wide default index ------------------------------------------------------
+
+
+_DEFAULT: NameIndex | None = None
+_DEFAULT_LOCK = threading.Lock()
+
+
+def _solar_system_placeholders() -> list[Target]:
+    """Index entries for Sun/Moon/planets. Coordinates are placeholder zeros."""
+    from auto_telescope.catalog.solar_system import _ALIASES, SOLAR_SYSTEM_BODIES
+
+    out = []
+    for key, spec in SOLAR_SYSTEM_BODIES.items():
+        aliases = tuple(a for a, canonical in _ALIASES.items() if canonical == key)
+        out.append(
+            Target(
+                id=str(spec["id"]),
+                display_name=str(spec["display_name"]),
+                target_type=TargetType(spec["target_type"]),
+                ra_deg=0.0,
+                dec_deg=0.0,
+                magnitude=None,
+                angular_size_arcmin=None,
+                tier=Tier(spec["tier"]),
+                aliases=aliases,
+            )
+        )
+    return out
+
+
+def default_index() -> NameIndex:
+    """The shared index: solar system + curated catalog + anything registered."""
+    global _DEFAULT
+    with _DEFAULT_LOCK:
+        if _DEFAULT is None:
+            from auto_telescope.catalog.curated import CURATED_TARGETS
+
+            _DEFAULT = NameIndex([*_solar_system_placeholders(), *CURATED_TARGETS])
+        return _DEFAULT
+
+
+def register_targets(targets: Iterable[Target]) -> None:
+    """Add an ingested offline catalog to the shared index (and so to resolve_target)."""
+    from auto_telescope.catalog.resolve_cache import clear_resolve_cache
+
+    default_index().add(targets)
+    clear_resolve_cache()  # a fuzzy match may now land on a different target
+
+
+def search_targets(query: str, *, limit: int = 10) -> list[NameMatch]:
+    """Autocomplete / search across every locally known target.
+
+    Solar-system hits carry placeholder coordinates; pass ``match.target.id`` to
+    ``resolve_target`` for live ones.
+    """
+    return default_index().search(query, limit=limit)
@@ -0,0 +1,147 @@
+"""LRU memo for ``resolve_target`` / ``resolve_local``.
+
+The scheduler, the safety check and the UI often resolve the same name within one
+tick, and every call used to re-run the chain (a ``get_body`` for planets, possibly
+SIMBAD). Results are kept in a bounded LRU keyed by normalized name and site:
+
+* Fixed targets (catalog / SIMBAD) are keyed without a time.
+* Moving targets (Sun, Moon, planets, comets, asteroids) are keyed by a time bucket
+  (``settings.resolve_cache_bucket_seconds``, 60 s by default), so a cached position is
+  at most one bucket old — under an arcminute even for the Moon.
+
+Misses are never cached: SIMBAD may be down, or the name may be registered later.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import UTC, datetime
+
+from auto_telescope.catalog.targets import Target, TargetType
+from auto_telescope.config.settings import Settings, get_settings
+from auto_telescope.config.site import MVHS_SITE, Site
+
+MOVING_TYPES = frozenset(
+    {TargetType.SUN, TargetType.MOON, TargetType.PLANET, TargetType.ASTEROID, TargetType.COMET}
+)
+
+_Key = tuple[str, Site | None, int | None]
+
+
+@dataclass(frozen=True, slots=True)
+class ResolveCacheStats:
+    """Counters since the cache was created."""
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    max_size: int
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class ResolveCache:
+    """Thread-safe LRU of resolved targets. ``max_size=0`` disables caching."""
+
+    def __init__(self, *, max_size: int = 1024, bucket_seconds: float = 60.0) -> None:
+        if bucket_seconds <= 0:
+            raise ValueError("bucket_seconds must be positive")
+        self.max_size = max_size
+        self.bucket_seconds = bucket_seconds
+        self._entries: OrderedDict[_Key, Target] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @classmethod
+    def from_settings(cls, settings: Settings | None = None) -> ResolveCache:
+        s = settings or get_settings()
+        return cls(max_size=s.resolve_cache_size, bucket_seconds=s.resolve_cache_bucket_seconds)
+
+    def _keys(
+        self, name: str, when_utc: datetime | None, site: Site | None
+    ) -> tuple[_Key, _Key] | None:
+        """(fixed-target key, moving-target key), or None if the name can't be keyed."""
+        from auto_telescope.catalog.name_index import normalize_name
+
+        norm = normalize_name(name)
+        if not norm:
+            return None
+        when = when_utc or datetime.now(UTC)
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=UTC)
+        bucket = math.floor(when.timestamp() / self.bucket_seconds)
+        return (norm, None, None), (norm, site or MVHS_SITE, bucket)
+
+    def get(self, name: str, *, when_utc: datetime | None, site: Site | None) -> Target | None:
+        keys = self._keys(name, when_utc, site)
+        if keys is None or self.max_size <= 0:
+            return None  # not a lookup the cache could answer: no hit, no miss
+        with self._lock:
+            for key in keys:
+                target = self._entries.get(key)
+                if target is not None:
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return target
+            self._misses += 1
+            return None
+
+    def put(
+        self, name: str, target: Target, *, when_utc: datetime | None, site: Site | None
+    ) -> None:
+        keys = self._keys(name, when_utc, site)
+        if keys is None or self.max_size <= 0:
+            return
+        key = keys[1] if target.target_type in MOVING_TYPES else keys[0]
+        with self._lock:
+            self._entries[key] = target
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        """Drop every entry; the counters keep running."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> ResolveCacheStats:
+        with self._lock:
+            return ResolveCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._entries),
+                max_size=self.max_size,
+            )
+
+
+_DEFAULT: ResolveCache | None = None
+_DEFAULT_LOCK = threading.Lock()
+
+
+def default_resolve_cache() -> ResolveCache:
+    """The process-wide cache used by ``resolve_local`` / ``resolve_target``."""
+    global _DEFAULT
+    with _DEFAULT_LOCK:
+        if _DEFAULT is None:
+            _DEFAULT = ResolveCache.from_settings()
+        return _DEFAULT
+
+
+def resolve_cache_stats() -> ResolveCacheStats:
+    return default_resolve_cache().stats()
+
+
+def clear_resolve_cache() -> None:
+    """Forget every cached resolution (called when new targets are registered)."""
+    default_resolve_cache().clear()
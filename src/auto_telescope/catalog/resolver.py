@@ -0,0 +1,207 @@
+"""Non-blocking target resolver with a per-call latency budget.
+
+``resolve_target`` blocks for as long as SIMBAD takes, which stalls the scheduler and
+the operator UI whenever SIMBAD is slow or unreachable. ``TargetResolver`` splits
+resolution in two:
+
+  * Local sources (solar system, curated catalog) answer immediately.
+  * SIMBAD runs on a background worker. The caller waits at most ``budget_seconds``;
+    if the lookup hasn't finished by then it gets a ``PENDING`` resolution it can
+    ``wait()`` on later (or simply ask again on the next tick).
+
+Concurrent requests for the same name share one in-flight lookup, and successful
+lookups are remembered, so the second ask for "Bode's Galaxy" is a dictionary hit. A
+lookup still running after ``timeout_seconds`` is abandoned: the next ask for the name
+starts a new one rather than joining it.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass
+from datetime import datetime
+from enum import StrEnum
+
+from auto_telescope.catalog.simbad import lookup_simbad
+from auto_telescope.catalog.targets import Target, resolve_local
+from auto_telescope.config.settings import Settings, get_settings
+from auto_telescope.config.site import Site
+
+log = logging.getLogger(__name__)
+
+NetworkLookup = Callable[[str], Target | None]
+
+
+class TargetPendingError(LookupError):
+    """Raised when a target is still being resolved over the network."""
+
+
+class ResolutionStatus(StrEnum):
+    """Outcome of a budgeted resolution."""
+
+    RESOLVED = "resolved"
+    PENDING = "pending"  # network lookup still running; ask again or wait()
+    NOT_FOUND = "not_found"  # every source missed (or the lookup timed out)
+
+
+@dataclass(frozen=True, slots=True)
+class Resolution:
+    """Result of ``TargetResolver.resolve``."""
+
+    name: str
+    status: ResolutionStatus
+    target: Target | None = None
+    source: str = ""  # "local" or "simbad"
+    detail: str = ""
+    future: Future[Target | None] | None = None
+
+    def wait(self, timeout: float | None = None) -> Resolution:
+        """Block up to ``timeout`` seconds for a pending lookup; return the new resolution."""
+        if self.status != ResolutionStatus.PENDING or self.future is None:
+            return self
+        try:
+            target = self.future.result(timeout=timeout)
+        except FutureTimeoutError:
+            return self
+        except Exception as exc:
+            return Resolution(self.name, ResolutionStatus.NOT_FOUND, detail=str(exc))
+        return _from_lookup(self.name, target)
+
+    def require(self) -> Target:
+        """Return the target, or raise like ``resolve_target`` would.
+
+        Raises:
+            TargetPendingError: the network lookup hasn't finished yet.
+            KeyError: the name resolved to nothing.
+        """
+        if self.target is not None:
+            return self.target
+        if self.status == ResolutionStatus.PENDING:
+            raise TargetPendingError(f"target {self.name!r} is still being resolved")
+        raise KeyError(f"target {self.name!r} not found ({self.detail or 'no source matched'})")
+
+
+def _from_lookup(name: str, target: Target | None) -> Resolution:
+    if target is None:
+        return Resolution(name, ResolutionStatus.NOT_FOUND, detail="SIMBAD miss")
+    return Resolution(name, ResolutionStatus.RESOLVED, target=target, source="simbad")
+
+
+class TargetResolver:
+    """Resolve names locally within the budget; push SIMBAD onto a worker thread.
+
+    Thread-safe; one instance is meant to be shared by the scheduler and the UI.
+    """
+
+    def __init__(
+        self,
+        *,
+        lookup: NetworkLookup | None = None,
+        budget_seconds: float = 0.25,
+        timeout_seconds: float = 15.0,
+        max_workers: int = 2,
+    ) -> None:
+        self._lookup: NetworkLookup = lookup or (
+            lambda name: lookup_simbad(name, timeout_seconds=timeout_seconds)
+        )
+        self._budget = budget_seconds
+        self._timeout = timeout_seconds
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="target-resolver"
+        )
+        # Re-entrant: a lookup that finishes before add_done_callback returns runs
+        # _finish on the submitting thread, which already holds the lock.
+        self._lock = threading.RLock()
+        # key → (future, monotonic submit time)
+        self._inflight: dict[str, tuple[Future[Target | None], float]] = {}
+        # key → target from a finished network lookup
+        self._known: dict[str, Target] = {}
+
+    @classmethod
+    def from_settings(cls, settings: Settings | None = None) -> TargetResolver:
+        s = settings or get_settings()
+        return cls(
+            budget_seconds=s.resolver_budget_seconds,
+            timeout_seconds=s.simbad_timeout_seconds,
+        )
+
+    def resolve(
+        self,
+        name: str,
+        *,
+        when_utc: datetime | None = None,
+        site: Site | None = None,
+        budget_seconds: float | None = None,
+    ) -> Resolution:
+        """Resolve ``name``, waiting at most ``budget_seconds`` for the network."""
+        local = resolve_local(name, when_utc=when_utc, site=site)
+        if local is not None:
+            return Resolution(name, ResolutionStatus.RESOLVED, target=local, source="local")
+
+        key = name.strip().lower()
+        with self._lock:
+            if key in self._known:
+                return _from_lookup(name, self._known[key])
+            entry = self._inflight.get(key)
+            if entry is not None and time.monotonic() - entry[1] > self._timeout:
+                del self._inflight[key]  # hung past its timeout: retry, don't join it
+                entry = None
+            future, submitted = entry or self._submit(key, name)
+
+        budget = self._budget if budget_seconds is None else budget_seconds
+        try:
+            return _from_lookup(name, future.result(timeout=budget))
+        except FutureTimeoutError:
+            pass
+        except Exception as exc:
+            return Resolution(name, ResolutionStatus.NOT_FOUND, detail=str(exc))
+
+        if time.monotonic() - submitted > self._timeout:
+            return Resolution(
+                name,
+                ResolutionStatus.NOT_FOUND,
+                detail=f"SIMBAD lookup exceeded {self._timeout:.0f} s",
+            )
+        return Resolution(
+            name, ResolutionStatus.PENDING, detail="SIMBAD lookup running", future=future
+        )
+
+    def _submit(self, key: str, name: str) -> tuple[Future[Target | None], float]:
+        """Start a network lookup. Caller holds ``self._lock``."""
+        future = self._executor.submit(self._lookup, name)
+        entry = (future, time.monotonic())
+        self._inflight[key] = entry
+        future.add_done_callback(lambda f: self._finish(key, f))
+        return entry
+
+    def _finish(self, key: str, future: Future[Target | None]) -> None:
+        with self._lock:
+            entry = self._inflight.get(key)
+            if entry is not None and entry[0] is future:  # not a retry started since
+                del self._inflight[key]
+            if future.cancelled():
+                return
+            exc = future.exception()
+            if exc is not None:
+                log.warning("background lookup for %r failed: %s", key, exc)
+                return
+            # Only hits are remembered: lookup_simbad reports outages as misses too,
+            # and SIMBAD may be back on the next ask.
+            target = future.result()
+            if target is not None:
+                self._known[key] = target
+
+    def close(self) -> None:
+        """Stop accepting lookups; running ones are abandoned, not joined."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def __enter__(self) -> TargetResolver:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
@@ -3,13 +3,21 @@
 We isolate astroquery in this module so the rest of the codebase doesn't have to think
 about VOTable types. SIMBAD outages are non-fatal: ``lookup_simbad`` returns ``None``
 on failure and the resolver chain falls back / errors out at the call site.
+
+The configured ``Simbad`` client is kept per thread and timeout, so its ``requests``
+session (with our pooled, retrying adapter from ``config.http``) keeps the TLS
+connection alive between lookups. astroquery doesn't document its clients as
+thread-safe, so the resolver's workers never share one.
 """
 
 from __future__ import annotations
 
+import contextlib
 import logging
+import threading
 from typing import Any
 
+import requests
 from astropy import units as u
 from astropy.coordinates import SkyCoord
 
@@ -40,24 +48,64 @@ _OTYPE_TO_TARGET_TYPE: dict[str, TargetType] = {
 }
 
 
-def lookup_simbad(name: str) -> Target | None:
-    """Query SIMBAD by object name. Returns ``None`` on miss or on network failure."""
+# Per thread: timeout → configured Simbad client.
+_CLIENTS = threading.local()
+
+
+def _simbad_client(timeout_seconds: float | None) -> Any:
+    """This thread's client for ``timeout_seconds`` (created on first use)."""
+    clients: dict[float | None, Any] | None = getattr(_CLIENTS, "by_timeout", None)
+    if clients is None:
+        clients = _CLIENTS.by_timeout = {}
+    if timeout_seconds not in clients:
+        clients[timeout_seconds] = _new_simbad_client(timeout_seconds)
+    return clients[timeout_seconds]
+
+
+def _new_simbad_client(timeout_seconds: float | None) -> Any:
+    from astroquery.simbad import Simbad
+
+    from auto_telescope.config.http import configure_session
+    from auto_telescope.config.settings import get_settings
+
+    s = Simbad(timeout=timeout_seconds)
+    settings = get_settings()
+    # astroquery owns the session (and its User-Agent); we only swap in pooled adapters.
+    # It has no public handle on it, so go without them if the private one moves.
+    session = getattr(s, "_session", None)
+    if isinstance(session, requests.Session):
+        configure_session(
+            session,
+            pool_maxsize=settings.http_pool_maxsize,
+            retries=settings.http_retries,
+            backoff_seconds=settings.http_backoff_seconds,
+            max_wait_seconds=settings.http_max_retry_wait_seconds,
+        )
+    else:
+        log.warning("astroquery Simbad has no requests session; using its own adapters")
+    # Modern astroquery (>=0.4.8) uses 'V' for visual magnitude and 'otype' for
+    # object type. Older versions accepted 'flux(V)'. Try both for forward+back
+    # compat; ignore unsupported fields.
+    for f in ("V", "otype", "dimensions"):
+        with contextlib.suppress(Exception):
+            s.add_votable_fields(f)
+    return s
+
+
+def lookup_simbad(name: str, *, timeout_seconds: float | None = None) -> Target | None:
+    """Query SIMBAD by object name. Returns ``None`` on miss or on network failure.
+
+    ``timeout_seconds`` caps the server-side query duration (astroquery's default is
+    18 minutes). The call can still block on connect; see ``catalog.resolver``.
+    """
     try:
-        from astroquery.simbad import Simbad
-    except Exception as exc:  # pragma: no cover - astroquery import error path
-        log.warning("astroquery.simbad import failed: %s", exc)
+        # Construction can hit the network (TAP capabilities); failures aren't memoized.
+        s = _simbad_client(timeout_seconds)
+    except Exception as exc:
+        log.warning("SIMBAD client setup failed: %s", exc)
         return None
 
     try:
-        s = Simbad()
-        # Modern astroquery (>=0.4.8) uses 'V' for visual magnitude and 'otype' for
-        # object type. Older versions accepted 'flux(V)'. Try both for forward+back
-        # compat; ignore unsupported fields.
-        import contextlib
-
-        for f in ("V", "otype", "dimensions"):
-            with contextlib.suppress(Exception):
-                s.add_votable_fields(f)
         result = s.query_object(name)
     except Exception as exc:
         log.warning("SIMBAD query for %r failed: %s", name, exc)
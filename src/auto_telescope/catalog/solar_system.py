@@ -1,6 +1,8 @@
 """Solar system body lookups via astropy.coordinates.get_body.
 
-For Sun/Moon/planets we use the local builtin ephemeris (no network). For asteroids
+For Sun/Moon/planets we use the local builtin ephemeris (no network). Callers that need
+many positions should pass a precomputed ``catalog.ephemeris.SolarSystemEphemeris``,
+which answers in microseconds instead of a ``get_body`` call per request. For asteroids
 and comets the user can fall through to JPL Horizons via astroquery — that path is
 covered separately in catalog.simbad-style helpers, but for Phase 1A the planets and
 Moon are sufficient.
@@ -9,7 +11,7 @@ Moon are sufficient.
 from __future__ import annotations
 
 from datetime import UTC, datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from astropy import units as u
 from astropy.coordinates import EarthLocation, get_body, get_sun
@@ -18,6 +20,9 @@ from astropy.time import Time
 from auto_telescope.catalog.targets import Target, TargetType, Tier
 from auto_telescope.config.site import MVHS_SITE, Site
 
+if TYPE_CHECKING:
+    from auto_telescope.catalog.ephemeris import SolarSystemEphemeris
+
 # Canonical names → ID + display name + tier.
 SOLAR_SYSTEM_BODIES: dict[str, dict[str, Any]] = {
     "sun": {
@@ -109,6 +114,7 @@ def lookup_solar_system(
     *,
     when_utc: datetime | None = None,
     site: Site | None = None,
+    ephemeris: SolarSystemEphemeris | None = None,
 ) -> Target:
     """Return a Target for a solar-system body, with current RA/Dec at ``when_utc``.
 
@@ -116,6 +122,8 @@ def lookup_solar_system(
         name:    Body name (e.g. "Jupiter", "moon", case-insensitive).
         when_utc: Time to evaluate ephemeris at (default: now UTC).
         site:    Observing site for topocentric correction (default: MVHS).
+        ephemeris: Precomputed tables to use when they cover this site, body and
+                 instant; otherwise we fall back to ``get_body``.
     """
     key = _canonical(name)
     if key not in SOLAR_SYSTEM_BODIES:
@@ -127,13 +135,16 @@ def lookup_solar_system(
         when = when.replace(tzinfo=UTC)
     site = site or MVHS_SITE
 
-    location: EarthLocation = site.to_earth_location()
-    t = Time(when.astimezone(UTC))
+    if ephemeris is not None and ephemeris.site == site and ephemeris.covers(key, when):
+        ra_deg, dec_deg = ephemeris.radec_at(key, when)
+    else:
+        location: EarthLocation = site.to_earth_location()
+        t = Time(when.astimezone(UTC))
 
-    body = get_sun(t) if key == "sun" else get_body(key, t, location)
+        body = get_sun(t) if key == "sun" else get_body(key, t, location)
 
-    ra_deg = float(body.ra.to(u.deg).value) % 360.0
-    dec_deg = float(body.dec.to(u.deg).value)
+        ra_deg = float(body.ra.to(u.deg).value) % 360.0
+        dec_deg = float(body.dec.to(u.deg).value)
 
     return Target(
         id=str(spec["id"]),
@@ -7,8 +7,10 @@ recomputed at request time and the dataclass carries placeholder zeros.
 
 ``resolve_target(name)`` is the front door:
   1. Solar-system body? → solar_system.lookup_solar_system
+     (registered comets / asteroids → minor_bodies.lookup_minor_body)
   2. In curated list?    → curated.get_curated_target
-  3. Otherwise            → simbad.lookup_simbad (network)
+  3. Confident local name match (prefix / typo / offline catalog) → name_index
+  4. Otherwise            → simbad.lookup_simbad (network)
 """
 
 from __future__ import annotations
@@ -26,6 +28,8 @@ class TargetType(StrEnum):
 
     PLANET = "planet"
     MOON = "moon"
+    ASTEROID = "asteroid"
+    COMET = "comet"
     SUN = "sun"  # Never observed; included so safety can recognize it.
     GLOBULAR_CLUSTER = "globular_cluster"
     OPEN_CLUSTER = "open_cluster"
@@ -70,25 +74,36 @@ class Target:
         return EquatorialCoord(ra_deg=self.ra_deg % 360.0, dec_deg=self.dec_deg)
 
 
-def resolve_target(
+def resolve_local(
     name: str,
     *,
     when_utc: datetime | None = None,
     site: Site | None = None,
-) -> Target:
-    """Look up a target by name from any source.
+) -> Target | None:
+    """Resolve ``name`` from local sources only (never touches the network).
 
-    Resolution order:
-      1. Solar system body (fast, local — astropy ephemeris).
-      2. Curated catalog (fast, in-memory).
-      3. SIMBAD (network call).
-
-    Raises:
-        KeyError: if the name resolves to nothing in any source.
+    Results are memoized (see ``catalog.resolve_cache``). Returns ``None`` on a miss so
+    callers can decide whether to go to SIMBAD.
     """
+    from auto_telescope.catalog.resolve_cache import default_resolve_cache
+
+    cache = default_resolve_cache()
+    cached = cache.get(name, when_utc=when_utc, site=site)
+    if cached is not None:
+        return cached
+    target = _resolve_local_uncached(name, when_utc=when_utc, site=site)
+    if target is not None:
+        cache.put(name, target, when_utc=when_utc, site=site)
+    return target
+
+
+def _resolve_local_uncached(
+    name: str, *, when_utc: datetime | None, site: Site | None
+) -> Target | None:
     # Imports inside the function to avoid circular imports at module load time.
     from auto_telescope.catalog.curated import get_curated_target
-    from auto_telescope.catalog.simbad import lookup_simbad
+    from auto_telescope.catalog.minor_bodies import is_minor_body, lookup_minor_body
+    from auto_telescope.catalog.name_index import default_index
     from auto_telescope.catalog.solar_system import (
         is_solar_system_body,
         lookup_solar_system,
@@ -96,13 +111,54 @@ def resolve_target(
 
     if is_solar_system_body(name):
         return lookup_solar_system(name, when_utc=when_utc, site=site)
-
+    # Curated names win over an asteroid or comet of the same short name ("Albireo");
+    # the full designation still reaches the minor body.
     curated = get_curated_target(name)
     if curated is not None:
         return curated
+    if is_minor_body(name):
+        return lookup_minor_body(name, when_utc=when_utc, site=site)
+
+    match = default_index().best_match(name)
+    if match is not None and is_solar_system_body(match.id):
+        # Index entries for solar-system bodies carry placeholder coordinates.
+        return lookup_solar_system(match.id, when_utc=when_utc, site=site)
+    return match
+
+
+def resolve_target(
+    name: str,
+    *,
+    when_utc: datetime | None = None,
+    site: Site | None = None,
+) -> Target:
+    """Look up a target by name from any source.
+
+    Resolution order:
+      1. Solar system body (fast, local — astropy ephemeris).
+      2. Curated catalog (fast, in-memory).
+      3. Comet / asteroid from locally loaded MPC elements.
+      4. Confident prefix / fuzzy match in the local name index.
+      5. SIMBAD (network call).
+
+    Repeated calls within a tick are LRU-cache hits (moving bodies per time bucket).
+    This blocks for as long as SIMBAD takes. Latency-sensitive callers should use
+    ``catalog.resolver.TargetResolver`` instead.
+
+    Raises:
+        KeyError: if the name resolves to nothing in any source.
+    """
+    from auto_telescope.catalog.simbad import lookup_simbad
+
+    local = resolve_local(name, when_utc=when_utc, site=site)
+    if local is not None:
+        return local
 
     simbad = lookup_simbad(name)
     if simbad is not None:
+        from auto_telescope.catalog.resolve_cache import default_resolve_cache
+
+        default_resolve_cache().put(name, simbad, when_utc=when_utc, site=site)
         return simbad
 
     raise KeyError(f"target {name!r} not found in solar system, curated catalog, or SIMBAD")
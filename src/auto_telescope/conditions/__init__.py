@@ -21,12 +21,14 @@ from auto_telescope.conditions.aggregator import (
 from auto_telescope.conditions.cache import ConditionsCache
 from auto_telescope.conditions.nws import NWSProvider
 from auto_telescope.conditions.open_meteo import OpenMeteoProvider
+from auto_telescope.conditions.series import ForecastSeries
 from auto_telescope.conditions.seven_timer import SevenTimerProvider
 
 __all__ = [
     "AllProvidersDownError",
     "ConditionsAggregator",
     "ConditionsCache",
+    "ForecastSeries",
     "NWSProvider",
     "OpenMeteoProvider",
     "SevenTimerProvider",
@@ -1,7 +1,7 @@
 """Aggregator that reconciles three providers into a single forecast.
 
-Strategy:
-  * Bucket every provider's slots into clock hours (UTC).
+Strategy (see ``conditions.grid``):
+  * Put every provider's slots on one dense grid of clock hours (UTC).
   * For each hour, compute conservative consensus values:
       cloud_cover = max(provider_clouds)              # most pessimistic
       wind_speed  = max(provider_winds)
@@ -10,25 +10,119 @@ Strategy:
   * If 7Timer is down we still get cloud + wind. If two of the three are down,
     we still produce a forecast. If all three are down, raise AllProvidersDownError.
 
+With a ``ConditionsCache`` each provider's slots are cached with the HTTP validators and
+server freshness of the response they came from (see ``conditions.http_cache``), so a
+stale entry is refreshed with a conditional request and a 304 just extends it. When the
+server sends no freshness headers, the provider's ``expiry`` policy decides when new
+data is due (see ``conditions.expiry``).
+
+Stale-while-revalidate: an entry past its freshness but less than ``max_stale_seconds``
+beyond it is served immediately while a background worker refreshes it, so callers don't
+pay provider latency inline when the TTL lapses. Older entries are refetched inline.
+Every ``ConditionsForecast`` carries ``issued_utc`` (when its oldest contributing data
+was fetched or revalidated) so the safety layer can refuse on data that is too old;
+``max_data_age_seconds`` caps every entry's freshness a margin short of that age, and an
+entry already that old is refetched inline rather than served stale, so with the
+providers up callers never get data the safety layer would refuse.
+
+With a ``ForecastArchive`` every newly parsed provider payload and every new merged
+series is appended to it as well; archive errors are logged and never fail a fetch.
+
+The three providers are fetched concurrently on a small thread pool, so a fetch costs
+the slowest provider's round trips rather than the sum. An overall deadline bounds the
+wait: a provider that hasn't answered by then is treated exactly like one that failed.
+
+``fetch`` returns a list of ``ConditionsForecast``; ``fetch_series`` returns the same
+data as a ``ForecastSeries`` (O(1) hour lookup, slicing, interpolation). ``fetch_many``
+does several sites at once: Open-Meteo takes up to ``open_meteo_batch_size`` sites per
+request, 7Timer and NWS run concurrently with at most ``max_concurrency`` requests in
+flight per provider (on pools shared by every ``fetch_many`` caller), and all of it
+shares one deadline.
+
+One aggregator is meant to be shared by the scheduler, the safety loop and the UI.
+Concurrent fetches are coalesced (``conditions.singleflight``): callers asking for the
+same site while a fetch for it is running wait for that fetch and share its result or
+its ``AllProvidersDownError``, and a provider refresh already running for a site (say,
+in the background) is joined rather than repeated.
+
+Each provider sits behind a ``CircuitBreaker`` (see ``conditions.breaker``): after
+``breaker_failure_threshold`` failures in a row (a call slower than
+``latency_budget_seconds`` counts as one) it is skipped at once instead of waited on,
+and probed again after an exponentially growing cooldown.
+
+Every provider call is counted in the metrics sink (``conditions.metrics``) by outcome,
+next to the providers' own request latency, byte and parse-time figures; ``health()``
+summarizes them per provider with the breaker state and last error, and can probe each
+provider for a site first.
+
 The aggregator never silently degrades: every produced ForecastSlot records
-which providers contributed, so the safety layer can decide whether to slew.
+which providers contributed, so the safety layer can decide whether to slew, and
+``missing_providers`` says why each of the others is absent: "breaker-open",
+"breaker-half-open", "deadline" or "failed".
 """
 
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass, field
+import threading
+from collections.abc import Callable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field, replace
 from datetime import UTC, datetime, timedelta
-from typing import Any, Protocol
-
+from enum import StrEnum
+from typing import Protocol, TypeVar
+
+from auto_telescope.conditions.archive import ForecastArchive
+from auto_telescope.conditions.breaker import (
+    BreakerBatch,
+    BreakerOpenError,
+    BreakerState,
+    BreakerStatus,
+    CircuitBreaker,
+)
 from auto_telescope.conditions.cache import ConditionsCache
-from auto_telescope.conditions.nws import NWSProvider, NWSSlot
-from auto_telescope.conditions.open_meteo import OpenMeteoProvider, OpenMeteoSlot
-from auto_telescope.conditions.seven_timer import SevenTimerProvider, SevenTimerSlot
+from auto_telescope.conditions.expiry import REFRESH_MARGIN_SECONDS, ExpiryPolicy, fresh_until
+from auto_telescope.conditions.grid import merge_hourly
+from auto_telescope.conditions.http_cache import CachedForecast, ProviderResponse, Validators
+from auto_telescope.conditions.metrics import (
+    FETCH_SECONDS,
+    PROVIDER_CALLS,
+    HealthReport,
+    InMemoryMetrics,
+    MetricsSink,
+    default_metrics,
+    timed,
+)
+from auto_telescope.conditions.nws import NWSProvider
+from auto_telescope.conditions.open_meteo import OpenMeteoProvider
+from auto_telescope.conditions.series import ForecastSeries
+from auto_telescope.conditions.seven_timer import SevenTimerProvider
+from auto_telescope.conditions.singleflight import SingleFlight
+from auto_telescope.config.http import request_timeout
+from auto_telescope.config.settings import Settings, get_settings
 
 log = logging.getLogger(__name__)
 
 
+# (provider name, latitude, longitude)
+_SiteKey = tuple[str, float, float]
+T = TypeVar("T")
+
+
+class _Miss(StrEnum):
+    """Why a provider has nothing for a fetch, as reported in ``missing_providers``."""
+
+    FAILED = "failed"
+    DEADLINE = "deadline"
+    BREAKER_OPEN = "breaker-open"
+    BREAKER_HALF_OPEN = "breaker-half-open"
+
+
+# One provider's part of a fetch: its cached or fetched data, or why there is none.
+_Result = CachedForecast | _Miss
+_Breaker = CircuitBreaker | BreakerBatch
+
+
 class AllProvidersDownError(RuntimeError):
     """Raised when every provider failed; safety layer must NOT slew on this."""
 
@@ -46,14 +140,30 @@ class ConditionsForecast:
     temperature_c: float | None
     relative_humidity_pct: float | None
     contributing_providers: tuple[str, ...]
+    # When the oldest contributing provider data was fetched; None for hand-built forecasts.
+    issued_utc: datetime | None = None
+    # "<provider>:<reason>" for each provider that returned nothing for this fetch.
+    missing_providers: tuple[str, ...] = ()
+
+    def age_seconds(self, now: datetime | None = None) -> float | None:
+        """Seconds since ``issued_utc`` (None if unknown)."""
+        if self.issued_utc is None:
+            return None
+        return ((now or datetime.now(UTC)) - self.issued_utc).total_seconds()
 
 
 class _Provider(Protocol):
     name: str
+    expiry: ExpiryPolicy | None
 
     def fetch(self, latitude: float, longitude: float) -> list:  # pragma: no cover - Protocol
         ...
 
+    def fetch_conditional(
+        self, latitude: float, longitude: float, validators: Validators | None = None
+    ) -> ProviderResponse:  # pragma: no cover - Protocol
+        ...
+
 
 @dataclass(slots=True)
 class ConditionsAggregator:
@@ -63,131 +173,550 @@ class ConditionsAggregator:
     nws: NWSProvider = field(default_factory=NWSProvider)
     open_meteo: OpenMeteoProvider = field(default_factory=OpenMeteoProvider)
     cache: ConditionsCache | None = None
+    # Overall wall-clock budget for one fetch. NWS makes two sequential requests, so this
+    # should exceed twice the per-request timeout or NWS is cut off before it times out.
+    deadline_seconds: float = 25.0
+    # How long a cached entry (and its ETag / Last-Modified) is kept after it goes stale.
+    cache_retention_seconds: int = 24 * 3600
+    # Serve entries up to this far past their freshness while refreshing in the
+    # background. 0 disables stale-while-revalidate (stale entries are refetched inline).
+    max_stale_seconds: int = 0
+    # The safety layer refuses data older than this (``max_forecast_age_seconds``), so
+    # cached entries go stale early enough to be refreshed before then, and are never
+    # served stale past it. None: no cap.
+    max_data_age_seconds: float | None = None
+    archive: ForecastArchive | None = None
+    # fetch_many: requests in flight per provider, and sites per Open-Meteo request.
+    max_concurrency: int = 4
+    open_meteo_batch_size: int = 50
+    # Circuit breaker per provider: consecutive failures to open it, first and longest
+    # cooldown, and the call duration above which a success still counts as a failure.
+    breaker_failure_threshold: int = 3
+    breaker_cooldown_seconds: float = 60.0
+    breaker_max_cooldown_seconds: float = 1800.0
+    latency_budget_seconds: float | None = None
+    # Where provider call outcomes and fetch times go; the providers take their own sink.
+    metrics: MetricsSink = field(default_factory=default_metrics, repr=False, compare=False)
+    _breakers: dict[str, CircuitBreaker] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _refresh_pool: ThreadPoolExecutor | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # fetch_many workers per provider name, max_concurrency each.
+    _pools: dict[str, ThreadPoolExecutor] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _refreshing: set[str] = field(default_factory=set, init=False, repr=False, compare=False)
+    # provider name -> "<ExceptionType>: <message>" of its latest failure.
+    _last_errors: dict[str, str] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # Guards _refresh_pool, _pools, _refreshing, _breakers and _last_errors.
+    _refresh_lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
+    # In-flight merged fetches per site, and provider fetches per cache key.
+    _site_flights: SingleFlight[ForecastSeries] = field(
+        default_factory=SingleFlight, init=False, repr=False, compare=False
+    )
+    _provider_flights: SingleFlight[_Result] = field(
+        default_factory=SingleFlight, init=False, repr=False, compare=False
+    )
+
+    @classmethod
+    def from_settings(
+        cls,
+        settings: Settings | None = None,
+        *,
+        cache: ConditionsCache | None = None,
+        metrics: MetricsSink | None = None,
+    ) -> ConditionsAggregator:
+        s = settings or get_settings()
+        timeout, agent = request_timeout(s), s.api_user_agent
+        archive_dir = s.conditions_archive_dir
+        sink = metrics if metrics is not None else default_metrics()
+        return cls(
+            seven_timer=SevenTimerProvider(timeout_seconds=timeout, user_agent=agent, metrics=sink),
+            # The NWS gridpoint lookup is persisted in the same store as the forecasts.
+            nws=NWSProvider(
+                timeout_seconds=timeout, user_agent=agent, points_cache=cache, metrics=sink
+            ),
+            open_meteo=OpenMeteoProvider(timeout_seconds=timeout, user_agent=agent, metrics=sink),
+            cache=cache,
+            deadline_seconds=s.conditions_deadline_seconds,
+            cache_retention_seconds=s.cache_retention_seconds,
+            max_stale_seconds=s.cache_max_stale_seconds,
+            max_data_age_seconds=s.max_forecast_age_seconds,
+            archive=(
+                ForecastArchive(archive_dir, retention_days=s.conditions_archive_retention_days)
+                if archive_dir is not None
+                else None
+            ),
+            max_concurrency=s.conditions_max_concurrency,
+            open_meteo_batch_size=s.open_meteo_batch_size,
+            breaker_failure_threshold=s.breaker_failure_threshold,
+            breaker_cooldown_seconds=s.breaker_cooldown_seconds,
+            breaker_max_cooldown_seconds=s.breaker_max_cooldown_seconds,
+            latency_budget_seconds=s.provider_latency_budget_seconds,
+            metrics=sink,
+        )
 
     def fetch(self, latitude: float, longitude: float) -> list[ConditionsForecast]:
         """Fetch from all three providers and return the merged hourly forecast."""
-        seven_slots = self._safe_fetch(self.seven_timer, latitude, longitude)
-        nws_slots = self._safe_fetch(self.nws, latitude, longitude)
-        meteo_slots = self._safe_fetch(self.open_meteo, latitude, longitude)
+        return self.fetch_series(latitude, longitude).forecasts()
+
+    def fetch_series(self, latitude: float, longitude: float) -> ForecastSeries:
+        """Like ``fetch``, as an hour-indexed ``ForecastSeries``."""
+        return self._site_flights.do(
+            f"{latitude:.4f},{longitude:.4f}", lambda: self._fetch_series(latitude, longitude)
+        )
+
+    def fetch_many(
+        self, sites: Sequence[tuple[float, float]]
+    ) -> dict[tuple[float, float], ForecastSeries | AllProvidersDownError]:
+        """Merged forecasts for several (latitude, longitude) sites, keyed by site.
+
+        Costs about one ``fetch_series`` of wall time rather than one per site. A site
+        that every provider failed for maps to its ``AllProvidersDownError`` instead of
+        failing the whole call. Concurrent calls share the per-provider workers, so
+        ``max_concurrency`` bounds the requests in flight across all of them.
+        """
+        unique = list(dict.fromkeys(sites))
+        providers: tuple[_Provider, ...] = (self.seven_timer, self.nws, self.open_meteo)
+        # However many sites fail, this call counts as one failure per provider breaker.
+        batches = {p.name: self.breaker(p.name).batch() for p in providers}
+        pools = {p.name: self._pool(p.name) for p in providers}
+        results: dict[_SiteKey, _Result] = {}
+        # Each future yields one result per key listed with it.
+        pending: list[tuple[Future[list[_Result]], list[_SiteKey]]] = []
+        try:
+            for provider in (self.seven_timer, self.nws):
+                batch = batches[provider.name]
+                for lat, lon in unique:
+                    future = pools[provider.name].submit(
+                        self._safe_fetch_list, provider, lat, lon, batch
+                    )
+                    pending.append((future, [(provider.name, lat, lon)]))
+            meteo = self.open_meteo
+            to_batch: list[tuple[float, float]] = []
+            for lat, lon in unique:
+                cache_key = self._cache_key(meteo, lat, lon)
+                entry, usable = self._cached(meteo, lat, lon, cache_key)
+                if entry is not None and usable:
+                    results[meteo.name, lat, lon] = entry
+                else:
+                    to_batch.append((lat, lon))
+            for start in range(0, len(to_batch), self.open_meteo_batch_size):
+                chunk = to_batch[start : start + self.open_meteo_batch_size]
+                future = pools[meteo.name].submit(
+                    self._fetch_meteo_batch, chunk, batches[meteo.name]
+                )
+                pending.append((future, [(meteo.name, lat, lon) for lat, lon in chunk]))
+            done, _ = wait([f for f, _ in pending], timeout=self.deadline_seconds)
+        finally:
+            # Drop work still queued behind the deadline; running requests are bounded by
+            # their own timeouts and their results are discarded.
+            for future, _ in pending:
+                future.cancel()
+
+        for future, keys in pending:
+            if future in done:
+                results.update(zip(keys, future.result(), strict=True))  # never raises
+            else:
+                log.warning(
+                    "provider %s missed the %.1fs deadline", keys[0][0], self.deadline_seconds
+                )
+                results.update((key, _Miss.DEADLINE) for key in keys)
+
+        merged: dict[tuple[float, float], ForecastSeries | AllProvidersDownError] = {}
+        for lat, lon in unique:
+            try:
+                merged[lat, lon] = self._merge(
+                    lat, lon, [results[p.name, lat, lon] for p in providers]
+                )
+            except AllProvidersDownError as exc:
+                merged[lat, lon] = exc
+        return merged
+
+    def breaker(self, provider_name: str) -> CircuitBreaker:
+        """The circuit breaker guarding ``provider_name`` (created on first use)."""
+        with self._refresh_lock:
+            breaker = self._breakers.get(provider_name)
+            if breaker is None:
+                breaker = self._breakers[provider_name] = CircuitBreaker(
+                    provider_name,
+                    failure_threshold=self.breaker_failure_threshold,
+                    cooldown_seconds=self.breaker_cooldown_seconds,
+                    max_cooldown_seconds=self.breaker_max_cooldown_seconds,
+                    latency_budget_seconds=self.latency_budget_seconds,
+                )
+            return breaker
+
+    def breaker_status(self) -> dict[str, BreakerStatus]:
+        """Each provider's breaker state, for health checks and the UI."""
+        providers: tuple[_Provider, ...] = (self.seven_timer, self.nws, self.open_meteo)
+        return {p.name: self.breaker(p.name).status() for p in providers}
+
+    def health(self, probe_site: tuple[float, float] | None = None) -> HealthReport:
+        """Per-provider call counts, latency, bytes, parse time, breaker state, last error.
+
+        Built from the in-memory metrics sink, so it covers everything since it was last
+        reset. With ``probe_site`` (latitude, longitude), each provider is first asked
+        for that site directly, bypassing the cache and the breakers, so the report
+        shows how the providers answer right now.
+        """
+        if not isinstance(self.metrics, InMemoryMetrics):
+            raise TypeError("health() needs the in-memory metrics sink")
+        providers: tuple[_Provider, ...] = (self.seven_timer, self.nws, self.open_meteo)
+        if probe_site is not None:
+            lat, lon = probe_site
+            with ThreadPoolExecutor(len(providers), thread_name_prefix="conditions-probe") as pool:
+                list(pool.map(lambda p: self._probe(p, lat, lon), providers))
+        report = self.metrics.summary(tuple(p.name for p in providers))
+        breakers = self.breaker_status()
+        with self._refresh_lock:
+            last_errors = dict(self._last_errors)
+        return replace(
+            report,
+            providers=tuple(
+                replace(
+                    h,
+                    breaker=str(breakers[h.provider].state),
+                    last_error=last_errors.get(h.provider, ""),
+                )
+                for h in report.providers
+            ),
+        )
 
+    def _probe(self, provider: _Provider, lat: float, lon: float) -> None:
+        try:
+            provider.fetch(lat, lon)
+        except Exception as exc:
+            self._record(provider, "error", exc)
+        else:
+            self._record(provider, "ok")
+
+    def _fetch_series(self, latitude: float, longitude: float) -> ForecastSeries:
+        with timed(self.metrics, FETCH_SECONDS):
+            results = self._fetch_all(latitude, longitude)
+        return self._merge(latitude, longitude, results)
+
+    def _merge(self, latitude: float, longitude: float, results: list[_Result]) -> ForecastSeries:
+        """Merge one site's (7Timer, NWS, Open-Meteo) results; archive the series."""
+        fetched = [r if isinstance(r, CachedForecast) and r.slots else None for r in results]
+        seven_slots, nws_slots, meteo_slots = (r.slots if r else [] for r in fetched)
+        providers: tuple[_Provider, ...] = (self.seven_timer, self.nws, self.open_meteo)
+        missing = tuple(
+            # A provider that answered with no slots is as good as failed.
+            f"{p.name}:{r if isinstance(r, _Miss) else _Miss.FAILED}"
+            for p, r, data in zip(providers, results, fetched, strict=True)
+            if data is None
+        )
         if not (seven_slots or nws_slots or meteo_slots):
             raise AllProvidersDownError(
-                "All three weather providers (7Timer, NOAA, Open-Meteo) failed."
+                "All three weather providers (7Timer, NOAA, Open-Meteo) failed: "
+                + ", ".join(missing)
             )
-
-        # Buckets keyed by top-of-hour UTC datetime.
-        buckets: dict[datetime, dict[str, Any]] = {}
-
-        if seven_slots:
-            for s in seven_slots:
-                _expand_seven_timer(buckets, s)
-        if nws_slots:
-            for s in nws_slots:
-                _absorb_nws(buckets, s)
-        if meteo_slots:
-            for s in meteo_slots:
-                _absorb_meteo(buckets, s)
-
-        forecasts = sorted(
-            (_finalize(b) for b in buckets.values()),
-            key=lambda f: f.hour_utc,
+        issued = min(r.fetched_at for r in fetched if r)
+        series = ForecastSeries(
+            merge_hourly(
+                seven_slots,
+                nws_slots,
+                meteo_slots,
+                issued_utc=issued,
+                missing_providers=missing,
+            )
+        )
+        if self.archive is not None:
+            try:
+                self.archive.append_forecasts(latitude, longitude, series.forecasts())
+            except Exception as exc:
+                log.warning("archiving merged forecast failed: %s", exc)
+        return series
+
+    def close(self) -> None:
+        """Stop the background refresh and ``fetch_many`` workers (waits for running work)."""
+        with self._refresh_lock:
+            pool, self._refresh_pool = self._refresh_pool, None
+            pools, self._pools = list(self._pools.values()), {}
+        if pool is not None:
+            pool.shutdown(wait=True)
+        for fetch_pool in pools:
+            fetch_pool.shutdown(wait=True)
+
+    def _pool(self, provider_name: str) -> ThreadPoolExecutor:
+        """The ``fetch_many`` workers for ``provider_name`` (created on first use)."""
+        with self._refresh_lock:
+            pool = self._pools.get(provider_name)
+            if pool is None:
+                pool = self._pools[provider_name] = ThreadPoolExecutor(
+                    max_workers=self.max_concurrency,
+                    thread_name_prefix=f"conditions-{provider_name}",
+                )
+            return pool
+
+    def _fetch_all(self, lat: float, lon: float) -> list[_Result]:
+        """Run the three ``_safe_fetch`` calls concurrently under ``deadline_seconds``."""
+        providers: tuple[_Provider, ...] = (self.seven_timer, self.nws, self.open_meteo)
+        pool = ThreadPoolExecutor(max_workers=len(providers), thread_name_prefix="conditions")
+        try:
+            futures = [pool.submit(self._safe_fetch, p, lat, lon) for p in providers]
+            done, _ = wait(futures, timeout=self.deadline_seconds)
+        finally:
+            # Don't join stragglers: each is bounded by its own request timeout and its
+            # result is discarded.
+            pool.shutdown(wait=False, cancel_futures=True)
+
+        results: list[_Result] = []
+        for provider, future in zip(providers, futures, strict=True):
+            if future in done:
+                results.append(future.result())  # _safe_fetch never raises
+            else:
+                log.warning(
+                    "provider %s missed the %.1fs deadline", provider.name, self.deadline_seconds
+                )
+                results.append(_Miss.DEADLINE)
+        return results
+
+    def _safe_fetch(
+        self, provider: _Provider, lat: float, lon: float, breaker: _Breaker | None = None
+    ) -> _Result:
+        """One provider's slots (cached or fetched), or why there are none.
+
+        ``breaker`` stands in for the provider's own (a ``fetch_many`` batch).
+        """
+        cache_key = self._cache_key(provider, lat, lon)
+        if self.cache is None:
+            return self._provider_flights.do(
+                cache_key, lambda: self._fetch_uncached(provider, lat, lon, breaker)
+            )
+        entry, usable = self._cached(provider, lat, lon, cache_key)
+        if entry is not None and usable:
+            return entry
+        return self._refresh(provider, lat, lon, cache_key, entry, breaker)
+
+    def _safe_fetch_list(
+        self, provider: _Provider, lat: float, lon: float, breaker: _Breaker | None = None
+    ) -> list[_Result]:
+        return [self._safe_fetch(provider, lat, lon, breaker)]
+
+    @staticmethod
+    def _cache_key(provider: _Provider, lat: float, lon: float) -> str:
+        return f"{provider.name}:{lat:.4f},{lon:.4f}"
+
+    def _cached(
+        self, provider: _Provider, lat: float, lon: float, cache_key: str
+    ) -> tuple[CachedForecast | None, bool]:
+        """The cache entry for ``cache_key``, and whether it can be served as it is.
+
+        A stale entry still within ``max_stale_seconds`` (and younger than
+        ``max_data_age_seconds``) can; its refresh is started in the background.
+        """
+        if self.cache is None:
+            return None, False
+        cached = self.cache.get(cache_key)
+        entry = cached if isinstance(cached, CachedForecast) else None
+        if entry is None:
+            return None, False
+        now = datetime.now(UTC)
+        if entry.is_fresh(now):
+            return entry, True
+        limit = self.max_data_age_seconds
+        young = limit is None or now - entry.fetched_at < timedelta(seconds=limit)
+        if young and now - entry.fresh_until < timedelta(seconds=self.max_stale_seconds):
+            self._refresh_in_background(provider, lat, lon, cache_key, entry)
+            return entry, True
+        return entry, False
+
+    def _fetch_meteo_batch(
+        self, sites: list[tuple[float, float]], breaker: _Breaker | None = None
+    ) -> list[_Result]:
+        """Open-Meteo for several sites in one request; one miss for all if it fails.
+
+        Sites already being fetched (a single-site refresh, another batch) are joined;
+        the rest are held in ``_provider_flights`` until their results are stored.
+        """
+        meteo = self.open_meteo
+        site_of = {self._cache_key(meteo, lat, lon): (lat, lon) for lat, lon in sites}
+        return self._provider_flights.do_many(
+            list(site_of),
+            lambda keys: self._fetch_meteo_now([site_of[k] for k in keys], breaker),
         )
-        return forecasts
 
-    def _safe_fetch(self, provider: _Provider, lat: float, lon: float) -> list:
-        cache_key = f"{provider.name}:{lat:.4f},{lon:.4f}"
-        if self.cache is not None:
+    def _fetch_meteo_now(
+        self, sites: list[tuple[float, float]], breaker: _Breaker | None
+    ) -> list[_Result]:
+        meteo = self.open_meteo
+        if len(sites) == 1:
+            lat, lon = sites[0]
+            if self.cache is None:
+                return [self._fetch_uncached(meteo, lat, lon, breaker)]
+            cache_key = self._cache_key(meteo, lat, lon)
             cached = self.cache.get(cache_key)
-            if cached is not None:
-                return cached
+            entry = cached if isinstance(cached, CachedForecast) else None
+            return [self._refresh_now(meteo, lat, lon, cache_key, entry, breaker)]
+        responses = self._attempt(meteo, lambda: meteo.fetch_batch(sites), breaker)
+        if isinstance(responses, _Miss):
+            return [responses] * len(sites)
+        return [
+            self._store(meteo, lat, lon, self._cache_key(meteo, lat, lon), response)
+            for (lat, lon), response in zip(sites, responses, strict=True)
+        ]
+
+    def _fetch_uncached(
+        self, provider: _Provider, lat: float, lon: float, breaker: _Breaker | None
+    ) -> _Result:
+        slots = self._attempt(provider, lambda: provider.fetch(lat, lon), breaker)
+        if isinstance(slots, _Miss):
+            return slots
+        fetched = CachedForecast(slots=slots)
+        self._archive_payload(provider, lat, lon, fetched)
+        return fetched
+
+    def _attempt(
+        self, provider: _Provider, call: Callable[[], T], breaker: _Breaker | None = None
+    ) -> T | _Miss:
+        """``call()`` through the provider's breaker (or ``breaker``); why not, if not."""
         try:
-            data = provider.fetch(lat, lon)
+            result = (breaker or self.breaker(provider.name)).call(call)
+        except BreakerOpenError as exc:
+            log.debug("skipping provider: %s", exc)
+            self._record(provider, "skipped")
+            if self.breaker(provider.name).state is BreakerState.HALF_OPEN:
+                return _Miss.BREAKER_HALF_OPEN  # another call holds the probe
+            return _Miss.BREAKER_OPEN
         except Exception as exc:
             log.warning("provider %s failed: %s", provider.name, exc)
-            return []
-        if self.cache is not None and data:
-            self.cache.set(cache_key, data)
-        return data
-
-
-def _hour_floor(dt: datetime) -> datetime:
-    dt = dt.replace(tzinfo=UTC) if dt.tzinfo is None else dt.astimezone(UTC)
-    return dt.replace(minute=0, second=0, microsecond=0)
-
-
-def _expand_seven_timer(buckets: dict[datetime, dict[str, Any]], slot: SevenTimerSlot) -> None:
-    """7Timer reports every 3 hours; we replicate the values across each of those 3 hours."""
-    base = _hour_floor(slot.timestamp_utc)
-    for offset in range(3):
-        hr = base + timedelta(hours=offset)
-        b = buckets.setdefault(hr, _empty_bucket(hr))
-        _bump_max(b, "cloud_cover_pct", slot.cloud_cover_pct)
-        _bump_max(b, "wind_speed_mps", slot.wind10m_mps)
-        b["seeing_arcsec"] = slot.seeing_arcsec
-        b["transparency_mag"] = slot.transparency_mag
-        if b.get("temperature_c") is None:
-            b["temperature_c"] = slot.temperature_c
-        if b.get("relative_humidity_pct") is None:
-            b["relative_humidity_pct"] = slot.relative_humidity_pct
-        _add_provider(b, "7timer")
-
-
-def _absorb_nws(buckets: dict[datetime, dict[str, Any]], slot: NWSSlot) -> None:
-    hr = _hour_floor(slot.start_utc)
-    b = buckets.setdefault(hr, _empty_bucket(hr))
-    if slot.cloud_cover_pct is not None:
-        _bump_max(b, "cloud_cover_pct", slot.cloud_cover_pct)
-    _bump_max(b, "wind_speed_mps", slot.wind_speed_mps)
-    if b.get("temperature_c") is None:
-        b["temperature_c"] = slot.temperature_c
-    _add_provider(b, "nws")
-
-
-def _absorb_meteo(buckets: dict[datetime, dict[str, Any]], slot: OpenMeteoSlot) -> None:
-    hr = _hour_floor(slot.timestamp_utc)
-    b = buckets.setdefault(hr, _empty_bucket(hr))
-    _bump_max(b, "cloud_cover_pct", slot.cloud_cover_pct)
-    _bump_max(b, "wind_speed_mps", slot.wind_speed_mps)
-    b["visibility_m"] = slot.visibility_m
-    _add_provider(b, "open-meteo")
-
-
-def _empty_bucket(hr: datetime) -> dict[str, Any]:
-    return {
-        "hour_utc": hr,
-        "cloud_cover_pct": 0.0,
-        "wind_speed_mps": 0.0,
-        "seeing_arcsec": None,
-        "transparency_mag": None,
-        "visibility_m": None,
-        "temperature_c": None,
-        "relative_humidity_pct": None,
-        "providers": set(),
-    }
-
-
-def _bump_max(bucket: dict[str, Any], key: str, value: float) -> None:
-    current = bucket.get(key)
-    if current is None or value > current:
-        bucket[key] = value
-
-
-def _add_provider(bucket: dict[str, Any], name: str) -> None:
-    bucket["providers"].add(name)
-
-
-def _finalize(bucket: dict[str, Any]) -> ConditionsForecast:
-    return ConditionsForecast(
-        hour_utc=bucket["hour_utc"],
-        cloud_cover_pct=float(bucket["cloud_cover_pct"]),
-        wind_speed_mps=float(bucket["wind_speed_mps"]),
-        seeing_arcsec=bucket["seeing_arcsec"],
-        transparency_mag=bucket["transparency_mag"],
-        visibility_m=bucket["visibility_m"],
-        temperature_c=bucket["temperature_c"],
-        relative_humidity_pct=bucket["relative_humidity_pct"],
-        contributing_providers=tuple(sorted(bucket["providers"])),
-    )
+            self._record(provider, "error", exc)
+            return _Miss.FAILED
+        not_modified = isinstance(result, ProviderResponse) and result.not_modified
+        self._record(provider, "not_modified" if not_modified else "ok")
+        return result
+
+    def _record(self, provider: _Provider, outcome: str, exc: Exception | None = None) -> None:
+        self.metrics.increment(PROVIDER_CALLS, provider=provider.name, outcome=outcome)
+        if exc is not None:
+            with self._refresh_lock:
+                self._last_errors[provider.name] = f"{type(exc).__name__}: {exc}"
+
+    def _refresh(
+        self,
+        provider: _Provider,
+        lat: float,
+        lon: float,
+        cache_key: str,
+        entry: CachedForecast | None,
+        breaker: _Breaker | None = None,
+    ) -> _Result:
+        """Conditional fetch for ``cache_key``; stores and returns the new entry.
+
+        Joins a refresh of ``cache_key`` that is already running instead of starting one.
+        """
+        return self._provider_flights.do(
+            cache_key, lambda: self._refresh_now(provider, lat, lon, cache_key, entry, breaker)
+        )
+
+    def _refresh_now(
+        self,
+        provider: _Provider,
+        lat: float,
+        lon: float,
+        cache_key: str,
+        entry: CachedForecast | None,
+        breaker: _Breaker | None,
+    ) -> _Result:
+        assert self.cache is not None
+        validators = entry.validators if entry is not None else None
+        response = self._attempt(
+            provider, lambda: provider.fetch_conditional(lat, lon, validators), breaker
+        )
+        if isinstance(response, _Miss):
+            return response
+
+        if response.not_modified and entry is not None:
+            until = self._fresh_until(provider, response, entry.model_run_utc)
+            entry = entry.revalidated(response, fresh_until=until)
+        elif response.slots:
+            return self._store(provider, lat, lon, cache_key, response)
+        else:
+            return _Miss.FAILED
+        # Keep the entry past its freshness so its validators can still earn a 304.
+        self.cache.set(cache_key, entry, ttl_seconds=self.cache_retention_seconds)
+        return entry
+
+    def _store(
+        self,
+        provider: _Provider,
+        lat: float,
+        lon: float,
+        cache_key: str,
+        response: ProviderResponse,
+    ) -> CachedForecast:
+        """A new payload for ``cache_key``: archived, and cached when there is a cache."""
+        if self.cache is None:
+            entry = CachedForecast(slots=response.slots, model_run_utc=response.model_run_utc)
+        else:
+            until = self._fresh_until(provider, response, response.model_run_utc)
+            entry = CachedForecast.from_response(response, fresh_until=until)
+            self.cache.set(cache_key, entry, ttl_seconds=self.cache_retention_seconds)
+        self._archive_payload(provider, lat, lon, entry)
+        return entry
+
+    def _fresh_until(
+        self, provider: _Provider, response: ProviderResponse, model_run_utc: datetime | None
+    ) -> datetime:
+        assert self.cache is not None
+        cap = None
+        if self.max_data_age_seconds is not None:
+            # Only a margin short: _cached won't serve the entry stale past the limit.
+            cap = self.max_data_age_seconds - REFRESH_MARGIN_SECONDS
+        return fresh_until(
+            response,
+            model_run_utc=model_run_utc,
+            policy=provider.expiry,
+            default_ttl_seconds=self.cache.default_ttl_seconds,
+            max_seconds=cap,
+        )
+
+    def _archive_payload(
+        self, provider: _Provider, lat: float, lon: float, entry: CachedForecast
+    ) -> None:
+        if self.archive is None:
+            return
+        try:
+            self.archive.append_slots(
+                provider.name,
+                lat,
+                lon,
+                entry.slots,
+                fetched_at=entry.fetched_at,
+                model_run_utc=entry.model_run_utc,
+            )
+        except Exception as exc:
+            log.warning("archiving %s payload failed: %s", provider.name, exc)
+
+    def _refresh_in_background(
+        self, provider: _Provider, lat: float, lon: float, cache_key: str, entry: CachedForecast
+    ) -> None:
+        with self._refresh_lock:
+            if cache_key in self._refreshing:
+                return  # one refresh per key at a time
+            self._refreshing.add(cache_key)
+            if self._refresh_pool is None:
+                self._refresh_pool = ThreadPoolExecutor(
+                    max_workers=3, thread_name_prefix="conditions-refresh"
+                )
+            pool = self._refresh_pool
+
+        def run() -> None:
+            try:
+                self._refresh(provider, lat, lon, cache_key, entry)
+            finally:
+                with self._refresh_lock:
+                    self._refreshing.discard(cache_key)
+
+        pool.submit(run)
 
 
 # ---- Convenience wrappers ----------------------------------------------------------------
@@ -212,9 +741,10 @@ def fetch_current_conditions(
     now: datetime | None = None,
 ) -> ConditionsForecast | None:
     """Return the forecast bucket covering ``now`` (default: real now in UTC)."""
-    forecasts = fetch_forecast(latitude, longitude, aggregator=aggregator)
-    target = _hour_floor(now or datetime.now(UTC))
-    for f in forecasts:
-        if f.hour_utc == target:
-            return f
+    agg = aggregator or ConditionsAggregator()
+    series = agg.fetch_series(latitude, longitude)
+    current = series.at(now or datetime.now(UTC))
+    if current is not None:
+        return current
+    forecasts = series.forecasts()
     return forecasts[0] if forecasts else None
@@ -0,0 +1,523 @@
+"""Append-only columnar archive of provider payloads and merged forecasts.
+
+Cache entries are thrown away when they expire, so without an archive we can't replay
+a past night, score provider accuracy, or benchmark the scheduler on real data
+offline. Every freshly parsed provider payload and every new merged forecast series
+is appended here:
+
+    <root>/<stream>/<YYYY-MM-DD>/schema.json
+                                 <column>.bin      one fixed-width array per field
+                                 <column>.vocab    strings, one JSON literal per line
+
+Streams are the provider names ("7timer", "nws", "open-meteo") plus "merged"; the
+partition is the UTC day of the fetch. Each row is one slot, tagged with the fetch's
+``fetched_at``, site and model run. Times are int64 microseconds since the epoch
+(``NAT`` for None), floats are float64 (NaN for None), strings are dictionary-coded.
+
+Readers ``np.memmap`` the column files, so scanning a month costs page faults, not
+unpickling. Writes are appended column by column; a crash mid-append leaves some
+columns a row longer than others, so readers use the shortest column and the writer
+truncates to it before appending again. A crash mid-way through a vocabulary line
+leaves a torn last line: readers ignore it and the writer cuts it off. One process
+should write a given root.
+
+With ``retention_days`` set, partitions more than that many days older than the one
+being started are deleted as each new day's partition is created (a few sites'
+fetches come to roughly 80 MB a month).
+
+A field added to a record type later (with a default) reads as that default from
+partitions written before it existed; the next append to such a partition back-fills
+the column first.
+
+``ReplayProvider`` serves archived payloads through the provider interface, so the
+aggregator, scheduler and benchmarks run against a past night with no HTTP.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import shutil
+import threading
+import typing
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass, fields
+from datetime import UTC, date, datetime, timedelta
+from functools import lru_cache
+from itertools import pairwise
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from auto_telescope.conditions.http_cache import ProviderResponse, Validators
+
+if typing.TYPE_CHECKING:
+    from auto_telescope.conditions.aggregator import ConditionsForecast
+    from auto_telescope.conditions.expiry import ExpiryPolicy
+
+log = logging.getLogger(__name__)
+
+MERGED = "merged"
+NAT = np.iinfo(np.int64).min
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_DTYPES = {"time": "<i8", "float": "<f8", "str": "<i4"}
+# Columns every row carries, ahead of the record's own fields.
+_BATCH_COLUMNS = (("fetched_at", "time"), ("latitude", "float"), ("longitude", "float"))
+_BATCH_COLUMNS_RUN = (*_BATCH_COLUMNS, ("model_run", "time"))
+
+
+@dataclass(frozen=True, slots=True)
+class _Column:
+    name: str
+    kind: str  # "time" | "float" | "str"
+    nullable: bool = False
+    joined: bool = False  # tuple[str, ...] stored as one comma-joined string
+    default: Any = None  # the record field's default, for partitions that predate it
+
+
+@dataclass(frozen=True, slots=True)
+class _Stream:
+    record: type
+    columns: tuple[_Column, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class ArchivedBatch:
+    """One archived fetch: its records as they were appended."""
+
+    stream: str
+    fetched_at: datetime
+    latitude: float
+    longitude: float
+    model_run_utc: datetime | None
+    records: list[Any]
+
+
+class ForecastArchive:
+    """Date-partitioned columnar store under ``root``; see the module docstring."""
+
+    def __init__(self, root: Path, *, retention_days: int | None = None) -> None:
+        self.root = root
+        self.retention_days = retention_days
+        self._lock = threading.Lock()
+        self._vocab: dict[Path, dict[str, int]] = {}
+        self._repaired: set[Path] = set()
+        self._words: dict[Path, tuple[int, list[str]]] = {}  # reader vocab, by file size
+        self._last_merged: dict[tuple[float, float], list[Any]] = {}
+
+    # ---- writing -------------------------------------------------------------------
+
+    def append_slots(
+        self,
+        provider: str,
+        latitude: float,
+        longitude: float,
+        slots: Sequence[Any],
+        *,
+        fetched_at: datetime,
+        model_run_utc: datetime | None = None,
+    ) -> None:
+        """Append one provider payload's parsed slots."""
+        self._append(provider, latitude, longitude, slots, fetched_at, model_run_utc)
+
+    def append_forecasts(
+        self,
+        latitude: float,
+        longitude: float,
+        forecasts: Sequence[ConditionsForecast],
+        *,
+        fetched_at: datetime | None = None,
+    ) -> None:
+        """Append a merged series, unless it equals the last one appended for the site."""
+        site = (round(latitude, 4), round(longitude, 4))
+        with self._lock:
+            if self._last_merged.get(site) == list(forecasts):
+                return
+            self._last_merged[site] = list(forecasts)
+        self._append(MERGED, latitude, longitude, forecasts, fetched_at or datetime.now(UTC), None)
+
+    def _append(
+        self,
+        stream: str,
+        latitude: float,
+        longitude: float,
+        records: Sequence[Any],
+        fetched_at: datetime,
+        model_run_utc: datetime | None,
+    ) -> None:
+        if not records:
+            return
+        spec = _streams()[stream]
+        n = len(records)
+        batch: dict[str, Any] = {
+            "fetched_at": _to_micros(fetched_at),
+            "latitude": round(latitude, 4),
+            "longitude": round(longitude, 4),
+            "model_run": _to_micros(model_run_utc),
+        }
+        with self._lock:
+            part = self._partition_dir(stream, fetched_at.astimezone(UTC).date(), spec)
+            try:
+                arrays: dict[str, np.ndarray] = {}
+                for col in _all_columns(stream, spec):
+                    if col.name in batch:
+                        arrays[col.name] = np.full(n, batch[col.name], dtype=_DTYPES[col.kind])
+                    else:
+                        values = [getattr(r, col.name) for r in records]
+                        arrays[col.name] = self._encode(part, col, values)
+                for name, array in arrays.items():
+                    with open(part / f"{name}.bin", "ab") as fh:
+                        fh.write(array.tobytes())
+            except BaseException:
+                self._repaired.discard(part)  # re-align the columns before the next append
+                raise
+
+    def _partition_dir(self, stream: str, day: date, spec: _Stream) -> Path:
+        """Create (or repair after a torn append) the partition for ``day``."""
+        part = self.root / stream / day.isoformat()
+        if part in self._repaired:
+            return part
+        if not part.exists():
+            self._prune(stream, day)
+        part.mkdir(parents=True, exist_ok=True)
+        columns = _all_columns(stream, spec)
+        schema = part / "schema.json"
+        written = _schema_columns(part)
+        if written is None:
+            written = set()  # a new partition: no rows to back-fill
+        rows = _row_count(part, [c for c in columns if c.name in written])
+        for col in columns:
+            path = part / f"{col.name}.bin"
+            if path.exists() and path.stat().st_size > rows * np.dtype(_DTYPES[col.kind]).itemsize:
+                log.warning("truncating torn append in %s", path)
+                with open(path, "r+b") as fh:
+                    fh.truncate(rows * np.dtype(_DTYPES[col.kind]).itemsize)
+            vocab = part / f"{col.name}.vocab"
+            if col.kind == "str" and _truncate_torn_line(vocab):
+                log.warning("truncating torn vocabulary line in %s", vocab)
+                self._vocab.pop(vocab, None)
+        added = [c for c in columns if c.name not in written]
+        if added and rows:
+            log.info("back-filling %s in %s", ", ".join(c.name for c in added), part)
+            for col in added:
+                filler = self._encode(part, col, [col.default] * rows)
+                with open(part / f"{col.name}.bin", "wb") as fh:
+                    fh.write(filler.tobytes())
+        if added:
+            layout = {c.name: _DTYPES[c.kind] for c in columns}
+            schema.write_text(json.dumps({"stream": stream, "columns": layout}, indent=1))
+        self._repaired.add(part)
+        return part
+
+    def _prune(self, stream: str, today: date) -> None:
+        """Delete ``stream``'s partitions older than ``retention_days`` before ``today``."""
+        if self.retention_days is None:
+            return
+        oldest = today - timedelta(days=self.retention_days)
+        for day in self.days(stream):
+            if day >= oldest:
+                break
+            part = self.root / stream / day.isoformat()
+            log.info("pruning archive partition %s", part)
+            shutil.rmtree(part, ignore_errors=True)
+            self._repaired.discard(part)
+            for cache in (self._vocab, self._words):
+                for path in [p for p in cache if p.parent == part]:
+                    del cache[path]
+
+    def _encode(self, part: Path, col: _Column, values: list[Any]) -> np.ndarray:
+        if col.kind == "time":
+            return np.array([_to_micros(v) for v in values], dtype=_DTYPES["time"])
+        if col.kind == "float":
+            return np.array([np.nan if v is None else v for v in values], dtype=_DTYPES["float"])
+        vocab_path = part / f"{col.name}.vocab"
+        vocab = self._vocab.get(vocab_path)
+        if vocab is None:
+            vocab = {s: i for i, s in enumerate(_read_vocab(vocab_path))}
+            self._vocab[vocab_path] = vocab
+        strings = [",".join(v) if col.joined else v for v in values]
+        new = [s for s in dict.fromkeys(strings) if s not in vocab]
+        if new:
+            # Vocabulary first: a torn append may leave unused words, never missing ones.
+            with open(vocab_path, "a", encoding="utf-8") as fh:
+                fh.writelines(json.dumps(s) + "\n" for s in new)
+            for s in new:
+                vocab[s] = len(vocab)
+        return np.array([vocab[s] for s in strings], dtype=_DTYPES["str"])
+
+    # ---- reading -------------------------------------------------------------------
+
+    def days(self, stream: str) -> list[date]:
+        """Partitions present for ``stream``, oldest first."""
+        base = self.root / stream
+        if not base.is_dir():
+            return []
+        return sorted(date.fromisoformat(p.name) for p in base.iterdir() if p.is_dir())
+
+    def columns(self, stream: str, day: date) -> dict[str, np.ndarray]:
+        """Memory-mapped columns of one partition (string columns as vocabulary codes)."""
+        spec = _streams()[stream]
+        part = self.root / stream / day.isoformat()
+        written = _schema_columns(part) or set()
+        columns = [c for c in _all_columns(stream, spec) if c.name in written]
+        rows = _row_count(part, columns)
+        out: dict[str, np.ndarray] = {}
+        for col in columns:
+            dtype = np.dtype(_DTYPES[col.kind])
+            if rows == 0:
+                out[col.name] = np.empty(0, dtype=dtype)
+            else:
+                out[col.name] = np.memmap(part / f"{col.name}.bin", dtype, "r", shape=(rows,))
+        return out
+
+    def batches(
+        self,
+        stream: str,
+        *,
+        start: date | None = None,
+        end: date | None = None,
+    ) -> Iterator[ArchivedBatch]:
+        """Every archived fetch for ``stream`` in [start, end], in append order."""
+        for day in self.days(stream):
+            if (start and day < start) or (end and day > end):
+                continue
+            cols = self.columns(stream, day)
+            fetched = cols["fetched_at"]
+            if not len(fetched):
+                continue
+            bounds = np.flatnonzero(
+                (np.diff(fetched) != 0)
+                | (np.diff(cols["latitude"]) != 0)
+                | (np.diff(cols["longitude"]) != 0)
+            )
+            edges = [0, *(bounds + 1).tolist(), len(fetched)]
+            for lo, hi in pairwise(edges):
+                yield self._decode(stream, day, cols, lo, hi)
+
+    def latest(
+        self,
+        stream: str,
+        latitude: float,
+        longitude: float,
+        *,
+        at: datetime | None = None,
+    ) -> ArchivedBatch | None:
+        """The most recent fetch for the site at or before ``at`` (default: newest)."""
+        lat, lon = round(latitude, 4), round(longitude, 4)
+        cutoff = _to_micros(at) if at is not None else np.iinfo(np.int64).max
+        for day in reversed(self.days(stream)):
+            if at is not None and day > at.astimezone(UTC).date():
+                continue
+            cols = self.columns(stream, day)
+            match = (
+                (cols["latitude"] == lat)
+                & (cols["longitude"] == lon)
+                & (cols["fetched_at"] <= cutoff)
+            )
+            if not match.any():
+                continue
+            best = cols["fetched_at"][match].max()
+            rows = np.flatnonzero(match & (cols["fetched_at"] == best))
+            return self._decode(stream, day, cols, int(rows[0]), int(rows[-1]) + 1)
+        return None
+
+    def forecasts(
+        self, latitude: float, longitude: float, *, at: datetime | None = None
+    ) -> list[ConditionsForecast]:
+        """The merged series archived for the site at or before ``at``."""
+        batch = self.latest(MERGED, latitude, longitude, at=at)
+        return batch.records if batch is not None else []
+
+    def _decode(
+        self, stream: str, day: date, cols: dict[str, np.ndarray], lo: int, hi: int
+    ) -> ArchivedBatch:
+        spec = _streams()[stream]
+        part = self.root / stream / day.isoformat()
+        decoded: dict[str, list[Any]] = {}
+        for col in spec.columns:
+            if col.name not in cols:  # the partition predates this field
+                decoded[col.name] = [col.default] * (hi - lo)
+                continue
+            raw = cols[col.name][lo:hi]
+            if col.kind == "time":
+                decoded[col.name] = [_from_micros(int(v)) for v in raw]
+            elif col.kind == "float":
+                decoded[col.name] = [
+                    None if col.nullable and np.isnan(v) else float(v) for v in raw
+                ]
+            else:
+                words = self._vocabulary(part / f"{col.name}.vocab")
+                strings = [words[int(i)] for i in raw]
+                decoded[col.name] = (
+                    [tuple(s.split(",")) if s else () for s in strings] if col.joined else strings
+                )
+        names = [c.name for c in spec.columns]
+        records = [spec.record(*row) for row in zip(*(decoded[n] for n in names), strict=True)]
+        model_run = cols["model_run"][lo] if "model_run" in cols else NAT
+        fetched_at = _from_micros(int(cols["fetched_at"][lo]))
+        assert fetched_at is not None
+        return ArchivedBatch(
+            stream=stream,
+            fetched_at=fetched_at,
+            latitude=float(cols["latitude"][lo]),
+            longitude=float(cols["longitude"][lo]),
+            model_run_utc=_from_micros(int(model_run)),
+            records=records,
+        )
+
+    def _vocabulary(self, path: Path) -> list[str]:
+        size = path.stat().st_size if path.exists() else 0
+        with self._lock:
+            cached = self._words.get(path)
+            if cached is not None and cached[0] == size:
+                return cached[1]
+        words = _read_vocab(path)
+        with self._lock:
+            self._words[path] = (size, words)
+        return words
+
+
+class ReplayProvider:
+    """A provider that answers from a ``ForecastArchive`` instead of HTTP.
+
+    Each fetch returns the payload the real provider ``name`` returned last at or
+    before ``at`` (the newest one when ``at`` is None). Move ``at`` forward to step
+    through a night. Nothing archived for the site raises ``LookupError``, which the
+    aggregator treats like any provider failure.
+    """
+
+    def __init__(
+        self,
+        archive: ForecastArchive,
+        name: str,
+        *,
+        at: datetime | None = None,
+        expiry: ExpiryPolicy | None = None,
+    ) -> None:
+        if name not in _streams() or name == MERGED:
+            raise ValueError(f"unknown provider stream {name!r}")
+        self.name = name
+        self.archive = archive
+        self.at = at
+        self.expiry = expiry
+
+    def fetch(self, latitude: float, longitude: float) -> list[Any]:
+        return self.fetch_conditional(latitude, longitude).slots
+
+    def fetch_conditional(
+        self, latitude: float, longitude: float, validators: Validators | None = None
+    ) -> ProviderResponse:
+        batch = self.archive.latest(self.name, latitude, longitude, at=self.at)
+        if batch is None:
+            raise LookupError(f"no archived {self.name} payload for {latitude}, {longitude}")
+        # The fetch time doubles as an ETag, so a cached replay revalidates to a 304
+        # until ``at`` moves past the next archived fetch.
+        etag = f'"{batch.fetched_at.isoformat()}"'
+        fresh = Validators(etag=etag)
+        if validators is not None and validators.etag == etag:
+            return ProviderResponse(
+                slots=[], validators=fresh, max_age_seconds=None, not_modified=True
+            )
+        return ProviderResponse(
+            slots=batch.records,
+            validators=fresh,
+            max_age_seconds=None,
+            model_run_utc=batch.model_run_utc,
+        )
+
+
+@lru_cache(maxsize=1)
+def _streams() -> dict[str, _Stream]:
+    """Archive layout per stream, derived from the record dataclasses' annotations."""
+    from auto_telescope.conditions.aggregator import ConditionsForecast
+    from auto_telescope.conditions.nws import NWSProvider, NWSSlot
+    from auto_telescope.conditions.open_meteo import OpenMeteoProvider, OpenMeteoSlot
+    from auto_telescope.conditions.seven_timer import SevenTimerProvider, SevenTimerSlot
+
+    return {
+        SevenTimerProvider.name: _stream(SevenTimerSlot),
+        NWSProvider.name: _stream(NWSSlot),
+        OpenMeteoProvider.name: _stream(OpenMeteoSlot),
+        MERGED: _stream(ConditionsForecast),
+    }
+
+
+def _stream(record: type) -> _Stream:
+    hints = typing.get_type_hints(record)
+    columns = []
+    for f in fields(record):
+        hint = hints[f.name]
+        args = typing.get_args(hint)
+        nullable = type(None) in args
+        base = next((a for a in args if a is not type(None)), hint) if nullable else hint
+        if base is datetime:
+            columns.append(_Column(f.name, "time", nullable, default=f.default))
+        elif base is float:
+            columns.append(_Column(f.name, "float", nullable, default=f.default))
+        elif base is str:
+            columns.append(_Column(f.name, "str", nullable, default=f.default))
+        elif typing.get_origin(base) is tuple and typing.get_args(base)[0] is str:
+            columns.append(_Column(f.name, "str", nullable, joined=True, default=f.default))
+        else:
+            raise TypeError(f"{record.__name__}.{f.name}: can't archive {hint!r}")
+    return _Stream(record=record, columns=tuple(columns))
+
+
+def _all_columns(stream: str, spec: _Stream) -> tuple[_Column, ...]:
+    batch = _BATCH_COLUMNS if stream == MERGED else _BATCH_COLUMNS_RUN
+    return tuple(_Column(name, kind) for name, kind in batch) + spec.columns
+
+
+def _schema_columns(part: Path) -> set[str] | None:
+    """Column names in the partition's schema.json (None if it has none yet)."""
+    try:
+        return set(json.loads((part / "schema.json").read_text())["columns"])
+    except FileNotFoundError:
+        return None
+
+
+def _row_count(part: Path, columns: Sequence[_Column]) -> int:
+    """Rows fully written to every column (the shortest column wins)."""
+    counts = []
+    for col in columns:
+        path = part / f"{col.name}.bin"
+        size = path.stat().st_size if path.exists() else 0
+        counts.append(size // np.dtype(_DTYPES[col.kind]).itemsize)
+    return min(counts, default=0)
+
+
+def _read_vocab(path: Path) -> list[str]:
+    if not path.exists():
+        return []
+    # Everything after the last newline is a line torn by a crash mid-write: no row
+    # refers to it, since codes are only appended once their words are.
+    lines = path.read_bytes().split(b"\n")[:-1]
+    return [json.loads(line) for line in lines if line.strip()]
+
+
+def _truncate_torn_line(path: Path) -> bool:
+    """Cut ``path`` back to its last newline; whether there was anything to cut."""
+    if not path.exists():
+        return False
+    data = path.read_bytes()
+    keep = data.rfind(b"\n") + 1
+    if keep == len(data):
+        return False
+    with open(path, "r+b") as fh:
+        fh.truncate(keep)
+    return True
+
+
+def _to_micros(value: datetime | None) -> int:
+    if value is None:
+        return int(NAT)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    return (value - _EPOCH) // timedelta(microseconds=1)
+
+
+def _from_micros(value: int) -> datetime | None:
+    if value == NAT:
+        return None
+    return _EPOCH + timedelta(microseconds=value)
@@ -0,0 +1,171 @@
+"""Per-provider circuit breaker: skip a provider that keeps failing, probe it now and then.
+
+Without one, every fetch waits out the full request timeout on a provider that is
+known to be down. A ``CircuitBreaker`` tracks consecutive failures:
+
+* **closed**: calls go through. ``failure_threshold`` failures in a row open it.
+* **open**: calls are refused at once (``BreakerOpenError``) for a cooldown.
+* **half-open**: once the cooldown is over, one call is let through as a probe;
+  others are still refused. A successful probe closes the breaker; a failed one
+  opens it again with the cooldown doubled, up to ``max_cooldown_seconds``.
+
+A call that returns but takes longer than the latency budget counts as a failure:
+a provider that answers in 20 s is as good as down for a 25 s fetch deadline.
+
+Calls made as one piece of work (``fetch_many`` asking one provider about many sites)
+go through a ``BreakerBatch``: however many of them fail, the breaker counts one
+failure, so a single multi-site fetch cannot open it on its own.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+class BreakerOpenError(RuntimeError):
+    """Raised instead of calling a provider whose breaker is open."""
+
+
+class BreakerState(StrEnum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+
+@dataclass(frozen=True, slots=True)
+class BreakerStatus:
+    """A breaker's state at one moment."""
+
+    state: BreakerState
+    consecutive_failures: int
+    cooldown_seconds: float  # length of the current (or next) open period
+    retry_in_seconds: float  # until the next probe is allowed; 0 unless open
+
+
+class CircuitBreaker:
+    """Closed / open / half-open breaker with exponential cooldown. Thread-safe."""
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        failure_threshold: int = 3,
+        cooldown_seconds: float = 60.0,
+        max_cooldown_seconds: float = 1800.0,
+        latency_budget_seconds: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.base_cooldown_seconds = cooldown_seconds
+        self.max_cooldown_seconds = max_cooldown_seconds
+        self.latency_budget_seconds = latency_budget_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = BreakerState.CLOSED
+        self._failures = 0
+        self._trips = 0  # times opened since the last success
+        self._open_until = 0.0
+        self._probing = False
+
+    @property
+    def state(self) -> BreakerState:
+        return self.status().state
+
+    def status(self) -> BreakerStatus:
+        with self._lock:
+            retry_in = 0.0
+            if self._state is BreakerState.OPEN:
+                retry_in = max(0.0, self._open_until - self._clock())
+            return BreakerStatus(
+                state=self._state,
+                consecutive_failures=self._failures,
+                cooldown_seconds=self._cooldown(max(self._trips, 1)),
+                retry_in_seconds=retry_in,
+            )
+
+    def call(self, fn: Callable[[], T]) -> T:
+        """Run ``fn`` if the breaker allows it and record how it went."""
+        return self._run(fn, self.record_failure)
+
+    def batch(self) -> BreakerBatch:
+        """A view of this breaker whose calls count as at most one failure."""
+        return BreakerBatch(self)
+
+    def _run(self, fn: Callable[[], T], record_failure: Callable[[], None]) -> T:
+        if not self.allow():
+            raise BreakerOpenError(f"{self.name}: circuit {self.state}")
+        started = self._clock()
+        try:
+            result = fn()
+        except BaseException:
+            record_failure()
+            raise
+        elapsed = self._clock() - started
+        budget = self.latency_budget_seconds
+        if budget is not None and elapsed > budget:
+            record_failure()
+        else:
+            self.record_success()
+        return result
+
+    def allow(self) -> bool:
+        """Whether a call may go ahead now (claims the probe when half-open)."""
+        with self._lock:
+            if self._state is BreakerState.OPEN and self._clock() >= self._open_until:
+                self._state = BreakerState.HALF_OPEN
+                self._probing = False
+            if self._state is BreakerState.CLOSED:
+                return True
+            if self._state is BreakerState.HALF_OPEN and not self._probing:
+                self._probing = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._state = BreakerState.CLOSED
+            self._failures = 0
+            self._trips = 0
+            self._probing = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._state is BreakerState.OPEN:
+                return  # a call from before it opened; the cooldown stands
+            if self._state is BreakerState.HALF_OPEN or self._failures >= self.failure_threshold:
+                self._trips += 1
+                self._state = BreakerState.OPEN
+                self._open_until = self._clock() + self._cooldown(self._trips)
+                self._probing = False
+
+    def _cooldown(self, trips: int) -> float:
+        return min(self.base_cooldown_seconds * 2 ** (trips - 1), self.max_cooldown_seconds)
+
+
+class BreakerBatch:
+    """Calls through ``breaker`` that together count as one. Thread-safe."""
+
+    def __init__(self, breaker: CircuitBreaker) -> None:
+        self.breaker = breaker
+        self._lock = threading.Lock()
+        self._failed = False
+
+    def call(self, fn: Callable[[], T]) -> T:
+        """Like ``CircuitBreaker.call``; only the batch's first failure is recorded."""
+        return self.breaker._run(fn, self._record_failure)
+
+    def _record_failure(self) -> None:
+        with self._lock:
+            if self._failed:
+                return
+            self._failed = True
+        self.breaker.record_failure()
@@ -1,43 +1,265 @@
-"""Disk-backed cache for condition API responses.
+"""Disk-backed cache for condition API responses, with an in-process LRU in front.
 
 Why disk-backed (not in-memory): the Pi may reboot mid-night; we'd rather replay
 the last good forecast than fail open during a brief outage. ``diskcache`` is
 SQLite-backed, persistent, and process-safe.
+
+Why also in-memory: the scheduler, the safety checks and the UI read the same few
+forecasts dozens of times a minute, and every disk read is a SQLite query plus an
+unpickle of the whole slot list. Hot keys are therefore kept in a bounded LRU
+(``memory_max_entries`` / ``memory_max_bytes``, sized by pickled length):
+
+* Writes go through to disk first, so a reboot loses nothing.
+* A memory entry expires at the same wall-clock time as its disk entry; a disk hit
+  is promoted with the disk entry's remaining lifetime.
+* Values are shared between readers instead of unpickled per read: treat them as
+  immutable (the cached forecasts are frozen dataclasses).
+
+The memory tier is per process. Another process writing the same key is seen once
+this process's copy expires.
+
+One instance can be shared across threads: writes to a key reach disk and memory in
+the same order, and a disk read never promotes a value older than a write that raced
+it. ``get_or_set`` runs its loader once per key however many threads miss together
+(``conditions.singleflight``).
+
+Lookups are counted per tier in ``stats()`` and reported to the metrics sink as
+``cache.lookups`` (``conditions.metrics``).
 """
 
 from __future__ import annotations
 
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 import diskcache
 
+from auto_telescope.conditions.metrics import CACHE_LOOKUPS, MetricsSink, default_metrics
+from auto_telescope.conditions.singleflight import SingleFlight
+from auto_telescope.config.settings import Settings, get_settings
+
+
+@dataclass(frozen=True, slots=True)
+class ConditionsCacheStats:
+    """Per-tier counters since the cache was opened."""
+
+    memory_hits: int
+    disk_hits: int
+    misses: int
+    evictions: int
+    entries: int
+    bytes: int
+    max_entries: int
+    max_bytes: int
+
+    @property
+    def memory_hit_rate(self) -> float:
+        """Share of all lookups served from memory."""
+        total = self.memory_hits + self.disk_hits + self.misses
+        return self.memory_hits / total if total else 0.0
+
+    @property
+    def disk_hit_rate(self) -> float:
+        """Share of lookups that reached disk and were served from it."""
+        total = self.disk_hits + self.misses
+        return self.disk_hits / total if total else 0.0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.memory_hits + self.disk_hits + self.misses
+        return (self.memory_hits + self.disk_hits) / total if total else 0.0
+
 
 class ConditionsCache:
-    """Thin wrapper around diskcache.Cache with TTL semantics."""
+    """Thin wrapper around diskcache.Cache with TTL semantics and a memory tier.
 
-    def __init__(self, cache_dir: Path, default_ttl_seconds: int = 900) -> None:
+    ``memory_max_entries=0`` disables the memory tier.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        default_ttl_seconds: int = 900,
+        *,
+        memory_max_entries: int = 256,
+        memory_max_bytes: int = 16 * 1024 * 1024,
+        metrics: MetricsSink | None = None,
+    ) -> None:
         cache_dir.mkdir(parents=True, exist_ok=True)
         self._cache = diskcache.Cache(str(cache_dir))
         self._default_ttl = default_ttl_seconds
+        self.memory_max_entries = memory_max_entries
+        self.memory_max_bytes = memory_max_bytes
+        # key -> (value, expires at (time.time(), as diskcache), pickled size)
+        self._memory: OrderedDict[str, tuple[Any, float | None, int]] = OrderedDict()
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+        # Held across a write's disk and memory updates so racing writes land in the
+        # same order in both tiers.
+        self._write_lock = threading.Lock()
+        self._writes = 0  # bumped by every write; guards disk-hit promotion
+        self._loads: SingleFlight[Any] = SingleFlight()
+        self._memory_hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._metrics: MetricsSink = metrics if metrics is not None else default_metrics()
+
+    @classmethod
+    def from_settings(cls, settings: Settings | None = None) -> ConditionsCache:
+        s = settings or get_settings()
+        return cls(
+            s.cache_dir,
+            s.cache_ttl_seconds,
+            memory_max_entries=s.cache_memory_max_entries,
+            memory_max_bytes=s.cache_memory_max_bytes,
+        )
+
+    @property
+    def default_ttl_seconds(self) -> int:
+        return self._default_ttl
 
     def get(self, key: str) -> Any | None:
         """Return cached value or None if absent / expired."""
-        return self._cache.get(key, default=None)
+        with self._lock:
+            hit = self._memory.get(key)
+            if hit is not None:
+                value, expires_at, _ = hit
+                if expires_at is None or expires_at > time.time():
+                    self._memory.move_to_end(key)
+                    self._memory_hits += 1
+                else:
+                    self._forget(key)
+                    hit = None
+            writes = self._writes
+        if hit is not None:
+            self._metrics.increment(CACHE_LOOKUPS, tier="memory")
+            return value
+
+        value, expires_at = self._cache.get(key, default=None, expire_time=True)
+        with self._lock:
+            if value is None:
+                self._misses += 1
+            else:
+                self._disk_hits += 1
+        self._metrics.increment(CACHE_LOOKUPS, tier="miss" if value is None else "disk")
+        if value is None:
+            return None
+        self._remember(key, value, expires_at, unless_written_since=writes)
+        return value
+
+    def get_or_set(
+        self, key: str, load: Callable[[], Any], ttl_seconds: int | None = None
+    ) -> Any | None:
+        """``get(key)``, or on a miss ``load()`` once and cache what it returns.
+
+        Threads that miss on ``key`` while a load is running wait for that load and
+        get its value (or its exception). A ``None`` result is returned, not cached.
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        def load_once() -> Any | None:
+            cached = self.get(key)  # a load that just finished may have filled it
+            if cached is not None:
+                return cached
+            loaded = load()
+            if loaded is not None:
+                self.set(key, loaded, ttl_seconds)
+            return loaded
+
+        return self._loads.do(key, load_once)
 
     def set(self, key: str, value: Any, ttl_seconds: int | None = None) -> None:
         """Cache a value with TTL (default from constructor)."""
         ttl = ttl_seconds if ttl_seconds is not None else self._default_ttl
-        self._cache.set(key, value, expire=ttl)
+        with self._write_lock:
+            self._cache.set(key, value, expire=ttl)
+            with self._lock:
+                self._writes += 1
+            if ttl > 0:
+                self._remember(key, value, time.time() + ttl)
+            else:
+                with self._lock:
+                    self._forget(key)
+
+    def delete(self, key: str) -> None:
+        """Drop one entry (no-op if absent)."""
+        with self._write_lock:
+            with self._lock:
+                self._writes += 1
+                self._forget(key)
+            self._cache.delete(key)
 
     def clear(self) -> None:
-        """Drop all cached entries (mostly for tests)."""
-        self._cache.clear()
+        """Drop all cached entries (mostly for tests); the counters keep running."""
+        with self._write_lock:
+            with self._lock:
+                self._writes += 1
+                self._memory.clear()
+                self._memory_bytes = 0
+            self._cache.clear()
+
+    def stats(self) -> ConditionsCacheStats:
+        with self._lock:
+            return ConditionsCacheStats(
+                memory_hits=self._memory_hits,
+                disk_hits=self._disk_hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._memory),
+                bytes=self._memory_bytes,
+                max_entries=self.memory_max_entries,
+                max_bytes=self.memory_max_bytes,
+            )
 
     def close(self) -> None:
         """Release the underlying SQLite handle."""
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
         self._cache.close()
 
+    def _remember(
+        self,
+        key: str,
+        value: Any,
+        expires_at: float | None,
+        *,
+        unless_written_since: int | None = None,
+    ) -> None:
+        if self.memory_max_entries <= 0:
+            return
+        size = len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+        with self._lock:
+            if unless_written_since is not None and self._writes != unless_written_since:
+                return  # a write raced this disk read; it may be newer than ``value``
+            self._forget(key)
+            if size > self.memory_max_bytes:
+                return  # would evict everything else; leave it on disk
+            self._memory[key] = (value, expires_at, size)
+            self._memory_bytes += size
+            while (
+                len(self._memory) > self.memory_max_entries
+                or self._memory_bytes > self.memory_max_bytes
+            ):
+                _, (_, _, evicted) = self._memory.popitem(last=False)
+                self._memory_bytes -= evicted
+                self._evictions += 1
+
+    def _forget(self, key: str) -> None:
+        """Drop ``key`` from the memory tier. Caller holds ``_lock``."""
+        entry = self._memory.pop(key, None)
+        if entry is not None:
+            self._memory_bytes -= entry[2]
+
     def __enter__(self) -> ConditionsCache:
         return self
 
@@ -0,0 +1,97 @@
+"""Per-provider cache expiry: refetch when new data is due, not on a fixed clock.
+
+A flat 15-minute TTL refetches 7Timer four times an hour although its forecast only
+changes when a new model run is published (every 6 h, several hours after the run's
+nominal ``init`` time), and it can sit on a stale run for most of 15 minutes after a
+new one lands. Each provider therefore carries an ``ExpiryPolicy``:
+
+* ``ModelRunExpiry`` — 7Timer: fresh until ``init + cadence + publish lag``; once that
+  is overdue, poll every ``retry_seconds`` until the new run shows up.
+* ``ScheduledExpiry`` — Open-Meteo and NWS: fresh until the next scheduled update
+  (top of the hour plus an offset).
+
+Server ``Cache-Control`` / ``Expires`` headers still win when present (NWS sends them);
+a policy only applies when the server says nothing, and ``cache_ttl_seconds`` only when
+neither does.
+
+Whatever the source, freshness can be capped (``max_seconds``): the safety layer refuses
+data fetched longer ago than ``max_forecast_age_seconds``, so an entry must go stale,
+and be refreshed or revalidated, well before it gets that old.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Protocol
+
+from auto_telescope.conditions.http_cache import ProviderResponse
+
+# Never consider a payload fresh for less than this (avoids hammering a late provider).
+MIN_TTL_SECONDS = 60.0
+# Time left for a refresh between an entry going stale and its data being too old.
+REFRESH_MARGIN_SECONDS = 900.0
+
+
+class ExpiryPolicy(Protocol):
+    def next_update(self, *, model_run_utc: datetime | None, now: datetime) -> datetime | None:
+        """When new data is expected, or None if the policy can't tell."""
+        ...  # pragma: no cover - Protocol
+
+
+@dataclass(frozen=True, slots=True)
+class ModelRunExpiry:
+    """Fresh until the run after ``model_run_utc`` should be published."""
+
+    cadence_hours: float = 6.0
+    publish_lag_hours: float = 5.0
+    retry_seconds: float = 900.0
+
+    def next_update(self, *, model_run_utc: datetime | None, now: datetime) -> datetime | None:
+        if model_run_utc is None:
+            return None
+        due = model_run_utc + timedelta(hours=self.cadence_hours + self.publish_lag_hours)
+        if due > now:
+            return due
+        # The next run is overdue: poll until it appears.
+        return now + timedelta(seconds=self.retry_seconds)
+
+
+@dataclass(frozen=True, slots=True)
+class ScheduledExpiry:
+    """Fresh until the next ``every_minutes`` boundary (UTC) plus ``offset_minutes``."""
+
+    every_minutes: float = 60.0
+    offset_minutes: float = 0.0
+
+    def next_update(self, *, model_run_utc: datetime | None, now: datetime) -> datetime | None:
+        period = timedelta(minutes=self.every_minutes)
+        epoch = datetime(1970, 1, 1, tzinfo=UTC) + timedelta(minutes=self.offset_minutes)
+        return epoch + ((now - epoch) // period + 1) * period
+
+
+def fresh_until(
+    response: ProviderResponse,
+    *,
+    model_run_utc: datetime | None,
+    policy: ExpiryPolicy | None,
+    default_ttl_seconds: float,
+    max_seconds: float | None = None,
+    now: datetime | None = None,
+) -> datetime:
+    """Freshness deadline: server headers, else the provider's policy, else the default.
+
+    Never more than ``max_seconds`` from ``now`` when that is given.
+    """
+    now = now or datetime.now(UTC)
+    if response.max_age_seconds is not None:
+        until = now + timedelta(seconds=response.max_age_seconds)
+    else:
+        due = policy.next_update(model_run_utc=model_run_utc, now=now) if policy else None
+        if due is None:
+            until = now + timedelta(seconds=default_ttl_seconds)
+        else:
+            until = max(due, now + timedelta(seconds=MIN_TTL_SECONDS))
+    if max_seconds is not None:
+        until = min(until, now + timedelta(seconds=max(max_seconds, MIN_TTL_SECONDS)))
+    return until
@@ -0,0 +1,255 @@
+"""Dense hourly grid: the aggregator's provider merge, done with NumPy.
+
+Each provider's slots are scattered onto one shared hour axis (UTC hours since the
+epoch, from the earliest to the latest hour any provider covers), one float64 row per
+provider and field with NaN where the provider says nothing. The consensus is then a
+handful of array operations instead of per-hour dict buckets:
+
+* cloud cover and wind: ``fmax`` over the provider rows (NaN-ignoring), floored at 0;
+* seeing, transparency, humidity: 7Timer's row; visibility: Open-Meteo's;
+  temperature: 7Timer's, else NWS's;
+* provenance: a ``uint8`` bitmask per hour (``PROVIDER_BITS``). Hours no provider
+  covers stay in the grid with mask 0 and NaN in every field, and are skipped when
+  forecasts are built.
+
+``ConditionsForecast`` objects are only built on demand (``HourlyGrid.forecasts``).
+Where one provider reports the same hour twice, the merge keeps what the old
+bucket-based code kept: the max for cloud and wind, the last value for seeing,
+transparency and visibility, the first for temperature and humidity.
+
+The grid spans at most ``MAX_SPAN_HOURS`` either side of the median slot hour; slots
+outside that (a garbled timestamp decades off) are dropped with a warning rather than
+sizing the grid to reach them.
+"""
+
+from __future__ import annotations
+
+import logging
+import typing
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+
+import numpy as np
+
+from auto_telescope.conditions.nws import NWSSlot
+from auto_telescope.conditions.open_meteo import OpenMeteoSlot
+from auto_telescope.conditions.seven_timer import SevenTimerSlot
+
+if typing.TYPE_CHECKING:
+    from auto_telescope.conditions.aggregator import ConditionsForecast
+
+log = logging.getLogger(__name__)
+
+T = typing.TypeVar("T")
+
+SEVEN_TIMER, NWS, OPEN_METEO = 1, 2, 4
+PROVIDER_BITS = {"7timer": SEVEN_TIMER, "nws": NWS, "open-meteo": OPEN_METEO}
+# Sorted provider-name tuple for every mask value.
+_PROVENANCE = tuple(
+    tuple(sorted(name for name, bit in PROVIDER_BITS.items() if mask & bit)) for mask in range(8)
+)
+# No provider forecasts further ahead than Open-Meteo's 16 days.
+MAX_SPAN_HOURS = 16 * 24
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_HOUR = 3600
+_OPTIONAL_FIELDS = (
+    "seeing_arcsec",
+    "transparency_mag",
+    "visibility_m",
+    "temperature_c",
+    "relative_humidity_pct",
+)
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class HourlyGrid:
+    """Merged conditions on a dense hour axis; NaN marks "no value"."""
+
+    start_hour: int  # UTC hours since the epoch of index 0
+    cloud_cover_pct: np.ndarray
+    wind_speed_mps: np.ndarray
+    seeing_arcsec: np.ndarray
+    transparency_mag: np.ndarray
+    visibility_m: np.ndarray
+    temperature_c: np.ndarray
+    relative_humidity_pct: np.ndarray
+    providers: np.ndarray  # uint8 bitmask of PROVIDER_BITS
+    issued_utc: datetime | None = None
+    missing_providers: tuple[str, ...] = ()  # "<provider>:<reason>", fetch-wide
+
+    def __len__(self) -> int:
+        return len(self.providers)
+
+    def hour_utc(self, index: int) -> datetime:
+        return _EPOCH + timedelta(hours=self.start_hour + index)
+
+    def forecast(self, index: int) -> ConditionsForecast | None:
+        """The forecast for grid ``index``, or None if no provider covers that hour."""
+        if not self.providers[index]:
+            return None
+        return self._build([index])[0]
+
+    def forecasts(self) -> list[ConditionsForecast]:
+        """One forecast per covered hour, in time order."""
+        return self._build(np.flatnonzero(self.providers).tolist())
+
+    def _build(self, index: list[int]) -> list[ConditionsForecast]:
+        from auto_telescope.conditions.aggregator import ConditionsForecast
+
+        columns = zip(
+            index,
+            self.providers[index].tolist(),
+            self.cloud_cover_pct[index].tolist(),
+            self.wind_speed_mps[index].tolist(),
+            *(_optional(getattr(self, name)[index]) for name in _OPTIONAL_FIELDS),
+            strict=True,
+        )
+        return [
+            ConditionsForecast(
+                hour_utc=self.hour_utc(i),
+                cloud_cover_pct=cloud,
+                wind_speed_mps=wind,
+                seeing_arcsec=seeing,
+                transparency_mag=transp,
+                visibility_m=vis,
+                temperature_c=temp,
+                relative_humidity_pct=rh,
+                contributing_providers=_PROVENANCE[mask],
+                issued_utc=self.issued_utc,
+                missing_providers=self.missing_providers,
+            )
+            for i, mask, cloud, wind, seeing, transp, vis, temp, rh in columns
+        ]
+
+
+def merge_hourly(
+    seven_timer: Sequence[SevenTimerSlot],
+    nws: Sequence[NWSSlot],
+    open_meteo: Sequence[OpenMeteoSlot],
+    *,
+    issued_utc: datetime | None = None,
+    missing_providers: tuple[str, ...] = (),
+) -> HourlyGrid:
+    """Merge the three providers' slots onto one hourly grid."""
+    seven_base = _hours(s.timestamp_utc for s in seven_timer)
+    nws_hours = _hours(s.start_utc for s in nws)
+    meteo_hours = _hours(s.timestamp_utc for s in open_meteo)
+    every = np.concatenate([seven_base, nws_hours, meteo_hours])
+    if len(every):
+        # The median ignores a few wild timestamps, however far off they are.
+        centre = int(np.median(every))
+        low, high = centre - MAX_SPAN_HOURS, centre + MAX_SPAN_HOURS
+        seven_timer, seven_base = _within("7timer", seven_timer, seven_base, low, high)
+        nws, nws_hours = _within("nws", nws, nws_hours, low, high)
+        open_meteo, meteo_hours = _within("open-meteo", open_meteo, meteo_hours, low, high)
+    # 7Timer reports every 3 hours; each slot covers its hour and the two after it.
+    seven_hours = (seven_base[:, None] + np.arange(3)).ravel()
+
+    covered = np.concatenate([seven_hours, nws_hours, meteo_hours])
+    if not len(covered):
+        nothing = np.empty(0)
+        return HourlyGrid(
+            start_hour=0,
+            cloud_cover_pct=nothing,
+            wind_speed_mps=nothing,
+            seeing_arcsec=nothing,
+            transparency_mag=nothing,
+            visibility_m=nothing,
+            temperature_c=nothing,
+            relative_humidity_pct=nothing,
+            providers=np.zeros(0, np.uint8),
+            issued_utc=issued_utc,
+            missing_providers=missing_providers,
+        )
+    start = int(covered.min())
+    size = int(covered.max()) - start + 1
+    seven_idx, nws_idx, meteo_idx = seven_hours - start, nws_hours - start, meteo_hours - start
+
+    def seven(field: str) -> np.ndarray:
+        return np.repeat(_floats(seven_timer, field), 3)
+
+    # One row per provider for the max-consensus fields.
+    cloud = np.full((3, size), np.nan)
+    wind = np.full((3, size), np.nan)
+    np.fmax.at(cloud[0], seven_idx, seven("cloud_cover_pct"))
+    np.fmax.at(wind[0], seven_idx, seven("wind10m_mps"))
+    np.fmax.at(cloud[1], nws_idx, _floats(nws, "cloud_cover_pct"))  # None → NaN: ignored
+    np.fmax.at(wind[1], nws_idx, _floats(nws, "wind_speed_mps"))
+    np.fmax.at(cloud[2], meteo_idx, _floats(open_meteo, "cloud_cover_pct"))
+    np.fmax.at(wind[2], meteo_idx, _floats(open_meteo, "wind_speed_mps"))
+
+    providers = np.zeros(size, np.uint8)
+    providers[seven_idx] |= SEVEN_TIMER
+    providers[nws_idx] |= NWS
+    providers[meteo_idx] |= OPEN_METEO
+
+    seven_temp = _pick(size, seven_idx, seven("temperature_c"), last=False)
+    temperature = np.where(
+        providers & SEVEN_TIMER,
+        seven_temp,
+        _pick(size, nws_idx, _floats(nws, "temperature_c"), last=False),
+    )
+    return HourlyGrid(
+        start_hour=start,
+        cloud_cover_pct=_consensus_max(cloud, providers),
+        wind_speed_mps=_consensus_max(wind, providers),
+        seeing_arcsec=_pick(size, seven_idx, seven("seeing_arcsec"), last=True),
+        transparency_mag=_pick(size, seven_idx, seven("transparency_mag"), last=True),
+        visibility_m=_pick(size, meteo_idx, _floats(open_meteo, "visibility_m"), last=True),
+        temperature_c=temperature,
+        relative_humidity_pct=_pick(size, seven_idx, seven("relative_humidity_pct"), last=False),
+        providers=providers,
+        issued_utc=issued_utc,
+        missing_providers=missing_providers,
+    )
+
+
+def _optional(values: np.ndarray) -> list[float | None]:
+    return [None if v != v else v for v in values.tolist()]  # NaN → None
+
+
+def _consensus_max(rows: np.ndarray, providers: np.ndarray) -> np.ndarray:
+    # Bucket values started at 0.0, so the consensus never goes below it.
+    return np.where(providers != 0, np.fmax.reduce(rows, axis=0, initial=0.0), np.nan)
+
+
+def _hours(times: typing.Iterable[datetime]) -> np.ndarray:
+    """UTC hours since the epoch (naive times are taken as UTC)."""
+    return np.fromiter(
+        (int((t if t.tzinfo else t.replace(tzinfo=UTC)).timestamp() // _HOUR) for t in times),
+        dtype=np.int64,
+    )
+
+
+def _within(
+    provider: str, slots: Sequence[T], hours: np.ndarray, low: int, high: int
+) -> tuple[Sequence[T], np.ndarray]:
+    """The slots (and their hours) from hour ``low`` to ``high``, inclusive."""
+    keep = (hours >= low) & (hours <= high)
+    if keep.all():
+        return slots, hours
+    log.warning(
+        "dropping %d %s slot(s) outside %s .. %s",
+        len(keep) - int(keep.sum()),
+        provider,
+        _EPOCH + timedelta(hours=low),
+        _EPOCH + timedelta(hours=high),
+    )
+    return [s for s, k in zip(slots, keep.tolist(), strict=True) if k], hours[keep]
+
+
+def _floats(slots: Sequence[object], field: str) -> np.ndarray:
+    return np.fromiter(
+        (np.nan if (v := getattr(s, field)) is None else v for s in slots), dtype=np.float64
+    )
+
+
+def _pick(size: int, index: np.ndarray, values: np.ndarray, *, last: bool) -> np.ndarray:
+    """Scatter ``values`` to ``index``; on repeated indices keep the first or last."""
+    out = np.full(size, np.nan)
+    if last:
+        index, values = index[::-1], values[::-1]
+    unique, first = np.unique(index, return_index=True)
+    out[unique] = values[first]
+    return out
@@ -0,0 +1,156 @@
+"""HTTP cache semantics for provider fetches: validators, 304s and server freshness.
+
+A cached forecast keeps the ``ETag`` / ``Last-Modified`` validators of the response it
+was parsed from. Once it goes stale the provider is asked with ``If-None-Match`` /
+``If-Modified-Since``; a ``304 Not Modified`` costs one round trip and no body, and
+simply extends the cached slots' freshness.
+
+Freshness follows the server when it says anything (``Cache-Control: max-age`` minus
+``Age``, else ``Expires`` minus ``Date``), longer or shorter than our default;
+``no-cache`` / ``no-store`` mean "always revalidate". Without such headers the
+provider's expiry policy decides (see ``conditions.expiry``).
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass, field, replace
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+import requests
+
+
+@dataclass(frozen=True, slots=True)
+class Validators:
+    """Conditional-request validators from a previous response."""
+
+    etag: str | None = None
+    last_modified: str | None = None
+
+    @classmethod
+    def from_headers(cls, headers: Mapping[str, str]) -> Validators:
+        return cls(etag=headers.get("ETag"), last_modified=headers.get("Last-Modified"))
+
+    def request_headers(self) -> dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+@dataclass(frozen=True, slots=True)
+class ProviderResponse:
+    """Result of ``fetch_conditional``: parsed slots, or "unchanged" after a 304."""
+
+    slots: list[Any]
+    validators: Validators
+    max_age_seconds: float | None  # server-declared freshness; None = not stated
+    not_modified: bool = False
+    model_run_utc: datetime | None = None  # forecast model run, when the payload says
+
+    @classmethod
+    def from_response(
+        cls,
+        response: requests.Response,
+        slots: list[Any],
+        *,
+        model_run_utc: datetime | None = None,
+    ) -> ProviderResponse:
+        return cls(
+            slots=slots,
+            validators=Validators.from_headers(response.headers),
+            max_age_seconds=freshness_lifetime(response.headers),
+            model_run_utc=model_run_utc,
+        )
+
+    @classmethod
+    def unchanged(cls, response: requests.Response, previous: Validators) -> ProviderResponse:
+        # A 304 may carry updated validators; keep the old ones where it doesn't.
+        fresh = Validators.from_headers(response.headers)
+        return cls(
+            slots=[],
+            validators=Validators(
+                etag=fresh.etag or previous.etag,
+                last_modified=fresh.last_modified or previous.last_modified,
+            ),
+            max_age_seconds=freshness_lifetime(response.headers),
+            not_modified=True,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class CachedForecast:
+    """A provider's parsed slots as stored in ``ConditionsCache``, with HTTP metadata."""
+
+    slots: list[Any]
+    validators: Validators = field(default_factory=Validators)
+    # When the payload was last fetched, or confirmed unchanged by a 304.
+    fetched_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    fresh_until: datetime = field(default_factory=lambda: datetime.now(UTC))
+    model_run_utc: datetime | None = None
+
+    def is_fresh(self, now: datetime | None = None) -> bool:
+        return (now or datetime.now(UTC)) < self.fresh_until
+
+    def revalidated(self, response: ProviderResponse, *, fresh_until: datetime) -> CachedForecast:
+        """This entry after a 304: same slots, new validators and freshness."""
+        return replace(
+            self,
+            validators=response.validators,
+            fetched_at=datetime.now(UTC),
+            fresh_until=fresh_until,
+        )
+
+    @classmethod
+    def from_response(cls, response: ProviderResponse, *, fresh_until: datetime) -> CachedForecast:
+        return cls(
+            slots=response.slots,
+            validators=response.validators,
+            fetched_at=datetime.now(UTC),
+            fresh_until=fresh_until,
+            model_run_utc=response.model_run_utc,
+        )
+
+
+def freshness_lifetime(headers: Mapping[str, str]) -> float | None:
+    """Seconds the response stays fresh per its headers, or None if they don't say."""
+    directives: dict[str, str | None] = {}
+    for part in (headers.get("Cache-Control") or "").split(","):
+        name, _, value = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = value.strip('"') or None
+
+    if "no-store" in directives or "no-cache" in directives:
+        return 0.0
+    age = _to_float(headers.get("Age")) or 0.0
+    max_age = _to_float(directives.get("max-age"))  # we're a private cache: no s-maxage
+    if max_age is not None:
+        return max(0.0, max_age - age)
+
+    expires = headers.get("Expires")
+    if expires is None:
+        return None
+    expires_at = _to_datetime(expires)
+    if expires_at is None:
+        return 0.0  # RFC 9111: an invalid Expires means "already expired"
+    date = _to_datetime(headers.get("Date") or "") or datetime.now(UTC)
+    return max(0.0, (expires_at - date).total_seconds())
+
+
+def _to_float(raw: str | None) -> float | None:
+    try:
+        return float(raw) if raw is not None else None
+    except ValueError:
+        return None
+
+
+def _to_datetime(raw: str) -> datetime | None:
+    try:
+        parsed = parsedate_to_datetime(raw)
+    except (TypeError, ValueError):
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=UTC)
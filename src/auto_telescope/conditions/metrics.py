@@ -0,0 +1,250 @@
+"""Fetch metrics for the conditions layer: a pluggable sink and an in-memory default.
+
+The providers, the cache and the aggregator report what they do to a ``MetricsSink``:
+
+* ``provider.request_seconds`` (histogram; ``provider``, ``endpoint``): HTTP round
+  trips, retries included, whether they succeed or not;
+* ``provider.response_bytes`` (counter; ``provider``): body bytes received;
+* ``provider.parse_seconds`` (histogram; ``provider``): JSON decode plus parsing;
+* ``provider.calls`` (counter; ``provider``, ``outcome``): one per aggregator call,
+  ``outcome`` being "ok", "not_modified", "error" or "skipped" (breaker open);
+* ``cache.lookups`` (counter; ``tier``): "memory", "disk" or "miss";
+* ``aggregator.fetch_seconds`` (histogram): one merged ``fetch_series``.
+
+A sink only needs ``increment`` and ``observe``, so forwarding to statsd or Prometheus
+is a few lines. ``InMemoryMetrics`` (the process-wide default, ``default_metrics()``)
+keeps counters and fixed-bucket histograms and can summarize them per provider:
+``ConditionsAggregator.health()`` builds on it.
+"""
+
+from __future__ import annotations
+
+import bisect
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Protocol
+
+REQUEST_SECONDS = "provider.request_seconds"
+RESPONSE_BYTES = "provider.response_bytes"
+PARSE_SECONDS = "provider.parse_seconds"
+PROVIDER_CALLS = "provider.calls"
+CACHE_LOOKUPS = "cache.lookups"
+FETCH_SECONDS = "aggregator.fetch_seconds"
+
+# Histogram bucket upper bounds, in seconds: 1 ms up to the 30 s request timeouts.
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+_Labels = tuple[tuple[str, str], ...]
+
+
+class MetricsSink(Protocol):
+    def increment(self, name: str, amount: float = 1.0, **labels: str) -> None:
+        """Add ``amount`` to a counter."""
+        ...
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        """Record one sample of a distribution (a duration, a size)."""
+        ...
+
+
+@contextmanager
+def timed(sink: MetricsSink, name: str, **labels: str) -> Iterator[None]:
+    """Observe the wall time of the ``with`` body, even when it raises."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        sink.observe(name, time.perf_counter() - started, **labels)
+
+
+@dataclass(frozen=True, slots=True)
+class HistogramSnapshot:
+    """Counts per ``BUCKETS`` bound (plus one overflow bucket), with count/sum/max."""
+
+    counts: tuple[int, ...]
+    count: int
+    total: float
+    maximum: float
+
+    @property
+    def mean(self) -> float | None:
+        return self.total / self.count if self.count else None
+
+    def quantile(self, q: float) -> float | None:
+        """Estimated ``q``-quantile: linear within the bucket it falls in."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            if n and seen + n >= rank:
+                lower = BUCKETS[i - 1] if i > 0 else 0.0
+                upper = BUCKETS[i] if i < len(BUCKETS) else self.maximum
+                return min(lower + (upper - lower) * (rank - seen) / n, self.maximum)
+            seen += n
+        return self.maximum
+
+
+@dataclass(frozen=True, slots=True)
+class ProviderHealth:
+    """One provider's record since the metrics were last reset."""
+
+    provider: str
+    ok: int
+    not_modified: int
+    errors: int
+    skipped: int  # refused by the circuit breaker
+    request_p50_seconds: float | None
+    request_p95_seconds: float | None
+    request_max_seconds: float | None
+    response_bytes: int
+    parse_mean_seconds: float | None
+    breaker: str = ""  # breaker state, when the report comes from an aggregator
+    last_error: str = ""
+
+    @property
+    def calls(self) -> int:
+        return self.ok + self.not_modified + self.errors
+
+    @property
+    def error_rate(self) -> float:
+        return self.errors / self.calls if self.calls else 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class HealthReport:
+    """Per-provider health plus cache-tier lookups; ``format()`` renders a table."""
+
+    providers: tuple[ProviderHealth, ...]
+    cache_lookups: dict[str, int]
+
+    def format(self) -> str:
+        def ms(seconds: float | None, digits: int = 0) -> str:
+            return "-" if seconds is None else f"{seconds * 1000:.{digits}f}"
+
+        def short(text: str, width: int = 60) -> str:
+            return text if len(text) <= width else text[: width - 3] + "..."
+
+        lines = [
+            f"{'provider':<11} {'calls':>5} {'errors':>6} {'skipped':>7} {'p50 ms':>7} "
+            f"{'p95 ms':>7} {'max ms':>7} {'kB':>7} {'parse ms':>8}  breaker    last error"
+        ]
+        for h in self.providers:
+            lines.append(
+                f"{h.provider:<11} {h.calls:>5} {h.errors:>6} {h.skipped:>7} "
+                f"{ms(h.request_p50_seconds):>7} {ms(h.request_p95_seconds):>7} "
+                f"{ms(h.request_max_seconds):>7} {h.response_bytes / 1000:>7.1f} "
+                f"{ms(h.parse_mean_seconds, 1):>8}  {h.breaker or '-':<10} {short(h.last_error) or '-'}"
+            )
+        tiers = ", ".join(f"{tier} {n}" for tier, n in sorted(self.cache_lookups.items()))
+        lines.append(f"cache lookups: {tiers or 'none'}")
+        return "\n".join(lines)
+
+
+class InMemoryMetrics:
+    """Counters and bucketed histograms kept in process. Thread-safe."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counters: dict[tuple[str, _Labels], float] = {}
+        self._histograms: dict[tuple[str, _Labels], _Histogram] = {}
+
+    def increment(self, name: str, amount: float = 1.0, **labels: str) -> None:
+        key = (name, _key(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0.0) + amount
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        key = (name, _key(labels))
+        bucket = bisect.bisect_left(BUCKETS, value)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = _Histogram()
+            histogram.counts[bucket] += 1
+            histogram.total += value
+            histogram.maximum = max(histogram.maximum, value)
+
+    def counter(self, name: str, **labels: str) -> float:
+        """A counter's value for exactly these labels (0 if never incremented)."""
+        with self._lock:
+            return self._counters.get((name, _key(labels)), 0.0)
+
+    def histogram(self, name: str, **labels: str) -> HistogramSnapshot:
+        """Samples recorded with these labels, or with more (``endpoint`` etc.) on top."""
+        wanted = set(_key(labels))
+        counts = [0] * (len(BUCKETS) + 1)
+        total, maximum = 0.0, 0.0
+        with self._lock:
+            for (metric, key), h in self._histograms.items():
+                if metric == name and wanted <= set(key):
+                    counts = [a + b for a, b in zip(counts, h.counts, strict=True)]
+                    total, maximum = total + h.total, max(maximum, h.maximum)
+        return HistogramSnapshot(tuple(counts), sum(counts), total, maximum)
+
+    def provider_health(self, provider: str) -> ProviderHealth:
+        requests = self.histogram(REQUEST_SECONDS, provider=provider)
+
+        def calls(outcome: str) -> int:
+            return int(self.counter(PROVIDER_CALLS, provider=provider, outcome=outcome))
+
+        return ProviderHealth(
+            provider=provider,
+            ok=calls("ok"),
+            not_modified=calls("not_modified"),
+            errors=calls("error"),
+            skipped=calls("skipped"),
+            request_p50_seconds=requests.quantile(0.5),
+            request_p95_seconds=requests.quantile(0.95),
+            request_max_seconds=requests.maximum if requests.count else None,
+            response_bytes=int(self.counter(RESPONSE_BYTES, provider=provider)),
+            parse_mean_seconds=self.histogram(PARSE_SECONDS, provider=provider).mean,
+        )
+
+    def cache_lookups(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                dict(labels)["tier"]: int(n)
+                for (name, labels), n in self._counters.items()
+                if name == CACHE_LOOKUPS
+            }
+
+    def summary(self, providers: tuple[str, ...] = ("7timer", "nws", "open-meteo")) -> HealthReport:
+        return HealthReport(
+            providers=tuple(self.provider_health(p) for p in providers),
+            cache_lookups=self.cache_lookups(),
+        )
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+
+class _Histogram:
+    __slots__ = ("counts", "maximum", "total")
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(BUCKETS) + 1)  # one per bound, plus overflow
+        self.total = 0.0
+        self.maximum = 0.0
+
+
+def _key(labels: dict[str, str]) -> _Labels:
+    return tuple(sorted(labels.items()))
+
+
+_DEFAULT: InMemoryMetrics | None = None
+_DEFAULT_LOCK = threading.Lock()
+
+
+def default_metrics() -> InMemoryMetrics:
+    """The process-wide sink every provider, cache and aggregator reports to by default."""
+    global _DEFAULT
+    with _DEFAULT_LOCK:
+        if _DEFAULT is None:
+            _DEFAULT = InMemoryMetrics()
+        return _DEFAULT
@@ -5,18 +5,63 @@ Two-step API:
   2. GET <forecastHourly URL> →  returns hourly periods (1-hour resolution, 156 hours).
 
 The User-Agent is mandatory; NWS will 403 without one.
+
+Step 1 is only needed once per site: the gridpoint for a fixed lat/lon essentially
+never changes. The resolved ``forecastHourly`` URL is memoized per rounded lat/lon
+(and written through to a ``ConditionsCache`` for ``points_ttl_seconds`` when one is
+given, so it survives a reboot). A cached URL that answers 404 or redirects means
+NWS re-gridded the site: it is dropped and step 1 runs again.
 """
 
 from __future__ import annotations
 
+import functools
+import logging
+import threading
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
 
 import requests
-from dateutil import parser as date_parser
+
+from auto_telescope.conditions.cache import ConditionsCache
+from auto_telescope.conditions.expiry import ExpiryPolicy, ScheduledExpiry
+from auto_telescope.conditions.http_cache import ProviderResponse, Validators
+from auto_telescope.conditions.isotime import parse_iso
+from auto_telescope.conditions.metrics import (
+    PARSE_SECONDS,
+    REQUEST_SECONDS,
+    RESPONSE_BYTES,
+    MetricsSink,
+    default_metrics,
+    timed,
+)
+from auto_telescope.config.http import default_session
+
+log = logging.getLogger(__name__)
 
 NWS_POINTS_URL = "https://api.weather.gov/points/{lat:.4f},{lon:.4f}"
+POINTS_TTL_SECONDS = 7 * 24 * 3600
+
+# 16-point compass direction → degrees
+_COMPASS_DEG = {
+    "N": 0,
+    "NNE": 22.5,
+    "NE": 45,
+    "ENE": 67.5,
+    "E": 90,
+    "ESE": 112.5,
+    "SE": 135,
+    "SSE": 157.5,
+    "S": 180,
+    "SSW": 202.5,
+    "SW": 225,
+    "WSW": 247.5,
+    "W": 270,
+    "WNW": 292.5,
+    "NW": 315,
+    "NNW": 337.5,
+}
 
 
 @dataclass(frozen=True, slots=True)
@@ -39,9 +84,26 @@ class NWSProvider:
     name = "nws"
 
     def __init__(
-        self, *, timeout_seconds: float = 10.0, user_agent: str = "auto-telescope/0.1"
+        self,
+        *,
+        timeout_seconds: float | tuple[float, float] = 10.0,
+        user_agent: str = "auto-telescope/0.1",
+        session: requests.Session | None = None,
+        expiry: ExpiryPolicy | None = None,
+        points_url: str = NWS_POINTS_URL,
+        points_cache: ConditionsCache | None = None,
+        points_ttl_seconds: int = POINTS_TTL_SECONDS,
+        metrics: MetricsSink | None = None,
     ) -> None:
-        self._timeout = timeout_seconds
+        self._timeout = timeout_seconds  # seconds, or a (connect, read) tuple
+        self._session = session or default_session()
+        self.expiry: ExpiryPolicy | None = expiry or ScheduledExpiry(every_minutes=60)
+        self._points_url = points_url  # format template with {lat} and {lon}
+        self._points_cache = points_cache
+        self._points_ttl = points_ttl_seconds
+        self._hourly_urls: dict[str, str] = {}
+        self._lock = threading.Lock()
+        self.metrics: MetricsSink = metrics if metrics is not None else default_metrics()
         # NWS REQUIRES a real User-Agent including contact info.
         self._headers = {
             "User-Agent": user_agent,
@@ -49,16 +111,75 @@ class NWSProvider:
         }
 
     def fetch(self, latitude: float, longitude: float) -> list[NWSSlot]:
-        """Fetch hourly forecast for a site. Two HTTP calls: /points then forecastHourly."""
-        points_url = NWS_POINTS_URL.format(lat=latitude, lon=longitude)
-        points_resp = requests.get(points_url, timeout=self._timeout, headers=self._headers)
+        """Fetch hourly forecast for a site: one HTTP call once the gridpoint is known."""
+        return self.fetch_conditional(latitude, longitude).slots
+
+    def fetch_conditional(
+        self, latitude: float, longitude: float, validators: Validators | None = None
+    ) -> ProviderResponse:
+        """Like ``fetch``, but revalidates the hourly forecast against ``validators``."""
+        validators = validators or Validators()
+        headers = self._headers | validators.request_headers()
+        key = f"nws-points:{latitude:.4f},{longitude:.4f}"
+        forecast_url = self._cached_hourly_url(key)
+        if forecast_url is not None:
+            hourly_resp = self._get(forecast_url, "hourly", headers, allow_redirects=False)
+            if hourly_resp.status_code != 404 and not hourly_resp.is_redirect:
+                return self._hourly_response(hourly_resp, validators)
+            log.info("NWS gridpoint moved (%s); re-resolving", hourly_resp.status_code)
+            self._forget_hourly_url(key)
+
+        forecast_url = self._resolve_hourly_url(latitude, longitude)
+        hourly_resp = self._get(forecast_url, "hourly", headers)
+        result = self._hourly_response(hourly_resp, validators)
+        self._remember_hourly_url(key, forecast_url)
+        return result
+
+    def _hourly_response(
+        self, response: requests.Response, validators: Validators
+    ) -> ProviderResponse:
+        if response.status_code == 304:
+            return ProviderResponse.unchanged(response, validators)
+        response.raise_for_status()
+        with timed(self.metrics, PARSE_SECONDS, provider=self.name):
+            slots = self._parse(response.json())
+        return ProviderResponse.from_response(response, slots)
+
+    def _resolve_hourly_url(self, latitude: float, longitude: float) -> str:
+        points_url = self._points_url.format(lat=latitude, lon=longitude)
+        points_resp = self._get(points_url, "points", self._headers)
         points_resp.raise_for_status()
-        points = points_resp.json()
-        forecast_url = points["properties"]["forecastHourly"]
+        return str(points_resp.json()["properties"]["forecastHourly"])
+
+    def _get(
+        self, url: str, endpoint: str, headers: dict[str, str], **kwargs: Any
+    ) -> requests.Response:
+        with timed(self.metrics, REQUEST_SECONDS, provider=self.name, endpoint=endpoint):
+            response = self._session.get(url, timeout=self._timeout, headers=headers, **kwargs)
+        self.metrics.increment(RESPONSE_BYTES, len(response.content), provider=self.name)
+        return response
+
+    def _cached_hourly_url(self, key: str) -> str | None:
+        with self._lock:
+            url = self._hourly_urls.get(key)
+        if url is None and self._points_cache is not None:
+            url = self._points_cache.get(key)
+            if url is not None:
+                with self._lock:
+                    self._hourly_urls[key] = url
+        return url
 
-        hourly_resp = requests.get(forecast_url, timeout=self._timeout, headers=self._headers)
-        hourly_resp.raise_for_status()
-        return self._parse(hourly_resp.json())
+    def _remember_hourly_url(self, key: str, url: str) -> None:
+        with self._lock:
+            self._hourly_urls[key] = url
+        if self._points_cache is not None:
+            self._points_cache.set(key, url, ttl_seconds=self._points_ttl)
+
+    def _forget_hourly_url(self, key: str) -> None:
+        with self._lock:
+            self._hourly_urls.pop(key, None)
+        if self._points_cache is not None:
+            self._points_cache.delete(key)
 
     def _parse(self, payload: dict[str, Any]) -> list[NWSSlot]:
         periods = payload.get("properties", {}).get("periods", [])
@@ -67,8 +188,8 @@ class NWSProvider:
 
         slots: list[NWSSlot] = []
         for p in periods:
-            start = date_parser.isoparse(p["startTime"])
-            end = date_parser.isoparse(p["endTime"])
+            start = parse_iso(p["startTime"])
+            end = parse_iso(p["endTime"])
 
             temp_unit = (p.get("temperatureUnit") or "F").upper()
             temp_val = float(p.get("temperature", 0))
@@ -108,7 +229,13 @@ def _parse_wind_speed(raw: str | dict[str, Any]) -> float:
         if "mph" in unit or "mi_h-1" in unit:
             return float(v) * 0.44704
         return float(v)  # assume m/s
-    s = str(raw).strip().lower()
+    return _text_wind_speed(str(raw))
+
+
+@functools.lru_cache(maxsize=256)
+def _text_wind_speed(raw: str) -> float:
+    # A forecast repeats a handful of strings ("5 mph", "5 to 10 mph") across 156 periods.
+    s = raw.strip().lower()
     # Take the upper bound of any "X to Y" range — be conservative on wind.
     parts = s.replace("to", " ").split()
     nums = [float(t) for t in parts if t.replace(".", "", 1).isdigit()]
@@ -119,25 +246,7 @@ def _parse_wind_speed(raw: str | dict[str, Any]) -> float:
 def _parse_wind_direction(raw: str | None) -> float | None:
     if not raw:
         return None
-    compass = {
-        "N": 0,
-        "NNE": 22.5,
-        "NE": 45,
-        "ENE": 67.5,
-        "E": 90,
-        "ESE": 112.5,
-        "SE": 135,
-        "SSE": 157.5,
-        "S": 180,
-        "SSW": 202.5,
-        "SW": 225,
-        "WSW": 247.5,
-        "W": 270,
-        "WNW": 292.5,
-        "NW": 315,
-        "NNW": 337.5,
-    }
-    return compass.get(str(raw).upper())
+    return _COMPASS_DEG.get(str(raw).upper())
 
 
 def _maybe_qv(period: dict[str, Any], *keys: str) -> float | None:
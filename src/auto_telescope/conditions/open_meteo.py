@@ -5,18 +5,36 @@ API: https://open-meteo.com/en/docs
 Open-Meteo is our backup. It's free, requires no API key, and has good
 worldwide coverage. We pull cloud_cover, visibility, and wind_speed_10m
 on hourly resolution.
+
+The endpoint takes comma-separated coordinate lists and answers with one result
+per location, so ``fetch_batch`` covers several sites in one round trip.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections.abc import Sequence
+from dataclasses import dataclass, replace
 from datetime import datetime
 from typing import Any
 
+import numpy as np
 import requests
-from dateutil import parser as date_parser
+
+from auto_telescope.conditions.expiry import ExpiryPolicy, ScheduledExpiry
+from auto_telescope.conditions.http_cache import ProviderResponse, Validators
+from auto_telescope.conditions.isotime import parse_iso_many
+from auto_telescope.conditions.metrics import (
+    PARSE_SECONDS,
+    REQUEST_SECONDS,
+    RESPONSE_BYTES,
+    MetricsSink,
+    default_metrics,
+    timed,
+)
+from auto_telescope.config.http import default_session
 
 OPEN_METEO_URL = "https://api.open-meteo.com/v1/forecast"
+_HOURLY = "cloud_cover,visibility,wind_speed_10m"
 
 
 @dataclass(frozen=True, slots=True)
@@ -35,24 +53,80 @@ class OpenMeteoProvider:
     name = "open-meteo"
 
     def __init__(
-        self, *, timeout_seconds: float = 10.0, user_agent: str = "auto-telescope/0.1"
+        self,
+        *,
+        timeout_seconds: float | tuple[float, float] = 10.0,
+        user_agent: str = "auto-telescope/0.1",
+        session: requests.Session | None = None,
+        expiry: ExpiryPolicy | None = None,
+        url: str = OPEN_METEO_URL,
+        metrics: MetricsSink | None = None,
     ) -> None:
-        self._timeout = timeout_seconds
+        self._timeout = timeout_seconds  # seconds, or a (connect, read) tuple
+        self._session = session or default_session()
+        self.expiry: ExpiryPolicy | None = expiry or ScheduledExpiry(
+            every_minutes=60, offset_minutes=10
+        )
         self._headers = {"User-Agent": user_agent}
+        self._url = url
+        self.metrics: MetricsSink = metrics if metrics is not None else default_metrics()
 
     def fetch(self, latitude: float, longitude: float) -> list[OpenMeteoSlot]:
-        params = {
-            "latitude": f"{latitude:.4f}",
-            "longitude": f"{longitude:.4f}",
-            "hourly": "cloud_cover,visibility,wind_speed_10m",
+        return self.fetch_conditional(latitude, longitude).slots
+
+    def fetch_conditional(
+        self, latitude: float, longitude: float, validators: Validators | None = None
+    ) -> ProviderResponse:
+        """Like ``fetch``, but revalidates against ``validators`` (304 → ``not_modified``)."""
+        validators = validators or Validators()
+        resp = self._get(
+            [(latitude, longitude)], self._headers | validators.request_headers(), "forecast"
+        )
+        if resp.status_code == 304:
+            return ProviderResponse.unchanged(resp, validators)
+        resp.raise_for_status()
+        with timed(self.metrics, PARSE_SECONDS, provider=self.name):
+            slots = self._parse(resp.json())
+        return ProviderResponse.from_response(resp, slots)
+
+    def fetch_batch(self, coordinates: Sequence[tuple[float, float]]) -> list[ProviderResponse]:
+        """One request for several (latitude, longitude) sites; responses in input order.
+
+        Batched responses carry no validators: an ETag would name the whole batch, not
+        any one site's forecast.
+        """
+        resp = self._get(coordinates, self._headers, "batch")
+        resp.raise_for_status()
+        with timed(self.metrics, PARSE_SECONDS, provider=self.name):
+            payload = resp.json()
+            payloads = payload if isinstance(payload, list) else [payload]
+            if len(payloads) != len(coordinates):
+                raise ValueError(
+                    f"Open-Meteo answered {len(payloads)} locations for {len(coordinates)}"
+                )
+            parsed = [self._parse(p) for p in payloads]
+        response = ProviderResponse.from_response(resp, [])
+        return [replace(response, slots=slots, validators=Validators()) for slots in parsed]
+
+    def _get(
+        self, coordinates: Sequence[tuple[float, float]], headers: dict[str, str], endpoint: str
+    ) -> requests.Response:
+        with timed(self.metrics, REQUEST_SECONDS, provider=self.name, endpoint=endpoint):
+            resp = self._session.get(
+                self._url, params=self._params(coordinates), timeout=self._timeout, headers=headers
+            )
+        self.metrics.increment(RESPONSE_BYTES, len(resp.content), provider=self.name)
+        return resp
+
+    @staticmethod
+    def _params(coordinates: Sequence[tuple[float, float]]) -> dict[str, str]:
+        return {
+            "latitude": ",".join(f"{lat:.4f}" for lat, _ in coordinates),
+            "longitude": ",".join(f"{lon:.4f}" for _, lon in coordinates),
+            "hourly": _HOURLY,
             "wind_speed_unit": "ms",
             "timezone": "UTC",
         }
-        resp = requests.get(
-            OPEN_METEO_URL, params=params, timeout=self._timeout, headers=self._headers
-        )
-        resp.raise_for_status()
-        return self._parse(resp.json())
 
     def _parse(self, payload: dict[str, Any]) -> list[OpenMeteoSlot]:
         hourly = payload.get("hourly") or {}
@@ -65,15 +139,20 @@ class OpenMeteoProvider:
             raise ValueError(f"Open-Meteo payload missing hourly.time: {payload!r}")
 
         n = min(len(times), len(clouds), len(visibilities), len(winds))
-        slots: list[OpenMeteoSlot] = []
-        for i in range(n):
-            ts = date_parser.isoparse(times[i])
-            slots.append(
-                OpenMeteoSlot(
-                    timestamp_utc=ts,
-                    cloud_cover_pct=float(clouds[i]) if clouds[i] is not None else 100.0,
-                    visibility_m=float(visibilities[i]) if visibilities[i] is not None else 0.0,
-                    wind_speed_mps=float(winds[i]) if winds[i] is not None else 0.0,
-                )
+        return list(
+            map(
+                OpenMeteoSlot,
+                parse_iso_many(times[:n]),
+                _column(clouds[:n], missing=100.0),
+                _column(visibilities[:n], missing=0.0),
+                _column(winds[:n], missing=0.0),
             )
-        return slots
+        )
+
+
+def _column(values: Sequence[Any], *, missing: float) -> list[float]:
+    """``values`` as floats in one NumPy conversion; JSON nulls become ``missing``."""
+    column = np.array(values, dtype=np.float64)  # None → NaN
+    column[np.isnan(column)] = missing
+    floats: list[float] = column.tolist()
+    return floats
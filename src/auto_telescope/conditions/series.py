@@ -0,0 +1,220 @@
+"""ForecastSeries: the merged hourly forecast as contiguous arrays.
+
+Callers used to get a ``list[ConditionsForecast]`` and scan it: the scheduler ran a
+``min(...)`` over the whole list for every window, ``fetch_current_conditions`` searched
+it linearly for the current hour. A ``ForecastSeries`` wraps the aggregator's dense
+``HourlyGrid`` instead:
+
+* ``at(when)`` is an index computation: O(1);
+* ``nearest(when)`` is a binary search over the covered hours (gaps allowed);
+* ``between(start, end)`` slices every column without copying;
+* ``interpolate(field, when)`` interpolates a numeric field linearly between the two
+  surrounding hours (each value taken as the top of its hour);
+* ``window_means(fields, starts, ends)`` averages fields over many time ranges at
+  once, from cumulative sums over each column.
+
+``ConditionsForecast`` objects are still built only when asked for.
+"""
+
+from __future__ import annotations
+
+import typing
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass, field, replace
+from datetime import UTC, datetime
+
+import numpy as np
+
+from auto_telescope.conditions.grid import PROVIDER_BITS, HourlyGrid
+
+if typing.TYPE_CHECKING:
+    from auto_telescope.conditions.aggregator import ConditionsForecast
+
+NUMERIC_FIELDS = (
+    "cloud_cover_pct",
+    "wind_speed_mps",
+    "seeing_arcsec",
+    "transparency_mag",
+    "visibility_m",
+    "temperature_c",
+    "relative_humidity_pct",
+)
+_HOUR = 3600.0
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class ForecastSeries:
+    """Hour-indexed merged forecast. Iterates as ``ConditionsForecast`` objects."""
+
+    grid: HourlyGrid
+    _covered: np.ndarray = field(init=False, repr=False)  # grid indices with data
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_covered", np.flatnonzero(self.grid.providers))
+
+    @classmethod
+    def from_forecasts(cls, forecasts: Iterable[ConditionsForecast]) -> ForecastSeries:
+        """Lay ready-made forecasts (replays, test stubs) onto a grid.
+
+        Each forecast goes to the hour containing its ``hour_utc``; a later one for the
+        same hour replaces an earlier one. ``issued_utc`` and ``missing_providers`` come
+        from the last forecast.
+        """
+        rows = list(forecasts)
+        hours = np.fromiter(
+            (int(_utc(f.hour_utc).timestamp() // _HOUR) for f in rows), dtype=np.int64
+        )
+        start = int(hours.min()) if len(rows) else 0
+        size = int(hours.max()) - start + 1 if len(rows) else 0
+        index = hours - start
+        columns = {}
+        for name in NUMERIC_FIELDS:
+            values = np.full(size, np.nan)
+            values[index] = [np.nan if (v := getattr(f, name)) is None else v for f in rows]
+            columns[name] = values
+        providers = np.zeros(size, np.uint8)
+        try:
+            providers[index] = [
+                sum(PROVIDER_BITS[p] for p in set(f.contributing_providers)) for f in rows
+            ]
+        except KeyError as exc:
+            raise ValueError(f"unknown provider {exc.args[0]!r}") from None
+        return cls(
+            HourlyGrid(
+                start_hour=start,
+                providers=providers,
+                issued_utc=rows[-1].issued_utc if rows else None,
+                missing_providers=rows[-1].missing_providers if rows else (),
+                **columns,
+            )
+        )
+
+    @property
+    def issued_utc(self) -> datetime | None:
+        return self.grid.issued_utc
+
+    @property
+    def start_utc(self) -> datetime | None:
+        """Top of the first grid hour (None for an empty series)."""
+        return self.grid.hour_utc(0) if len(self.grid) else None
+
+    def __len__(self) -> int:
+        """Number of hours some provider covers."""
+        return len(self._covered)
+
+    def __bool__(self) -> bool:
+        return len(self._covered) > 0
+
+    def __iter__(self) -> Iterator[ConditionsForecast]:
+        return iter(self.forecasts())
+
+    def forecasts(self) -> list[ConditionsForecast]:
+        return self.grid.forecasts()
+
+    def at(self, when: datetime) -> ConditionsForecast | None:
+        """The forecast for the hour containing ``when``, or None if not covered."""
+        index = self._index(when)
+        if index is None:
+            return None
+        return self.grid.forecast(index)
+
+    def nearest(self, when: datetime) -> ConditionsForecast | None:
+        """The covered hour whose top is closest to ``when`` (earlier one on a tie)."""
+        covered = self._covered
+        if not len(covered):
+            return None
+        offset = self._hours_since_start(when)
+        pos = int(np.searchsorted(covered, offset))
+        if pos == len(covered):
+            best = covered[-1]
+        elif pos == 0:
+            best = covered[0]
+        else:
+            before, after = covered[pos - 1], covered[pos]
+            best = after if after - offset < offset - before else before
+        return self.grid.forecast(int(best))
+
+    def between(self, start: datetime, end: datetime) -> ForecastSeries:
+        """Hours whose top falls in [start, end), as views on this series' arrays."""
+        size = len(self.grid)
+        lo = min(max(int(np.ceil(self._hours_since_start(start))), 0), size)
+        hi = min(max(int(np.ceil(self._hours_since_start(end))), lo), size)
+        g = self.grid
+        return ForecastSeries(
+            replace(
+                g,
+                start_hour=g.start_hour + lo,
+                **{name: getattr(g, name)[lo:hi] for name in (*NUMERIC_FIELDS, "providers")},
+            )
+        )
+
+    def column(self, field: str) -> np.ndarray:
+        """One numeric field per grid hour (NaN where unknown). A view: don't mutate."""
+        if field not in NUMERIC_FIELDS:
+            raise ValueError(f"not a numeric forecast field: {field!r}")
+        values: np.ndarray = getattr(self.grid, field)
+        return values
+
+    def interpolate(self, field: str, when: datetime) -> float | None:
+        """``field`` linearly interpolated to ``when``; None outside or next to a gap."""
+        values = self.column(field)
+        offset = self._hours_since_start(when)
+        lo = int(np.floor(offset))
+        if lo < 0 or lo >= len(values):
+            return None
+        frac = offset - lo
+        if frac == 0.0:
+            value = float(values[lo])
+        elif lo + 1 >= len(values):
+            return None
+        else:
+            value = float(values[lo] + (values[lo + 1] - values[lo]) * frac)
+        return None if np.isnan(value) else value
+
+    def window_means(
+        self, fields: Iterable[str], starts: Sequence[datetime], ends: Sequence[datetime]
+    ) -> dict[str, np.ndarray]:
+        """Time-weighted mean of each of ``fields`` over each [start, end) range.
+
+        Each hour's value holds for the whole hour, so a range that covers 15 minutes of
+        one hour and 45 of the next weights them 1:3. Hours with no value are left out
+        of the average; a range with no known value at all gets NaN. Per field: one
+        cumulative sum over the column and ``np.interp`` at the range ends, however many
+        ranges there are.
+        """
+        size = len(self.grid)
+        knots = np.arange(size + 1)
+        lo = np.clip(self._hours_array(starts), 0, size)
+        hi = np.clip(self._hours_array(ends), lo, size)
+        means = {}
+        for name in fields:
+            values = self.column(name)
+            known = ~np.isnan(values)
+            total = np.concatenate(([0.0], np.cumsum(np.where(known, values, 0.0))))
+            weight = np.concatenate(([0.0], np.cumsum(known)))
+            covered = np.interp(hi, knots, weight) - np.interp(lo, knots, weight)
+            integral = np.interp(hi, knots, total) - np.interp(lo, knots, total)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                means[name] = np.where(covered > 1e-9, integral / covered, np.nan)
+        return means
+
+    def _hours_array(self, times: Sequence[datetime]) -> np.ndarray:
+        seconds = np.fromiter(
+            (t.timestamp() if t.tzinfo else _utc(t).timestamp() for t in times),
+            np.float64,
+            len(times),
+        )
+        return seconds / _HOUR - self.grid.start_hour
+
+    def _hours_since_start(self, when: datetime) -> float:
+        return _utc(when).timestamp() / _HOUR - self.grid.start_hour
+
+    def _index(self, when: datetime) -> int | None:
+        index = int(np.floor(self._hours_since_start(when)))
+        if not 0 <= index < len(self.grid):
+            return None
+        return index
+
+
+def _utc(when: datetime) -> datetime:
+    return when if when.tzinfo else when.replace(tzinfo=UTC)
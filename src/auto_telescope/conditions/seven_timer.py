@@ -6,7 +6,9 @@ Why we trust this for astronomy: it's the only one of our three providers that
 publishes seeing (atmospheric turbulence) and transparency (sky clarity)
 forecasts on a 0-8 / 1-8 scale specifically tuned for amateur observers.
 
-Returns hourly forecasts in 3-hour resolution out to ~96 hours.
+Returns hourly forecasts in 3-hour resolution out to ~96 hours. A new forecast only
+appears with a new model run ("init", every 6 h, published hours later), so cached
+payloads expire on that schedule (``conditions.expiry.ModelRunExpiry``).
 """
 
 from __future__ import annotations
@@ -17,6 +19,18 @@ from typing import Any
 
 import requests
 
+from auto_telescope.conditions.expiry import ExpiryPolicy, ModelRunExpiry
+from auto_telescope.conditions.http_cache import ProviderResponse, Validators
+from auto_telescope.conditions.metrics import (
+    PARSE_SECONDS,
+    REQUEST_SECONDS,
+    RESPONSE_BYTES,
+    MetricsSink,
+    default_metrics,
+    timed,
+)
+from auto_telescope.config.http import default_session
+
 SEVEN_TIMER_URL = "https://www.7timer.info/bin/api.pl"
 
 
@@ -67,27 +81,54 @@ class SevenTimerProvider:
     name = "7timer"
 
     def __init__(
-        self, *, timeout_seconds: float = 10.0, user_agent: str = "auto-telescope/0.1"
+        self,
+        *,
+        timeout_seconds: float | tuple[float, float] = 10.0,
+        user_agent: str = "auto-telescope/0.1",
+        session: requests.Session | None = None,
+        expiry: ExpiryPolicy | None = None,
+        url: str = SEVEN_TIMER_URL,
+        metrics: MetricsSink | None = None,
     ) -> None:
-        self._timeout = timeout_seconds
+        self._timeout = timeout_seconds  # seconds, or a (connect, read) tuple
+        self._session = session or default_session()
+        self.expiry: ExpiryPolicy | None = expiry or ModelRunExpiry()
         self._headers = {"User-Agent": user_agent}
+        self._url = url
+        self.metrics: MetricsSink = metrics if metrics is not None else default_metrics()
 
     def fetch(self, latitude: float, longitude: float) -> list[SevenTimerSlot]:
         """Fetch the ASTRO forecast for a site. Returns up to ~32 slots (96h / 3h)."""
+        return self.fetch_conditional(latitude, longitude).slots
+
+    def fetch_conditional(
+        self, latitude: float, longitude: float, validators: Validators | None = None
+    ) -> ProviderResponse:
+        """Like ``fetch``, but revalidates against ``validators`` (304 → ``not_modified``)."""
         params = {
             "lon": f"{longitude:.4f}",
             "lat": f"{latitude:.4f}",
             "product": "astro",
             "output": "json",
         }
-        response = requests.get(
-            SEVEN_TIMER_URL,
-            params=params,
-            timeout=self._timeout,
-            headers=self._headers,
-        )
+        validators = validators or Validators()
+        with timed(self.metrics, REQUEST_SECONDS, provider=self.name, endpoint="astro"):
+            response = self._session.get(
+                self._url,
+                params=params,
+                timeout=self._timeout,
+                headers=self._headers | validators.request_headers(),
+            )
+        self.metrics.increment(RESPONSE_BYTES, len(response.content), provider=self.name)
+        if response.status_code == 304:
+            return ProviderResponse.unchanged(response, validators)
         response.raise_for_status()
-        return self._parse(response.json())
+        with timed(self.metrics, PARSE_SECONDS, provider=self.name):
+            payload = response.json()
+            slots = self._parse(payload)
+        return ProviderResponse.from_response(
+            response, slots, model_run_utc=_model_run_utc(payload)
+        )
 
     def _parse(self, payload: dict[str, Any]) -> list[SevenTimerSlot]:
         init_str = payload.get("init")
@@ -123,3 +164,11 @@ class SevenTimerProvider:
                 )
             )
         return slots
+
+
+def _model_run_utc(payload: dict[str, Any]) -> datetime | None:
+    """The model run ("init", YYYYMMDDHH UTC) the forecast was computed from."""
+    init_str = payload.get("init")
+    if not init_str:
+        return None
+    return datetime.strptime(str(init_str), "%Y%m%d%H").replace(tzinfo=UTC)
@@ -0,0 +1,80 @@
+"""Single-flight call coalescing: one run per key, however many callers ask at once.
+
+When the scheduler, a safety tick and the operator UI miss the cache for the same
+site together, each would otherwise fire its own provider requests. ``SingleFlight``
+makes the first caller for a key run the work on its own thread while later callers
+for that key wait for the same outcome: the same return value, or the same exception
+re-raised. Nothing is remembered once the run finishes; the next call for the key
+starts a new run (caching is the ``ConditionsCache``'s job).
+
+``do_many`` does the same for a batch of keys answered by one call (an Open-Meteo
+multi-site request): keys already in flight are joined, and the batch runs for the
+rest, holding their flights until it has finished with them.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable, Sequence
+from concurrent.futures import Future
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[T]):
+    """Per-key deduplication of concurrent calls. Thread-safe."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[str, Future[T]] = {}
+
+    def do(self, key: str, fn: Callable[[], T]) -> T:
+        """Run ``fn`` unless a run for ``key`` is in flight; then share that run's outcome."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = Future()
+        if not leader:
+            return call.result()
+
+        try:
+            result = fn()
+        except BaseException as exc:
+            self._finish(key)
+            call.set_exception(exc)
+            raise
+        self._finish(key)
+        call.set_result(result)
+        return result
+
+    def do_many(self, keys: Sequence[str], fn: Callable[[list[str]], list[T]]) -> list[T]:
+        """Outcomes for distinct ``keys``, in order.
+
+        ``fn`` gets the keys not already in flight and returns one result per key, in
+        the same order; the others share the runs in flight for them.
+        """
+        with self._lock:
+            joined = {k: self._calls[k] for k in keys if k in self._calls}
+            led = {k: Future[T]() for k in keys if k not in joined}
+            self._calls.update(led)
+
+        if led:
+            try:
+                results = fn(list(led))
+            except BaseException as exc:
+                for key, call in led.items():
+                    self._finish(key)
+                    call.set_exception(exc)
+                raise
+            for (key, call), result in zip(led.items(), results, strict=True):
+                self._finish(key)
+                call.set_result(result)
+        return [(led.get(k) or joined[k]).result() for k in keys]
+
+    def _finish(self, key: str) -> None:
+        # Unregister before publishing, so a caller arriving after the outcome is set
+        # starts a fresh run instead of reading a finished one.
+        with self._lock:
+            del self._calls[key]
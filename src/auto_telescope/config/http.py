@@ -0,0 +1,100 @@
+"""Shared HTTP transport: pooled keep-alive sessions with retry/backoff.
+
+Every provider used to call bare ``requests.get``, which opens a fresh connection per
+request — DNS, TCP and TLS handshakes each time, over the school's slow uplink. All
+outbound HTTP now goes through one long-lived ``requests.Session`` per process:
+
+* ``HTTPAdapter`` keeps up to ``http_pool_maxsize`` idle connections per host, so
+  repeat fetches reuse an open TLS connection.
+* Connect errors and 429/5xx answers are retried ``http_retries`` times with
+  exponential backoff (``Retry-After`` is honored). Only idempotent GETs are retried.
+* Read timeouts are not: the server already had ``api_timeout_seconds`` to answer, and
+  waiting that long again would blow ``conditions_deadline_seconds`` (NWS makes two
+  requests in a row). Each wait before a retry, ``Retry-After`` included, is capped at
+  ``http_max_retry_wait_seconds``, so two retries add at most a few seconds and a
+  provider that recovers still answers inside ``provider_latency_budget_seconds``.
+
+Timeouts stay per request: pass ``request_timeout(settings)`` as ``timeout=``.
+"""
+
+from __future__ import annotations
+
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3 import BaseHTTPResponse
+from urllib3.util.retry import Retry
+
+from auto_telescope.config.settings import Settings, get_settings
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+class _CappedRetry(Retry):
+    """``Retry`` that sleeps no longer than ``backoff_max`` for a ``Retry-After`` either."""
+
+    def get_retry_after(self, response: BaseHTTPResponse) -> float | None:
+        seconds = super().get_retry_after(response)
+        return None if seconds is None else min(seconds, self.backoff_max)
+
+
+def configure_session(
+    session: requests.Session,
+    *,
+    pool_maxsize: int = 8,
+    retries: int = 2,
+    backoff_seconds: float = 0.5,
+    max_wait_seconds: float = 2.0,
+) -> requests.Session:
+    """Mount pooled, retrying adapters for http:// and https:// on ``session``."""
+    retry = _CappedRetry(
+        total=retries,
+        connect=retries,
+        read=0,  # a read timeout already cost the full timeout once
+        status=retries,
+        backoff_factor=backoff_seconds,
+        backoff_max=max_wait_seconds,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset({"GET", "HEAD"}),
+        respect_retry_after_header=True,
+        raise_on_status=False,  # hand the last response back; callers raise_for_status()
+    )
+    # pool_connections is the number of per-host pools kept; we talk to a handful of hosts.
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=pool_maxsize, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def build_session(settings: Settings | None = None) -> requests.Session:
+    """A new pooled session configured from ``settings``."""
+    s = settings or get_settings()
+    session = configure_session(
+        requests.Session(),
+        pool_maxsize=s.http_pool_maxsize,
+        retries=s.http_retries,
+        backoff_seconds=s.http_backoff_seconds,
+        max_wait_seconds=s.http_max_retry_wait_seconds,
+    )
+    session.headers["User-Agent"] = s.api_user_agent
+    return session
+
+
+def request_timeout(settings: Settings | None = None) -> tuple[float, float]:
+    """``(connect, read)`` timeout tuple for ``requests``."""
+    s = settings or get_settings()
+    return (s.api_connect_timeout_seconds, s.api_timeout_seconds)
+
+
+_DEFAULT: requests.Session | None = None
+_DEFAULT_LOCK = threading.Lock()
+
+
+def default_session() -> requests.Session:
+    """The process-wide pooled session shared by every provider."""
+    global _DEFAULT
+    with _DEFAULT_LOCK:
+        if _DEFAULT is None:
+            _DEFAULT = build_session()
+        return _DEFAULT
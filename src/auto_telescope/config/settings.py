@@ -36,14 +36,51 @@ class Settings(BaseSettings):
 
     # --- Conditions / API behavior ---------------------------------------------------------
     cache_dir: Path = Field(default=Path.home() / ".auto_telescope_cache")
-    cache_ttl_seconds: int = Field(default=900, ge=0)  # 15 min
-    api_timeout_seconds: float = Field(default=10.0, gt=0.0)
+    cache_ttl_seconds: int = Field(default=900, ge=0)  # 15 min, unless the server says otherwise
+    cache_retention_seconds: int = Field(default=24 * 3600, ge=0)  # stale entries kept for 304s
+    # Stale-while-revalidate window past freshness (0 = always refetch inline when stale).
+    cache_max_stale_seconds: int = Field(default=3600, ge=0)
+    # In-process LRU in front of the disk cache (0 entries disables it).
+    cache_memory_max_entries: int = Field(default=256, ge=0)
+    cache_memory_max_bytes: int = Field(default=16 * 1024 * 1024, ge=0)
+    # Append every fetched payload and merged series here for replay (None = off).
+    conditions_archive_dir: Path | None = Field(default=None)
+    # Archive day partitions kept (about 80 MB a month); None keeps them all.
+    conditions_archive_retention_days: int | None = Field(default=90, ge=1)
+    api_timeout_seconds: float = Field(default=10.0, gt=0.0)  # read timeout
+    api_connect_timeout_seconds: float = Field(default=3.05, gt=0.0)
+    conditions_deadline_seconds: float = Field(default=25.0, gt=0.0)  # all providers, in parallel
+    # fetch_many: requests in flight per provider, and sites per Open-Meteo request.
+    conditions_max_concurrency: int = Field(default=4, ge=1)
+    open_meteo_batch_size: int = Field(default=50, ge=1)
     api_user_agent: str = Field(default="auto-telescope/0.1 (mvhsphysicsastroclub@gmail.com)")
 
+    # --- Provider circuit breakers ----------------------------------------------------------
+    breaker_failure_threshold: int = Field(default=3, ge=1)  # consecutive failures to open
+    breaker_cooldown_seconds: float = Field(default=60.0, gt=0.0)  # doubles per failed probe
+    breaker_max_cooldown_seconds: float = Field(default=1800.0, gt=0.0)
+    # A provider call slower than this counts as a failure even if it returned data.
+    provider_latency_budget_seconds: float = Field(default=8.0, gt=0.0)
+
+    # --- HTTP transport (pooled keep-alive session shared by all providers) ---------------
+    http_pool_maxsize: int = Field(default=8, ge=1)  # idle connections kept per host
+    http_retries: int = Field(default=2, ge=0)  # on connect errors and 429/5xx, not timeouts
+    http_backoff_seconds: float = Field(default=0.5, ge=0.0)
+    http_max_retry_wait_seconds: float = Field(default=2.0, ge=0.0)  # backoff and Retry-After
+
+    # --- Target resolution -----------------------------------------------------------------
+    resolver_budget_seconds: float = Field(default=0.25, ge=0.0)
+    simbad_timeout_seconds: float = Field(default=15.0, gt=0.0)
+    resolve_cache_size: int = Field(default=1024, ge=0)  # 0 disables the memo
+    resolve_cache_bucket_seconds: float = Field(default=60.0, gt=0.0)
+    # MPCORB.DAT / CometEls.txt-format file of comet and asteroid orbits (optional).
+    minor_body_elements_path: Path | None = Field(default=None)
+
     # --- Safety thresholds (hard interlocks) -----------------------------------------------
     sun_avoidance_deg: float = Field(default=30.0, ge=0.0, le=90.0)
     min_altitude_deg: float = Field(default=20.0, ge=0.0, le=90.0)
     max_wind_speed_mps: float = Field(default=15.0, ge=0.0)
+    max_forecast_age_seconds: float = Field(default=2 * 3600, gt=0.0)  # older → refuse to slew
 
     # --- Visibility scoring ----------------------------------------------------------------
     min_observation_minutes: int = Field(default=30, ge=1)
@@ -3,11 +3,13 @@
 Design principles:
   * Fail closed: any uncertainty (None forecast, exception, missing data) → refuse.
   * Independent checks: each interlock is its own function so tests can target it.
-  * Conservative defaults: 30 deg sun avoidance, 20 deg horizon, 15 m/s wind.
+  * Conservative defaults: 30 deg sun avoidance, 20 deg horizon, 15 m/s wind, and a
+    forecast no older than 2 h.
 
 Every public ``check_*`` returns an ``InterlockResult``. The aggregate
 ``check_can_slew`` runs all of them and refuses on the first failure (so the
-operator UI gets the most-actionable reason).
+operator UI gets the most-actionable reason). Given a whole ``ForecastSeries``, the
+checks use the hour containing the slew time; no forecast for that hour → refuse.
 """
 
 from __future__ import annotations
@@ -16,6 +18,7 @@ from dataclasses import dataclass
 from datetime import UTC, datetime
 
 from auto_telescope.conditions.aggregator import ConditionsForecast
+from auto_telescope.conditions.series import ForecastSeries
 from auto_telescope.config.settings import Settings, get_settings
 from auto_telescope.config.site import Site
 from auto_telescope.visibility.coordinates import (
@@ -111,10 +114,29 @@ def check_wind(
     forecast: ConditionsForecast | None,
     *,
     max_wind_speed_mps: float,
+    max_forecast_age_seconds: float | None = None,
+    now: datetime | None = None,
 ) -> InterlockResult:
-    """Refuse if forecast wind exceeds the safe threshold (or if forecast missing)."""
+    """Refuse if forecast wind exceeds the safe threshold (or if forecast missing).
+
+    With ``max_forecast_age_seconds``, also refuse on a forecast whose data was fetched
+    longer ago than that (the cache may serve stale data while it refreshes), or whose
+    age is unknown. Age is measured against ``now`` (default: the wall clock), not the
+    slew time.
+    """
     if forecast is None:
         return InterlockResult.deny("no_forecast", "no weather forecast available; refusing")
+    if max_forecast_age_seconds is not None:
+        age = forecast.age_seconds(now)
+        if age is None:
+            return InterlockResult.deny(
+                "forecast_age_unknown", "forecast has no issue time; refusing"
+            )
+        if age > max_forecast_age_seconds:
+            return InterlockResult.deny(
+                "forecast_too_old",
+                f"forecast is {age / 60:.0f} min old (max {max_forecast_age_seconds / 60:.0f})",
+            )
     if forecast.wind_speed_mps > max_wind_speed_mps:
         return InterlockResult.deny(
             "wind_too_high",
@@ -131,6 +153,7 @@ class SafetyInterlocks:
     sun_avoidance_deg: float
     min_altitude_deg: float
     max_wind_speed_mps: float
+    max_forecast_age_seconds: float | None = None
 
     @classmethod
     def from_settings(cls, settings: Settings | None = None) -> SafetyInterlocks:
@@ -140,6 +163,7 @@ class SafetyInterlocks:
             sun_avoidance_deg=s.sun_avoidance_deg,
             min_altitude_deg=s.min_altitude_deg,
             max_wind_speed_mps=s.max_wind_speed_mps,
+            max_forecast_age_seconds=s.max_forecast_age_seconds,
         )
 
     def check(
@@ -147,9 +171,11 @@ class SafetyInterlocks:
         target: EquatorialCoord,
         *,
         when_utc: datetime,
-        forecast: ConditionsForecast | None,
+        forecast: ConditionsForecast | ForecastSeries | None,
     ) -> list[InterlockResult]:
         """Run every check and return all results."""
+        if isinstance(forecast, ForecastSeries):
+            forecast = forecast.at(when_utc)
         return [
             check_sun_avoidance(
                 target,
@@ -163,7 +189,11 @@ class SafetyInterlocks:
                 site=self.site,
                 min_altitude_deg=self.min_altitude_deg,
             ),
-            check_wind(forecast, max_wind_speed_mps=self.max_wind_speed_mps),
+            check_wind(
+                forecast,
+                max_wind_speed_mps=self.max_wind_speed_mps,
+                max_forecast_age_seconds=self.max_forecast_age_seconds,
+            ),
         ]
 
 
@@ -172,7 +202,7 @@ def check_can_slew(
     *,
     when_utc: datetime,
     site: Site | None = None,
-    forecast: ConditionsForecast | None = None,
+    forecast: ConditionsForecast | ForecastSeries | None = None,
     settings: Settings | None = None,
 ) -> InterlockResult:
     """One-call safety check used by all slew sites in the controller.
@@ -186,6 +216,7 @@ def check_can_slew(
         sun_avoidance_deg=s.sun_avoidance_deg,
         min_altitude_deg=s.min_altitude_deg,
         max_wind_speed_mps=s.max_wind_speed_mps,
+        max_forecast_age_seconds=s.max_forecast_age_seconds,
     )
     for result in locks.check(target, when_utc=when_utc, forecast=forecast):
         if not result.safe:
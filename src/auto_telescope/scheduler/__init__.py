@@ -4,5 +4,18 @@ from auto_telescope.scheduler.best_time import (
     ScoredWindow,
     find_best_windows,
 )
+from auto_telescope.scheduler.whats_up import (
+    SkyConstraints,
+    SkyEntry,
+    SkyReport,
+    whats_up_now,
+)
 
-__all__ = ["ScoredWindow", "find_best_windows"]
+__all__ = [
+    "ScoredWindow",
+    "SkyConstraints",
+    "SkyEntry",
+    "SkyReport",
+    "find_best_windows",
+    "whats_up_now",
+]
@@ -2,12 +2,21 @@
 
 Pipeline:
   1. Resolve the target name.
-  2. Compute visibility windows over the next N nights (visibility.windows).
-  3. For each window, fetch the conditions forecast and score it on a 0..1 scale:
-       0.5 * (1 - cloud_cover)       # optical clarity
-     + 0.2 * peak_altitude_factor    # higher-up = lower air mass
-     + 0.2 * seeing_factor           # 1.0 at 0.5\" → 0.2 at 3\"
-     + 0.1 * window_duration_factor  # longer = better
+  2. Compute visibility windows over the next N nights (visibility.windows). Sun, Moon
+     and planets are tracked step by step through a ``SolarSystemEphemeris`` fitted to
+     the scan range, so a 7-day Moon scan follows its ~13 deg/day motion; registered
+     comets and asteroids are propagated from their orbital elements the same way.
+  3. Fetch the conditions forecast and score every window on a 0..1 scale:
+       0.40 * (1 - cloud_cover)       # optical clarity
+     + 0.20 * peak_altitude_factor    # higher-up = lower air mass
+     + 0.15 * seeing_factor           # 1.0 at 0.3\" → 0.1 at 3\"
+     + 0.10 * transparency_factor     # 1.0 at 0.25 mag/airmass → 0.2 at 1.05
+     + 0.05 * wind_factor             # 1.0 calm → 0.0 at settings.max_wind_speed_mps
+     + 0.10 * window_duration_factor  # longer = better
+     The conditions factors are time-weighted means over every forecast hour the
+     window overlaps (``ForecastSeries.window_means``, all windows in one pass), so a
+     window that clouds over halfway through scores worse than a clear one. A factor
+     with no forecast data behind it counts as a middling 0.5.
   4. Sort descending; return up to ``limit`` results.
 
 If conditions are unavailable (all providers down), windows are still returned with
@@ -20,16 +29,27 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 
-from auto_telescope.catalog.targets import Target, resolve_target
+import numpy as np
+
+from auto_telescope.catalog.ephemeris import SolarSystemEphemeris
+from auto_telescope.catalog.minor_bodies import default_minor_bodies
+from auto_telescope.catalog.resolver import TargetResolver
+from auto_telescope.catalog.solar_system import is_solar_system_body
+from auto_telescope.catalog.targets import Target, TargetType, resolve_target
 from auto_telescope.conditions.aggregator import (
     AllProvidersDownError,
     ConditionsAggregator,
     ConditionsForecast,
 )
+from auto_telescope.conditions.series import ForecastSeries
 from auto_telescope.config.settings import get_settings
 from auto_telescope.config.site import MVHS_SITE, Site
+from auto_telescope.visibility.coordinates import CoordinateProvider
 from auto_telescope.visibility.windows import VisibilityWindow, compute_windows
 
+# Score weights of the forecast-driven factors; altitude and duration make up the rest.
+_CONDITIONS_WEIGHTS = {"cloud": 0.40, "seeing": 0.15, "transparency": 0.10, "wind": 0.05}
+
 
 @dataclass(frozen=True, slots=True)
 class ScoredWindow:
@@ -51,6 +71,7 @@ def find_best_windows(
     min_altitude_deg: float | None = None,
     min_window_minutes: int | None = None,
     aggregator: ConditionsAggregator | None = None,
+    resolver: TargetResolver | None = None,
     now: datetime | None = None,
 ) -> list[ScoredWindow]:
     """Return the top-N best observation windows for ``target_name`` over the next ``days``.
@@ -63,6 +84,9 @@ def find_best_windows(
         min_altitude_deg: Override settings.min_altitude_deg.
         min_window_minutes: Override settings.min_observation_minutes.
         aggregator:  Optional pre-built ConditionsAggregator (for tests).
+        resolver:    Optional TargetResolver. When given, SIMBAD lookups are bounded by
+                     its latency budget and a slow lookup raises TargetPendingError
+                     instead of stalling the call.
         now:         Override "now" (UTC). For determinism in tests.
     """
     settings = get_settings()
@@ -71,61 +95,107 @@ def find_best_windows(
         min_window_minutes if min_window_minutes is not None else settings.min_observation_minutes
     )
 
-    target = resolve_target(target_name, when_utc=now, site=site)
+    if resolver is not None:
+        target = resolver.resolve(target_name, when_utc=now, site=site).require()
+    else:
+        target = resolve_target(target_name, when_utc=now, site=site)
 
     start = (now or datetime.now(UTC)).astimezone(UTC)
     end = start + timedelta(days=days)
 
     windows = compute_windows(
-        target.equatorial(),
+        _coordinates_for(target, site=site, start_utc=start, end_utc=end),
         site=site,
         start_utc=start,
         end_utc=end,
         step_minutes=15,
         min_altitude_deg=min_alt,
+        # The Moon can't be kept 5 deg away from itself.
+        min_moon_separation_deg=0.0 if target.target_type == TargetType.MOON else 5.0,
+        min_sun_separation_deg=settings.sun_avoidance_deg,
         min_window_minutes=min_dur,
     )
     if not windows:
         return []
 
-    forecasts: list[ConditionsForecast] = []
+    series: ForecastSeries | None = None
     if aggregator is None:
-        aggregator = ConditionsAggregator()
+        aggregator = ConditionsAggregator.from_settings()
     try:
-        forecasts = aggregator.fetch(site.latitude, site.longitude)
+        series = aggregator.fetch_series(site.latitude, site.longitude)
     except AllProvidersDownError:
-        forecasts = []
-
-    scored: list[ScoredWindow] = []
-    for w in windows:
-        forecast = _forecast_for_window(forecasts, w)
-        score, breakdown = _score(w, forecast)
-        scored.append(
-            ScoredWindow(
-                target=target,
-                window=w,
-                score=score,
-                forecast=forecast,
-                score_breakdown=breakdown,
-            )
+        series = None
+
+    factors = _conditions_factors(series, windows, max_wind_speed_mps=settings.max_wind_speed_mps)
+    ranked = sorted(
+        (
+            (*_score(w, {name: float(column[i]) for name, column in factors.items()}), w)
+            for i, w in enumerate(windows)
+        ),
+        key=lambda item: item[0],
+        reverse=True,
+    )
+    # Forecast objects only for the windows actually returned.
+    return [
+        ScoredWindow(
+            target=target,
+            window=w,
+            score=score,
+            forecast=_forecast_for_window(series, w),
+            score_breakdown=breakdown,
         )
+        for score, breakdown, w in ranked[:limit]
+    ]
+
 
-    scored.sort(key=lambda sw: sw.score, reverse=True)
-    return scored[:limit]
+def _coordinates_for(
+    target: Target, *, site: Site, start_utc: datetime, end_utc: datetime
+) -> CoordinateProvider:
+    """Fixed RA/Dec for catalog targets; per-step ephemeris positions for moving bodies."""
+    if target.target_type in (TargetType.ASTEROID, TargetType.COMET):
+        return default_minor_bodies().provider(target.id, site=site)
+    if not is_solar_system_body(target.id):
+        return target.equatorial()
+    key = target.id.strip().lower()
+    ephemeris = SolarSystemEphemeris.build(site, start_utc, end_utc, bodies=(key,))
+    return ephemeris.provider(key)
 
 
 def _forecast_for_window(
-    forecasts: list[ConditionsForecast], window: VisibilityWindow
+    series: ForecastSeries | None, window: VisibilityWindow
 ) -> ConditionsForecast | None:
-    if not forecasts:
+    if series is None:
         return None
-    # Find the forecast bucket nearest to the window's peak time.
-    peak = window.peak_time_utc
-    return min(forecasts, key=lambda f: abs((f.hour_utc - peak).total_seconds()))
+    # The forecast bucket nearest to the window's peak time.
+    return series.nearest(window.peak_time_utc)
+
+
+def _conditions_factors(
+    series: ForecastSeries | None,
+    windows: list[VisibilityWindow],
+    *,
+    max_wind_speed_mps: float,
+) -> dict[str, np.ndarray]:
+    """Per-window cloud/seeing/transparency/wind factors, 0.5 where nothing is known."""
+    if series is None:
+        return {name: np.full(len(windows), 0.5) for name in _CONDITIONS_WEIGHTS}
+    mean = series.window_means(
+        ("cloud_cover_pct", "seeing_arcsec", "transparency_mag", "wind_speed_mps"),
+        [w.start_utc for w in windows],
+        [w.end_utc for w in windows],
+    )
+    factors = {
+        "cloud": 1.0 - mean["cloud_cover_pct"] / 100.0,
+        # 0.3" → 1.0, 3" → 0.1
+        "seeing": 1.1 - mean["seeing_arcsec"] / 3.0,
+        "transparency": 1.25 - mean["transparency_mag"],
+        "wind": 1.0 - mean["wind_speed_mps"] / max(max_wind_speed_mps, 1e-9),
+    }
+    return {name: np.nan_to_num(np.clip(f, 0.0, 1.0), nan=0.5) for name, f in factors.items()}
 
 
 def _score(
-    window: VisibilityWindow, forecast: ConditionsForecast | None
+    window: VisibilityWindow, conditions: dict[str, float]
 ) -> tuple[float, dict[str, float]]:
     breakdown: dict[str, float] = {}
     altitude_factor = max(0.0, min(1.0, (window.peak_altitude_deg - 20.0) / 60.0))
@@ -133,23 +203,9 @@ def _score(
 
     duration_factor = min(1.0, window.duration_minutes / 120.0)
     breakdown["duration"] = duration_factor
+    breakdown.update(conditions)
 
-    if forecast is None:
-        cloud_factor = 0.5  # unknown → middling
-        seeing_factor = 0.5
-    else:
-        cloud_factor = max(0.0, 1.0 - forecast.cloud_cover_pct / 100.0)
-        if forecast.seeing_arcsec is None:
-            seeing_factor = 0.5
-        else:
-            # 0.5" → 1.0, 3" → ~0.2
-            seeing_factor = max(0.0, min(1.0, 1.1 - (forecast.seeing_arcsec / 3.0)))
-
-    breakdown["cloud"] = cloud_factor
-    breakdown["seeing"] = seeing_factor
-
-    score = (
-        0.50 * cloud_factor + 0.20 * altitude_factor + 0.20 * seeing_factor + 0.10 * duration_factor
-    )
+    score = 0.20 * altitude_factor + 0.10 * duration_factor
+    score += sum(weight * conditions[name] for name, weight in _CONDITIONS_WEIGHTS.items())
     breakdown["total"] = score
     return score, breakdown
@@ -0,0 +1,205 @@
+"""whats_up_now: "what can we point at right now?", ranked, for a whole catalog.
+
+Calling ``is_visible`` per target costs an astropy transform plus a ``get_body`` each.
+Here every row is handled in one pass:
+
+  1. Feasibility (tier, magnitude floor, culmination altitude) as NumPy masks via
+     ``assess_feasibility_many``.
+  2. Sun, Moon and planet positions from a Chebyshev ``SolarSystemEphemeris`` fitted
+     once per site and UTC day (microseconds per call after the first).
+  3. One ICRS → Alt/Az transform for catalog rows, planets and the Sun together.
+  4. Moon separation as a dot product of unit vectors.
+
+Visible rows are ranked easiest tier first, then by altitude (lower air mass).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, timedelta
+from functools import lru_cache
+
+import numpy as np
+from astropy import units as u
+from astropy.coordinates import AltAz, SkyCoord
+from astropy.time import Time
+
+from auto_telescope.catalog.columnar import CatalogTable
+from auto_telescope.catalog.curated import CURATED_TARGETS
+from auto_telescope.catalog.ephemeris import SolarSystemEphemeris, radec_to_unit_vectors
+from auto_telescope.catalog.feasibility import DEFAULT_MAG_LIMIT, assess_feasibility_many
+from auto_telescope.catalog.solar_system import SOLAR_SYSTEM_BODIES
+from auto_telescope.catalog.targets import Target, TargetType, Tier
+from auto_telescope.config.settings import Settings, get_settings
+from auto_telescope.config.site import MVHS_SITE, Site
+
+
+@dataclass(frozen=True, slots=True)
+class SkyConstraints:
+    """Filters for ``whats_up_now``. Defaults match ``is_visible``."""
+
+    min_altitude_deg: float = 20.0
+    require_sun_below_deg: float = 6.0
+    min_moon_separation_deg: float = 5.0
+    magnitude_limit: float = DEFAULT_MAG_LIMIT
+    max_tier: Tier = Tier.CHALLENGING
+    include_solar_system: bool = True
+    limit: int | None = 25
+
+    @classmethod
+    def from_settings(cls, settings: Settings | None = None) -> SkyConstraints:
+        s = settings or get_settings()
+        return cls(min_altitude_deg=s.min_altitude_deg)
+
+
+@dataclass(frozen=True, slots=True)
+class SkyEntry:
+    """One target that is observable right now."""
+
+    target: Target
+    altitude_deg: float
+    azimuth_deg: float
+    moon_separation_deg: float | None  # None for the Moon itself
+
+
+@dataclass(frozen=True, slots=True)
+class SkyReport:
+    """Ranked answer to "what's up?" at one instant."""
+
+    when_utc: datetime
+    site: Site
+    sun_altitude_deg: float
+    moon_altitude_deg: float
+    entries: tuple[SkyEntry, ...]
+    considered: int  # rows evaluated (catalog + solar system)
+    reason: str = "ok"  # "ok" or why nothing can be observed
+
+
+@lru_cache(maxsize=1)
+def _curated_table() -> CatalogTable:
+    return CatalogTable.from_targets(CURATED_TARGETS)
+
+
+@lru_cache(maxsize=4)
+def _daily_ephemeris(site: Site, day: date) -> SolarSystemEphemeris:
+    start = datetime(day.year, day.month, day.day, tzinfo=UTC)
+    return SolarSystemEphemeris.build(site, start, start + timedelta(days=1))
+
+
+def _solar_system_table(ephemeris: SolarSystemEphemeris, when_utc: datetime) -> CatalogTable:
+    targets = []
+    for key, spec in SOLAR_SYSTEM_BODIES.items():
+        ra, dec = ephemeris.radec_at(key, when_utc)
+        targets.append(
+            Target(
+                id=str(spec["id"]),
+                display_name=str(spec["display_name"]),
+                target_type=TargetType(spec["target_type"]),
+                ra_deg=ra,
+                dec_deg=dec,
+                magnitude=None,
+                angular_size_arcmin=None,
+                tier=Tier(spec["tier"]),
+                description=str(spec.get("description", "")),
+            )
+        )
+    return CatalogTable.from_targets(targets)
+
+
+def whats_up_now(
+    site: Site = MVHS_SITE,
+    when: datetime | None = None,
+    constraints: SkyConstraints | None = None,
+    *,
+    catalog: CatalogTable | None = None,
+) -> SkyReport:
+    """Rank everything observable from ``site`` at ``when`` (default: now).
+
+    Args:
+        site:        Observing site.
+        when:        UTC instant; naive datetimes are taken as UTC.
+        constraints: Altitude / Sun / Moon / feasibility filters (default: SkyConstraints()).
+        catalog:     Rows to consider (default: the curated catalog). Build a
+                     ``CatalogTable`` once for an offline catalog and reuse it.
+    """
+    c = constraints or SkyConstraints()
+    when = when or datetime.now(UTC)
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=UTC)
+    when = when.astimezone(UTC)
+    table = catalog if catalog is not None else _curated_table()
+
+    ephemeris = _daily_ephemeris(site, when.date())
+    solar = _solar_system_table(ephemeris, when)
+    n_cat = len(table)
+
+    # One transform for everything: catalog rows, then solar-system rows (Sun included).
+    ra = np.concatenate([table.ra_deg, solar.ra_deg])
+    dec = np.concatenate([table.dec_deg, solar.dec_deg])
+    frame = AltAz(obstime=Time(when), location=site.to_earth_location())
+    altaz = SkyCoord(ra=ra * u.deg, dec=dec * u.deg, frame="icrs").transform_to(frame)
+    alt = altaz.alt.to(u.deg).value
+    az = altaz.az.to(u.deg).value
+
+    body_row = {t.id: n_cat + i for i, t in enumerate(solar.targets)}
+    sun_alt = float(alt[body_row["sun"]])
+    moon_alt = float(alt[body_row["moon"]])
+    considered = n_cat + (len(solar) if c.include_solar_system else 0)
+
+    if sun_alt >= -c.require_sun_below_deg:
+        return SkyReport(
+            when_utc=when,
+            site=site,
+            sun_altitude_deg=sun_alt,
+            moon_altitude_deg=moon_alt,
+            entries=(),
+            considered=considered,
+            reason=f"sun above {-c.require_sun_below_deg:.0f} deg (alt={sun_alt:.1f})",
+        )
+
+    moon_vec = radec_to_unit_vectors(*ephemeris.radec("moon", when))[0]
+    cos_sep = np.clip(radec_to_unit_vectors(ra, dec) @ moon_vec, -1.0, 1.0)
+    moon_sep = np.degrees(np.arccos(cos_sep))
+
+    feasible = [
+        assess_feasibility_many(
+            t,
+            site=site,
+            magnitude_limit=c.magnitude_limit,
+            safety_horizon_deg=c.min_altitude_deg,
+        ).feasible
+        for t in (table, solar)
+    ]
+    if not c.include_solar_system:
+        feasible[1][:] = False
+    ok = np.concatenate(feasible)
+    tier = np.concatenate([table.tier, solar.tier])
+    is_moon = np.zeros(ra.size, dtype=bool)
+    is_moon[body_row["moon"]] = True
+
+    ok &= tier <= c.max_tier
+    ok &= alt >= c.min_altitude_deg
+    ok &= is_moon | (moon_sep >= c.min_moon_separation_deg)
+
+    rows = np.flatnonzero(ok)
+    rows = rows[np.lexsort((-alt[rows], tier[rows]))]
+    if c.limit is not None:
+        rows = rows[: c.limit]
+
+    entries = tuple(
+        SkyEntry(
+            target=table.targets[i] if i < n_cat else solar.targets[i - n_cat],
+            altitude_deg=float(alt[i]),
+            azimuth_deg=float(az[i]),
+            moon_separation_deg=None if is_moon[i] else float(moon_sep[i]),
+        )
+        for i in (int(r) for r in rows)
+    )
+    return SkyReport(
+        when_utc=when,
+        site=site,
+        sun_altitude_deg=sun_alt,
+        moon_altitude_deg=moon_alt,
+        entries=entries,
+        considered=considered,
+    )
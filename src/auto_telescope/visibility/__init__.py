@@ -5,6 +5,7 @@ Pure-local computations using astropy. No network access.
 
 from auto_telescope.visibility.coordinates import (
     AltAzPosition,
+    CoordinateProvider,
     EquatorialCoord,
     altaz_to_radec,
     angular_separation_deg,
@@ -26,6 +27,7 @@ from auto_telescope.visibility.windows import (
 
 __all__ = [
     "AltAzPosition",
+    "CoordinateProvider",
     "EquatorialCoord",
     "VisibilityVerdict",
     "VisibilityWindow",
@@ -10,6 +10,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import UTC, datetime
+from typing import Protocol
 
 import numpy as np
 from astropy import units as u
@@ -36,6 +37,24 @@ class EquatorialCoord:
     def to_skycoord(self) -> SkyCoord:
         return SkyCoord(ra=self.ra_deg * u.deg, dec=self.dec_deg * u.deg, frame="icrs")
 
+    def radec_many(self, unix_seconds: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """The same position at every instant, so a fixed coord is a CoordinateProvider."""
+        shape = np.shape(unix_seconds)
+        return np.full(shape, self.ra_deg), np.full(shape, self.dec_deg)
+
+
+class CoordinateProvider(Protocol):
+    """Anything that can give RA/Dec (degrees) for an array of instants (unix seconds).
+
+    ``EquatorialCoord`` is the fixed case; ``catalog.ephemeris.EphemerisCoordinates``
+    covers moving solar-system bodies.
+    """
+
+    def radec_many(
+        self, unix_seconds: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:  # pragma: no cover - Protocol
+        ...
+
 
 @dataclass(frozen=True, slots=True)
 class AltAzPosition:
@@ -1,18 +1,34 @@
 """Compute observation windows: contiguous runs of time when a target is visible.
 
-Walks a time grid (default 5-min steps) over a date range, calls ``is_visible`` at
-each step, and returns the contiguous "visible" segments at least
+Builds a time grid (default 5-min steps) over a date range, applies the same rules as
+``is_visible`` at every step, and returns the contiguous "visible" segments at least
 ``min_window_minutes`` long.
+
+The whole grid is evaluated in one vectorized astropy pass: target Alt/Az, Sun
+altitude and Moon separation are each a single transform over every step. Targets can
+be a fixed ``EquatorialCoord`` or any ``CoordinateProvider`` (e.g. an ephemeris-backed
+planet), whose positions are also evaluated for the whole grid in one call.
 """
 
 from __future__ import annotations
 
+import warnings
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 
+import numpy as np
+from astropy import units as u
+from astropy.coordinates import (
+    AltAz,
+    NonRotationTransformationWarning,
+    SkyCoord,
+    get_body,
+    get_sun,
+)
+from astropy.time import Time
+
 from auto_telescope.config.site import Site
-from auto_telescope.visibility.coordinates import EquatorialCoord
-from auto_telescope.visibility.rules import is_visible
+from auto_telescope.visibility.coordinates import CoordinateProvider
 
 
 @dataclass(frozen=True, slots=True)
@@ -30,7 +46,7 @@ class VisibilityWindow:
 
 
 def compute_windows(
-    coord: EquatorialCoord,
+    coord: CoordinateProvider,
     *,
     site: Site,
     start_utc: datetime,
@@ -38,9 +54,15 @@ def compute_windows(
     step_minutes: int = 5,
     min_altitude_deg: float = 20.0,
     require_sun_below_deg: float = 6.0,
+    min_moon_separation_deg: float = 5.0,
+    min_sun_separation_deg: float = 0.0,
     min_window_minutes: int = 30,
 ) -> list[VisibilityWindow]:
-    """Walk the time grid and return all visibility windows >= min_window_minutes."""
+    """Evaluate the time grid and return all visibility windows >= min_window_minutes.
+
+    ``coord`` may be a fixed ``EquatorialCoord`` or a moving-body provider; positions
+    are taken per step, so altitude and Moon/Sun separation follow the target.
+    """
     if start_utc.tzinfo is None:
         start_utc = start_utc.replace(tzinfo=UTC)
     if end_utc.tzinfo is None:
@@ -49,58 +71,74 @@ def compute_windows(
         return []
 
     step = timedelta(minutes=step_minutes)
-    windows: list[VisibilityWindow] = []
+    n_steps = int((end_utc - start_utc) // step) + 1
+    offsets = np.arange(n_steps) * step.total_seconds()
+    unix = start_utc.timestamp() + offsets
 
-    current_start: datetime | None = None
-    peak_alt = -90.0
-    peak_time: datetime | None = None
-
-    t = start_utc
-    while t <= end_utc:
-        verdict = is_visible(
-            coord,
-            t,
-            site,
-            min_altitude_deg=min_altitude_deg,
-            require_sun_below_deg=require_sun_below_deg,
-        )
-        if verdict.visible:
-            if current_start is None:
-                current_start = t
-                peak_alt = verdict.altitude_deg
-                peak_time = t
-            elif verdict.altitude_deg > peak_alt:
-                peak_alt = verdict.altitude_deg
-                peak_time = t
-        else:
-            if current_start is not None and peak_time is not None:
-                window_end = t
-                duration_min = (window_end - current_start).total_seconds() / 60.0
-                if duration_min >= min_window_minutes:
-                    windows.append(
-                        VisibilityWindow(
-                            start_utc=current_start,
-                            end_utc=window_end,
-                            peak_altitude_deg=peak_alt,
-                            peak_time_utc=peak_time,
-                        )
-                    )
-                current_start = None
-                peak_alt = -90.0
-                peak_time = None
-        t += step
-
-    # Close any open window at the end.
-    if current_start is not None and peak_time is not None:
-        duration_min = (end_utc - current_start).total_seconds() / 60.0
-        if duration_min >= min_window_minutes:
-            windows.append(
-                VisibilityWindow(
-                    start_utc=current_start,
-                    end_utc=end_utc,
-                    peak_altitude_deg=peak_alt,
-                    peak_time_utc=peak_time,
-                )
-            )
+    visible, altitude = _visibility_grid(
+        coord,
+        unix,
+        site,
+        min_altitude_deg=min_altitude_deg,
+        require_sun_below_deg=require_sun_below_deg,
+        min_moon_separation_deg=min_moon_separation_deg,
+        min_sun_separation_deg=min_sun_separation_deg,
+    )
 
+    def at(i: int) -> datetime:
+        return start_utc + i * step
+
+    windows: list[VisibilityWindow] = []
+    # Run boundaries: +1 where a visible run starts, -1 one past where it ends.
+    edges = np.diff(np.concatenate(([0], visible.astype(np.int8), [0])))
+    for first, stop in zip(np.flatnonzero(edges == 1), np.flatnonzero(edges == -1), strict=True):
+        window_start = at(int(first))
+        # A run cut off by the end of the grid closes at end_utc, not at the next step.
+        window_end = at(int(stop)) if stop < n_steps else end_utc
+        duration_min = (window_end - window_start).total_seconds() / 60.0
+        if duration_min < min_window_minutes:
+            continue
+        peak = int(first) + int(np.argmax(altitude[first:stop]))
+        windows.append(
+            VisibilityWindow(
+                start_utc=window_start,
+                end_utc=window_end,
+                peak_altitude_deg=float(altitude[peak]),
+                peak_time_utc=at(peak),
+            )
+        )
     return windows
+
+
+def _visibility_grid(
+    coord: CoordinateProvider,
+    unix: np.ndarray,
+    site: Site,
+    *,
+    min_altitude_deg: float,
+    require_sun_below_deg: float,
+    min_moon_separation_deg: float,
+    min_sun_separation_deg: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Per-step (visible mask, target altitude in degrees)."""
+    ra, dec = coord.radec_many(unix)
+    times = Time(unix, format="unix", scale="utc")
+    location = site.to_earth_location()
+    frame = AltAz(obstime=times, location=location)
+
+    target = SkyCoord(ra=ra * u.deg, dec=dec * u.deg, frame="icrs")
+    altitude = target.transform_to(frame).alt.to(u.deg).value
+
+    sun = get_sun(times)
+    visible = sun.transform_to(frame).alt.to(u.deg).value < -require_sun_below_deg
+    visible &= altitude >= min_altitude_deg
+    # Same GCRS-frame separation as ``is_visible``; silence the per-call warning, which
+    # would otherwise print the whole obstime array.
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", NonRotationTransformationWarning)
+        if min_moon_separation_deg > 0.0:
+            moon = get_body("moon", times, location)
+            visible &= moon.separation(target).to(u.deg).value >= min_moon_separation_deg
+        if min_sun_separation_deg > 0.0:
+            visible &= sun.separation(target).to(u.deg).value >= min_sun_separation_deg
+    return visible, altitude
@@ -0,0 +1,176 @@
+"""Hypothesis property tests for the hourly provider merge.
+
+Invariants:
+  * ``merge_hourly(...).forecasts()`` equals what the original per-hour dict bucket
+    merge produced, for any mix of slots (gaps, duplicate hours, missing values,
+    non-UTC offsets).
+  * ``ForecastSeries.nearest`` picks what a ``min`` scan over the forecast list picks.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta, timezone
+from typing import Any
+
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from auto_telescope.conditions.aggregator import ConditionsForecast
+from auto_telescope.conditions.grid import merge_hourly
+from auto_telescope.conditions.nws import NWSSlot
+from auto_telescope.conditions.open_meteo import OpenMeteoSlot
+from auto_telescope.conditions.series import ForecastSeries
+from auto_telescope.conditions.seven_timer import SevenTimerSlot
+
+T0 = datetime(2026, 4, 1, tzinfo=UTC)
+values = st.floats(min_value=0.0, max_value=100.0, allow_nan=False)
+# Minutes so that slots land mid-hour and on shared hours.
+offsets = st.integers(min_value=0, max_value=48 * 60).map(lambda m: timedelta(minutes=m))
+
+
+@st.composite
+def seven_slots(draw):  # type: ignore[no-untyped-def]
+    return SevenTimerSlot(
+        timestamp_utc=T0 + draw(offsets),
+        cloud_cover_pct=draw(values),
+        seeing_arcsec=draw(values),
+        transparency_mag=draw(values),
+        wind10m_mps=draw(values),
+        relative_humidity_pct=draw(values),
+        temperature_c=draw(values),
+    )
+
+
+@st.composite
+def nws_slots(draw):  # type: ignore[no-untyped-def]
+    start = T0 + draw(offsets)
+    tz = draw(st.sampled_from([UTC, timezone(timedelta(hours=-7)), None]))
+    start = start.replace(tzinfo=None) if tz is None else start.astimezone(tz)
+    return NWSSlot(
+        start_utc=start,
+        end_utc=start + timedelta(hours=1),
+        temperature_c=draw(values),
+        wind_speed_mps=draw(values),
+        wind_direction_deg=None,
+        short_forecast="Clear",
+        cloud_cover_pct=draw(st.none() | values),
+        precipitation_probability_pct=None,
+    )
+
+
+@st.composite
+def meteo_slots(draw):  # type: ignore[no-untyped-def]
+    return OpenMeteoSlot(
+        timestamp_utc=T0 + draw(offsets),
+        cloud_cover_pct=draw(values),
+        visibility_m=draw(values),
+        wind_speed_mps=draw(values),
+    )
+
+
+@given(
+    st.lists(seven_slots(), max_size=12),
+    st.lists(nws_slots(), max_size=24),
+    st.lists(meteo_slots(), max_size=24),
+)
+@settings(max_examples=300, deadline=None)
+def test_grid_merge_matches_bucket_merge(
+    seven: list[SevenTimerSlot], nws: list[NWSSlot], meteo: list[OpenMeteoSlot]
+) -> None:
+    assert merge_hourly(seven, nws, meteo, issued_utc=T0).forecasts() == _bucket_merge(
+        seven, nws, meteo, T0
+    )
+
+
+@given(
+    st.lists(meteo_slots(), min_size=1, max_size=24),
+    st.integers(min_value=-6 * 60, max_value=54 * 60),
+)
+@settings(max_examples=300, deadline=None)
+def test_nearest_matches_linear_scan(meteo: list[OpenMeteoSlot], minutes: int) -> None:
+    series = ForecastSeries(merge_hourly([], [], meteo))
+    when = T0 + timedelta(minutes=minutes)
+    scanned = min(series.forecasts(), key=lambda f: abs((f.hour_utc - when).total_seconds()))
+    assert series.nearest(when) == scanned
+
+
+# ---- The original dict-bucket merge, kept verbatim as the reference -------------------
+
+
+def _bucket_merge(
+    seven: list[SevenTimerSlot], nws: list[NWSSlot], meteo: list[OpenMeteoSlot], issued: datetime
+) -> list[ConditionsForecast]:
+    buckets: dict[datetime, dict[str, Any]] = {}
+    for s in seven:
+        base = _hour_floor(s.timestamp_utc)
+        for offset in range(3):
+            hr = base + timedelta(hours=offset)
+            b = buckets.setdefault(hr, _empty_bucket(hr))
+            _bump_max(b, "cloud_cover_pct", s.cloud_cover_pct)
+            _bump_max(b, "wind_speed_mps", s.wind10m_mps)
+            b["seeing_arcsec"] = s.seeing_arcsec
+            b["transparency_mag"] = s.transparency_mag
+            if b.get("temperature_c") is None:
+                b["temperature_c"] = s.temperature_c
+            if b.get("relative_humidity_pct") is None:
+                b["relative_humidity_pct"] = s.relative_humidity_pct
+            b["providers"].add("7timer")
+    for n in nws:
+        hr = _hour_floor(n.start_utc)
+        b = buckets.setdefault(hr, _empty_bucket(hr))
+        if n.cloud_cover_pct is not None:
+            _bump_max(b, "cloud_cover_pct", n.cloud_cover_pct)
+        _bump_max(b, "wind_speed_mps", n.wind_speed_mps)
+        if b.get("temperature_c") is None:
+            b["temperature_c"] = n.temperature_c
+        b["providers"].add("nws")
+    for m in meteo:
+        hr = _hour_floor(m.timestamp_utc)
+        b = buckets.setdefault(hr, _empty_bucket(hr))
+        _bump_max(b, "cloud_cover_pct", m.cloud_cover_pct)
+        _bump_max(b, "wind_speed_mps", m.wind_speed_mps)
+        b["visibility_m"] = m.visibility_m
+        b["providers"].add("open-meteo")
+    return sorted(
+        (
+            ConditionsForecast(
+                hour_utc=b["hour_utc"],
+                cloud_cover_pct=float(b["cloud_cover_pct"]),
+                wind_speed_mps=float(b["wind_speed_mps"]),
+                seeing_arcsec=b["seeing_arcsec"],
+                transparency_mag=b["transparency_mag"],
+                visibility_m=b["visibility_m"],
+                temperature_c=b["temperature_c"],
+                relative_humidity_pct=b["relative_humidity_pct"],
+                contributing_providers=tuple(sorted(b["providers"])),
+                issued_utc=issued,
+            )
+            for b in buckets.values()
+        ),
+        key=lambda f: f.hour_utc,
+    )
+
+
+def _hour_floor(dt: datetime) -> datetime:
+    dt = dt.replace(tzinfo=UTC) if dt.tzinfo is None else dt.astimezone(UTC)
+    return dt.replace(minute=0, second=0, microsecond=0)
+
+
+def _empty_bucket(hr: datetime) -> dict[str, Any]:
+    return {
+        "hour_utc": hr,
+        "cloud_cover_pct": 0.0,
+        "wind_speed_mps": 0.0,
+        "seeing_arcsec": None,
+        "transparency_mag": None,
+        "visibility_m": None,
+        "temperature_c": None,
+        "relative_humidity_pct": None,
+        "providers": set(),
+    }
+
+
+def _bump_max(bucket: dict[str, Any], key: str, value: float) -> None:
+    current = bucket.get(key)
+    if current is None or value > current:
+        bucket[key] = value
@@ -0,0 +1,61 @@
+"""Hypothesis property tests for the fast ISO-8601 parsers.
+
+Invariant: ``parse_iso`` and ``parse_iso_many`` return what ``dateutil``'s ``isoparse``
+returns (same instant, same naive/aware-ness, same UTC offset) for every timestamp
+format the providers send, mixed or not.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+from dateutil import parser as date_parser
+from hypothesis import given
+from hypothesis import strategies as st
+
+from auto_telescope.conditions.isotime import parse_iso, parse_iso_many
+
+moments = st.datetimes(min_value=datetime(1990, 1, 1), max_value=datetime(2100, 1, 1))
+offsets = st.integers(min_value=-14 * 4, max_value=14 * 4).map(
+    lambda quarters: timezone(timedelta(minutes=15 * quarters))
+)
+
+
+@st.composite
+def iso_strings(draw):  # type: ignore[no-untyped-def]
+    when = draw(moments).replace(microsecond=0)
+    style = draw(st.sampled_from(["minutes", "seconds", "zulu", "offset", "date"]))
+    if style == "minutes":  # Open-Meteo
+        return when.strftime("%Y-%m-%dT%H:%M")
+    if style == "seconds":
+        return when.isoformat()
+    if style == "zulu":
+        return when.strftime("%Y-%m-%dT%H:%M:%SZ")
+    if style == "date":
+        return when.strftime("%Y-%m-%d")
+    return when.replace(tzinfo=draw(offsets)).isoformat()  # NWS
+
+
+def same(a: datetime, b: datetime) -> bool:
+    return a == b and a.utcoffset() == b.utcoffset() and (a.tzinfo is None) == (b.tzinfo is None)
+
+
+@given(iso_strings())
+def test_parse_iso_matches_dateutil(text: str) -> None:
+    assert same(parse_iso(text), date_parser.isoparse(text))
+
+
+@given(st.lists(iso_strings(), max_size=20))
+def test_parse_iso_many_matches_dateutil(texts: list[str]) -> None:
+    parsed = parse_iso_many(texts)
+    expected = [date_parser.isoparse(t) for t in texts]
+    assert len(parsed) == len(expected)
+    assert all(same(a, b) for a, b in zip(parsed, expected, strict=True))
+
+
+@given(st.lists(moments, min_size=1, max_size=20))
+def test_offset_free_columns_take_the_numpy_path(whens: list[datetime]) -> None:
+    texts = [w.strftime("%Y-%m-%dT%H:%M") for w in whens]
+    parsed = parse_iso_many(texts)
+    assert all(p.tzinfo is None for p in parsed)
+    assert parsed == [w.replace(second=0, microsecond=0) for w in whens]
@@ -13,6 +13,7 @@ from astropy import units as u
 from astropy.coordinates import AltAz, SkyCoord
 from astropy.time import Time
 
+from auto_telescope.conditions.aggregator import ConditionsForecast
 from auto_telescope.config.site import MVHS_SITE
 from auto_telescope.safety.interlocks import (
     check_horizon,
@@ -112,3 +113,21 @@ def test_wind_check_refuses_on_no_forecast() -> None:
     """Defense in depth: missing forecast → refuse."""
     r = check_wind(None, max_wind_speed_mps=15.0)
     assert not r.safe
+
+
+def test_wind_check_refuses_on_unknown_forecast_age() -> None:
+    """Fail closed: with an age limit configured, a forecast of unknown age is refused."""
+    undated = ConditionsForecast(
+        hour_utc=datetime(2026, 7, 4, 6, tzinfo=UTC),
+        cloud_cover_pct=0.0,
+        wind_speed_mps=1.0,
+        seeing_arcsec=1.0,
+        transparency_mag=0.4,
+        visibility_m=20000.0,
+        temperature_c=20.0,
+        relative_humidity_pct=40.0,
+        contributing_providers=("open-meteo",),
+    )
+    r = check_wind(undated, max_wind_speed_mps=15.0, max_forecast_age_seconds=7200)
+    assert not r.safe
+    assert r.code == "forecast_age_unknown"
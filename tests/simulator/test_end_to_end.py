@@ -7,12 +7,17 @@ stub that returns deterministic forecasts.
 
 from __future__ import annotations
 
+from dataclasses import replace
 from datetime import UTC, datetime, timedelta
 from unittest.mock import patch
 
 import pytest
+from astropy import units as u
+from astropy.coordinates import AltAz, get_body
+from astropy.time import Time
 
 from auto_telescope.conditions.aggregator import ConditionsAggregator, ConditionsForecast
+from auto_telescope.conditions.series import ForecastSeries
 from auto_telescope.config.site import MVHS_SITE
 from auto_telescope.scheduler.best_time import find_best_windows
 
@@ -39,9 +44,9 @@ def _stub_forecasts(start: datetime, hours: int = 168) -> list[ConditionsForecas
 def test_find_best_windows_for_polaris_returns_results() -> None:
     """Polaris is circumpolar; we should always get at least 1 window per night."""
     now = datetime(2026, 7, 4, 0, tzinfo=UTC)
-    stub = _stub_forecasts(now, hours=24 * 8)
+    stub = ForecastSeries.from_forecasts(_stub_forecasts(now, hours=24 * 8))
 
-    with patch.object(ConditionsAggregator, "fetch", return_value=stub):
+    with patch.object(ConditionsAggregator, "fetch_series", return_value=stub):
         windows = find_best_windows(
             "Polaris",
             site=MVHS_SITE,
@@ -60,16 +65,31 @@ def test_find_best_windows_for_polaris_returns_results() -> None:
 
 def test_find_best_windows_for_jupiter() -> None:
     now = datetime(2026, 7, 4, 0, tzinfo=UTC)
-    stub = _stub_forecasts(now, hours=24 * 8)
-    with patch.object(ConditionsAggregator, "fetch", return_value=stub):
+    stub = ForecastSeries.from_forecasts(_stub_forecasts(now, hours=24 * 8))
+    with patch.object(ConditionsAggregator, "fetch_series", return_value=stub):
         windows = find_best_windows("Jupiter", site=MVHS_SITE, days=7, now=now)
     assert all(w.target.id == "jupiter" for w in windows)
 
 
+def test_find_best_windows_tracks_the_moon() -> None:
+    """The Moon moves ~13 deg/day; windows must follow it rather than its start position."""
+    now = datetime(2026, 7, 4, 0, tzinfo=UTC)
+    stub = ForecastSeries.from_forecasts(_stub_forecasts(now, hours=24 * 8))
+    with patch.object(ConditionsAggregator, "fetch_series", return_value=stub):
+        windows = find_best_windows("Moon", site=MVHS_SITE, days=7, limit=50, now=now)
+    assert windows, "the Moon should not be excluded by its own moon-separation check"
+
+    location = MVHS_SITE.to_earth_location()
+    for w in windows:
+        t = Time(w.window.peak_time_utc)
+        moon = get_body("moon", t, location).transform_to(AltAz(obstime=t, location=location))
+        assert w.window.peak_altitude_deg == pytest.approx(moon.alt.to(u.deg).value, abs=0.01)
+
+
 def test_find_best_windows_returns_sorted_by_score() -> None:
     now = datetime(2026, 7, 4, 0, tzinfo=UTC)
-    stub = _stub_forecasts(now, hours=24 * 8)
-    with patch.object(ConditionsAggregator, "fetch", return_value=stub):
+    stub = ForecastSeries.from_forecasts(_stub_forecasts(now, hours=24 * 8))
+    with patch.object(ConditionsAggregator, "fetch_series", return_value=stub):
         windows = find_best_windows("M13", site=MVHS_SITE, days=7, now=now)
     if len(windows) > 1:
         scores = [w.score for w in windows]
@@ -86,10 +106,30 @@ def test_find_best_windows_handles_no_forecasts() -> None:
     now = datetime(2026, 7, 4, 0, tzinfo=UTC)
     from auto_telescope.conditions.aggregator import AllProvidersDownError
 
-    with patch.object(ConditionsAggregator, "fetch", side_effect=AllProvidersDownError("test")):
+    with patch.object(
+        ConditionsAggregator, "fetch_series", side_effect=AllProvidersDownError("test")
+    ):
         windows = find_best_windows("Polaris", site=MVHS_SITE, days=2, now=now)
     assert len(windows) > 0
     for w in windows:
         # No forecast → score breakdown shows the cloud factor as the fallback 0.5.
         assert w.forecast is None
         assert w.score_breakdown["cloud"] == 0.5
+
+
+def test_window_that_clouds_over_scores_below_a_clear_one() -> None:
+    """Conditions are averaged over the whole window, not read at its peak hour."""
+    now = datetime(2026, 7, 4, 0, tzinfo=UTC)
+    clear = [replace(f, cloud_cover_pct=0.0) for f in _stub_forecasts(now, hours=24 * 3)]
+    # Overcast from 10 UTC onward every day: the back half of each night.
+    clouding = [replace(f, cloud_cover_pct=100.0) if f.hour_utc.hour >= 10 else f for f in clear]
+
+    def best(forecasts: list[ConditionsForecast]) -> list[float]:
+        series = ForecastSeries.from_forecasts(forecasts)
+        with patch.object(ConditionsAggregator, "fetch_series", return_value=series):
+            windows = find_best_windows("Polaris", site=MVHS_SITE, days=2, now=now)
+        return [w.score_breakdown["cloud"] for w in windows]
+
+    clear_cloud = best(clear)
+    assert clear_cloud and all(c == 1.0 for c in clear_cloud)
+    assert all(0.0 < c < 1.0 for c in best(clouding))
@@ -0,0 +1 @@
+"""Test and benchmark tooling: fake providers and the load harness (not shipped)."""
@@ -0,0 +1,361 @@
+"""Local stand-in for the three weather APIs, with latency and fault injection.
+
+The recorded cassettes replay instantly and never fail, so they say nothing about how
+the aggregator copes with a slow, flaky or rate-limiting provider. ``FakeProviderServer``
+is a real HTTP server on localhost that answers the way the providers do:
+
+* ``/7timer``: 7Timer! ASTRO JSON;
+* ``/points/{lat},{lon}``: the NWS gridpoint, pointing at this server's ``/hourly``;
+* ``/hourly``: NWS hourly periods;
+* ``/meteo``: Open-Meteo hourly, one result per site for comma-separated coordinates.
+
+Payloads are generated around the current hour at the real APIs' sizes (32 7Timer
+slots, 156 NWS periods, 168 Open-Meteo hours), or taken from a vcrpy cassette with
+``payloads_from_cassette``. Each route has its own ``Faults``: a log-normal response
+delay and per-request chances of a 503, a 429 with ``Retry-After``, or a body cut off
+mid-transfer (the connection is closed after half of the declared length).
+
+``FakeProviderServer.aggregator()`` returns a ``ConditionsAggregator`` pointed at it;
+``tests.support.loadtest`` drives one at scale.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import random
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+
+import requests
+
+from auto_telescope.conditions.aggregator import ConditionsAggregator
+from auto_telescope.conditions.metrics import InMemoryMetrics, MetricsSink
+from auto_telescope.conditions.nws import NWSProvider
+from auto_telescope.conditions.open_meteo import OpenMeteoProvider
+from auto_telescope.conditions.seven_timer import SevenTimerProvider
+from auto_telescope.config.http import configure_session
+
+ROUTES = ("7timer", "points", "hourly", "meteo")
+_PACIFIC = timezone(timedelta(hours=-7))  # NWS answers in the site's local time
+
+# Builds one route's JSON body for the given UTC "now" and request query.
+PayloadFactory = Callable[[datetime, dict[str, list[str]]], Any]
+
+
+@dataclass(frozen=True, slots=True)
+class Faults:
+    """How one route misbehaves. Each request draws its delay and fault independently."""
+
+    latency_seconds: float = 0.0  # median response delay
+    latency_sigma: float = 0.0  # log-normal spread; 0.5 puts p99 at ~3.2x the median
+    error_rate: float = 0.0  # answer 503
+    rate_limit_rate: float = 0.0  # answer 429 with Retry-After
+    truncate_rate: float = 0.0  # drop the connection halfway through the body
+    retry_after_seconds: int = 1
+
+    def delay(self, rng: random.Random) -> float:
+        if self.latency_seconds <= 0:
+            return 0.0
+        if self.latency_sigma <= 0:
+            return self.latency_seconds
+        return self.latency_seconds * math.exp(rng.gauss(0.0, self.latency_sigma))
+
+
+class FakeProviderServer:
+    """Threaded localhost server for 7Timer, NWS and Open-Meteo. Use as a context manager."""
+
+    def __init__(
+        self,
+        *,
+        faults: dict[str, Faults] | None = None,
+        payloads: dict[str, PayloadFactory] | None = None,
+        seed: int | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        unknown = set(faults or {}) - set(ROUTES)
+        if unknown:
+            raise ValueError(f"unknown routes {sorted(unknown)}; expected some of {ROUTES}")
+        self.faults: dict[str, Faults] = dict(faults or {})
+        self._payloads: dict[str, PayloadFactory] = {
+            "7timer": seven_timer_payload,
+            "points": self._points_payload,
+            "hourly": nws_hourly_payload,
+            "meteo": open_meteo_payload,
+        } | (payloads or {})
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.hits: Counter[str] = Counter()  # requests per route
+        self.statuses: Counter[tuple[str, int]] = Counter()  # (route, status) answered
+        self.truncated: Counter[str] = Counter()
+        self._server = ThreadingHTTPServer((host, port), self._handler())
+        self._server.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host!s}:{port}"
+
+    def start(self) -> FakeProviderServer:
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._server.serve_forever, name="fake-providers", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def close(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread = None
+
+    def __enter__(self) -> FakeProviderServer:
+        return self.start()
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def aggregator(
+        self,
+        *,
+        session: requests.Session | None = None,
+        metrics: MetricsSink | None = None,
+        timeout_seconds: float = 10.0,
+        **kwargs: Any,
+    ) -> ConditionsAggregator:
+        """A ``ConditionsAggregator`` whose providers all talk to this server.
+
+        ``kwargs`` go to ``ConditionsAggregator`` (cache, deadline_seconds, ...). Without
+        a ``session``, a pooled one is built with the usual retries but no backoff sleep.
+        """
+        session = session or configure_session(requests.Session(), backoff_seconds=0.0)
+        sink = metrics if metrics is not None else InMemoryMetrics()
+        base = self.base_url
+        return ConditionsAggregator(
+            seven_timer=SevenTimerProvider(
+                url=f"{base}/7timer", session=session, timeout_seconds=timeout_seconds, metrics=sink
+            ),
+            nws=NWSProvider(
+                points_url=base + "/points/{lat:.4f},{lon:.4f}",
+                session=session,
+                timeout_seconds=timeout_seconds,
+                metrics=sink,
+            ),
+            open_meteo=OpenMeteoProvider(
+                url=f"{base}/meteo", session=session, timeout_seconds=timeout_seconds, metrics=sink
+            ),
+            metrics=sink,
+            **kwargs,
+        )
+
+    def _points_payload(self, now: datetime, query: dict[str, list[str]]) -> Any:
+        return {"properties": {"forecastHourly": f"{self.base_url}/hourly"}}
+
+    def _draw(self, route: str) -> tuple[float, str | None]:
+        """This request's delay and fault (None, "error", "rate_limit" or "truncate")."""
+        faults = self.faults.get(route, Faults())
+        with self._lock:
+            delay = faults.delay(self._rng)
+            roll = self._rng.random()
+        for fault, rate in (
+            ("error", faults.error_rate),
+            ("rate_limit", faults.rate_limit_rate),
+            ("truncate", faults.truncate_rate),
+        ):
+            if roll < rate:
+                return delay, fault
+            roll -= rate
+        return delay, None
+
+    def _handler(self) -> type[BaseHTTPRequestHandler]:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive, as the real APIs
+            disable_nagle_algorithm = True
+
+            def do_GET(self) -> None:
+                url = urlsplit(self.path)
+                route = url.path.strip("/").split("/")[0]
+                if route not in ROUTES:
+                    self._reply(route, 404, b'{"error": "not found"}')
+                    return
+                with server._lock:
+                    server.hits[route] += 1
+                delay, fault = server._draw(route)
+                time.sleep(delay)
+                if fault == "error":
+                    self._reply(route, 503, b'{"error": "service unavailable"}')
+                    return
+                if fault == "rate_limit":
+                    retry_after = server.faults[route].retry_after_seconds
+                    self._reply(
+                        route, 429, b'{"error": "too many requests"}', {"Retry-After": retry_after}
+                    )
+                    return
+                now = datetime.now(UTC)
+                body = json.dumps(server._payloads[route](now, parse_qs(url.query))).encode()
+                if fault == "truncate":
+                    with server._lock:
+                        server.truncated[route] += 1
+                    self._reply(route, 200, body, cut_at=len(body) // 2)
+                    return
+                self._reply(route, 200, body)
+
+            def _reply(
+                self,
+                route: str,
+                status: int,
+                body: bytes,
+                headers: dict[str, object] | None = None,
+                *,
+                cut_at: int | None = None,
+            ) -> None:
+                with server._lock:
+                    server.statuses[route, status] += 1
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, str(value))
+                if cut_at is not None:
+                    self.send_header("Connection", "close")
+                self.end_headers()
+                self.wfile.write(body[:cut_at])
+                if cut_at is not None:
+                    self.close_connection = True
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass  # a load test would drown the console
+
+        return Handler
+
+
+# ---- Payload generators ------------------------------------------------------------------
+
+
+def seven_timer_payload(now: datetime, query: dict[str, list[str]] | None = None) -> Any:
+    """32 three-hourly ASTRO slots from the latest 6-hourly model run before ``now``."""
+    init = _top_of_hour(now) - timedelta(hours=now.hour % 6)
+    rng = random.Random(int(init.timestamp()))
+    return {
+        "product": "astro",
+        "init": init.strftime("%Y%m%d%H"),
+        "dataseries": [
+            {
+                "timepoint": step,
+                "cloudcover": rng.randint(1, 9),
+                "seeing": rng.randint(1, 8),
+                "transparency": rng.randint(1, 8),
+                "lifted_index": 15,
+                "rh2m": str(rng.randint(-4, 4)),
+                "wind10m": {"direction": "NW", "speed": rng.randint(1, 5)},
+                "temp2m": rng.randint(2, 20),
+                "prec_type": "none",
+            }
+            for step in range(3, 99, 3)
+        ],
+    }
+
+
+def nws_hourly_payload(
+    now: datetime, query: dict[str, list[str]] | None = None, *, hours: int = 156
+) -> Any:
+    """``hours`` hourly NWS periods from the current hour, in Pacific time as NWS sends."""
+    start = _top_of_hour(now)
+    rng = random.Random(int(start.timestamp()))
+    periods = []
+    for i in range(hours):
+        begin = (start + timedelta(hours=i)).astimezone(_PACIFIC)
+        low = rng.randint(0, 15)
+        periods.append(
+            {
+                "number": i + 1,
+                "name": "",
+                "startTime": begin.isoformat(),
+                "endTime": (begin + timedelta(hours=1)).isoformat(),
+                "isDaytime": 6 <= begin.hour < 18,
+                "temperature": rng.randint(40, 75),
+                "temperatureUnit": "F",
+                "probabilityOfPrecipitation": {
+                    "unitCode": "wmoUnit:percent",
+                    "value": rng.randint(0, 30),
+                },
+                "relativeHumidity": {"unitCode": "wmoUnit:percent", "value": rng.randint(30, 95)},
+                "windSpeed": f"{low} to {low + 5} mph" if rng.random() < 0.3 else f"{low} mph",
+                "windDirection": rng.choice(("N", "NW", "WSW", "SE")),
+                "shortForecast": rng.choice(("Clear", "Mostly Clear", "Partly Cloudy")),
+                "detailedForecast": "",
+            }
+        )
+    return {"properties": {"periods": periods}}
+
+
+def open_meteo_payload(
+    now: datetime, query: dict[str, list[str]] | None = None, *, hours: int = 168
+) -> Any:
+    """``hours`` hourly values from midnight UTC; a list for a multi-site request."""
+    start = _top_of_hour(now) - timedelta(hours=now.hour)
+    rng = random.Random(int(start.timestamp()))
+    one = {
+        "latitude": 37.36,
+        "longitude": -122.06,
+        "timezone": "GMT",
+        "hourly_units": {"time": "iso8601", "cloud_cover": "%", "visibility": "m"},
+        "hourly": {
+            "time": [(start + timedelta(hours=i)).strftime("%Y-%m-%dT%H:%M") for i in range(hours)],
+            "cloud_cover": [rng.randint(0, 100) for _ in range(hours)],
+            "visibility": [float(rng.randint(5, 50) * 1000) for _ in range(hours)],
+            "wind_speed_10m": [round(rng.uniform(0, 12), 1) for _ in range(hours)],
+        },
+    }
+    sites = (query or {}).get("latitude", [""])[0].count(",") + 1
+    return [one] * sites if sites > 1 else one
+
+
+def payloads_from_cassette(path: Path) -> dict[str, PayloadFactory]:
+    """Serve the recorded bodies in a vcrpy cassette instead of generated ones.
+
+    Needs PyYAML (installed with the dev extras, via vcrpy). Routes the cassette doesn't
+    cover keep their generated payloads; the NWS gridpoint always points at the fake.
+    """
+    import yaml  # dev dependency, via vcrpy
+
+    recorded: dict[str, Any] = {}
+    for interaction in yaml.safe_load(path.read_text())["interactions"]:
+        host, url_path = urlsplit(interaction["request"]["uri"])[1:3]
+        route = (
+            "7timer"
+            if "7timer" in host
+            else "meteo"
+            if "open-meteo" in host
+            else "hourly"
+            if url_path.endswith("/forecast/hourly")
+            else None
+        )
+        body = interaction["response"]["body"]["string"]
+        if route is not None and body:
+            recorded[route] = json.loads(body)
+
+    def serve(route: str, body: Any) -> PayloadFactory:
+        def factory(now: datetime, query: dict[str, list[str]]) -> Any:
+            sites = query.get("latitude", [""])[0].count(",") + 1
+            return [body] * sites if route == "meteo" and sites > 1 else body
+
+        return factory
+
+    return {route: serve(route, body) for route, body in recorded.items()}
+
+
+def _top_of_hour(now: datetime) -> datetime:
+    return now.astimezone(UTC).replace(minute=0, second=0, microsecond=0)
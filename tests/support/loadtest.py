@@ -0,0 +1,192 @@
+"""Load-test harness: many concurrent callers against a ``ConditionsAggregator``.
+
+``run_load`` makes ``calls`` calls to ``fetch_series`` from ``callers`` threads,
+spread round-robin over ``sites``, and reports throughput, latency percentiles and
+how many calls came back degraded (some provider missing) or failed outright
+(``AllProvidersDownError``), along with the aggregator's ``health()`` table.
+
+Run against the local fake providers (``tests.support.fake_server``), from the
+repository root::
+
+    python -m tests.support.loadtest --callers 16 --calls 400 \\
+        --sites 20 --latency 0.2 --sigma 0.5 --error-rate 0.05 --rate-limit-rate 0.02
+
+Faults apply to every route unless a ``--only`` route is given. Nothing here talks to
+the real providers.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import tempfile
+import threading
+import time
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import requests
+
+from auto_telescope.conditions.aggregator import AllProvidersDownError, ConditionsAggregator
+from auto_telescope.conditions.cache import ConditionsCache
+from auto_telescope.conditions.metrics import HealthReport, InMemoryMetrics
+from auto_telescope.config.http import configure_session
+from tests.support.fake_server import (
+    ROUTES,
+    FakeProviderServer,
+    Faults,
+    payloads_from_cassette,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class LoadReport:
+    """Outcome of one ``run_load``. Latencies are per ``fetch_series`` call."""
+
+    calls: int
+    degraded: int  # answered, but with at least one provider missing
+    failed: int  # AllProvidersDownError
+    elapsed_seconds: float
+    latency_p50_seconds: float
+    latency_p95_seconds: float
+    latency_p99_seconds: float
+    latency_max_seconds: float
+    health: HealthReport | None = None
+
+    @property
+    def throughput_per_second(self) -> float:
+        return self.calls / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+    def format(self) -> str:
+        lines = [
+            f"{self.calls} calls in {self.elapsed_seconds:.2f} s "
+            f"({self.throughput_per_second:.1f}/s): {self.degraded} degraded, "
+            f"{self.failed} failed",
+            f"latency ms: p50 {self.latency_p50_seconds * 1000:.0f}, "
+            f"p95 {self.latency_p95_seconds * 1000:.0f}, "
+            f"p99 {self.latency_p99_seconds * 1000:.0f}, "
+            f"max {self.latency_max_seconds * 1000:.0f}",
+        ]
+        if self.health is not None:
+            lines.append(self.health.format())
+        return "\n".join(lines)
+
+
+def run_load(
+    aggregator: ConditionsAggregator,
+    sites: Sequence[tuple[float, float]],
+    *,
+    callers: int = 8,
+    calls: int = 100,
+) -> LoadReport:
+    """Call ``aggregator.fetch_series`` ``calls`` times from ``callers`` threads."""
+    if not sites:
+        raise ValueError("run_load needs at least one site")
+    latencies = np.empty(calls)
+    degraded = failed = 0
+    lock = threading.Lock()
+
+    def call(i: int) -> None:
+        nonlocal degraded, failed
+        lat, lon = sites[i % len(sites)]
+        started = time.perf_counter()
+        try:
+            series = aggregator.fetch_series(lat, lon)
+        except AllProvidersDownError:
+            outcome = "failed"
+        else:
+            outcome = "degraded" if series.grid.missing_providers else "ok"
+        latencies[i] = time.perf_counter() - started
+        with lock:
+            degraded += outcome == "degraded"
+            failed += outcome == "failed"
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(callers, thread_name_prefix="loadtest") as pool:
+        list(pool.map(call, range(calls)))
+    elapsed = time.perf_counter() - started
+
+    p50, p95, p99 = np.percentile(latencies, [50, 95, 99]) if calls else (0.0, 0.0, 0.0)
+    health = aggregator.health() if isinstance(aggregator.metrics, InMemoryMetrics) else None
+    return LoadReport(
+        calls=calls,
+        degraded=degraded,
+        failed=failed,
+        elapsed_seconds=elapsed,
+        latency_p50_seconds=float(p50),
+        latency_p95_seconds=float(p95),
+        latency_p99_seconds=float(p99),
+        latency_max_seconds=float(latencies.max()) if calls else 0.0,
+        health=health,
+    )
+
+
+def spread_sites(
+    count: int, *, around: tuple[float, float] = (37.366, -122.077)
+) -> list[tuple[float, float]]:
+    """``count`` distinct sites on a 0.1° grid around ``around``."""
+    side = int(np.ceil(np.sqrt(count)))
+    lat0, lon0 = around
+    return [(lat0 + 0.1 * (i // side), lon0 + 0.1 * (i % side)) for i in range(count)]
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--callers", type=int, default=8, help="concurrent calling threads")
+    parser.add_argument("--calls", type=int, default=200, help="total fetch_series calls")
+    parser.add_argument("--sites", type=int, default=10, help="distinct sites, round-robin")
+    parser.add_argument("--latency", type=float, default=0.1, help="median response delay, s")
+    parser.add_argument("--sigma", type=float, default=0.5, help="log-normal delay spread")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of 503 answers")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="share of 429s")
+    parser.add_argument("--truncate-rate", type=float, default=0.0, help="share of cut bodies")
+    parser.add_argument("--only", choices=ROUTES, help="inject faults on this route only")
+    parser.add_argument("--retries", type=int, default=2, help="HTTP retries per request")
+    parser.add_argument("--deadline", type=float, default=25.0, help="aggregator deadline, s")
+    parser.add_argument("--cache", action="store_true", help="put a ConditionsCache in front")
+    parser.add_argument("--cassette", type=Path, help="serve this vcrpy cassette's bodies")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--verbose", action="store_true", help="log each provider failure")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.WARNING if args.verbose else logging.ERROR)
+
+    faults = Faults(
+        latency_seconds=args.latency,
+        latency_sigma=args.sigma,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        truncate_rate=args.truncate_rate,
+        retry_after_seconds=0,  # honored by the retry policy; 0 keeps the run short
+    )
+    routes = (args.only,) if args.only else ROUTES
+    payloads = payloads_from_cassette(args.cassette) if args.cassette else None
+    session = configure_session(
+        requests.Session(),
+        pool_maxsize=max(args.callers, 8),
+        retries=args.retries,
+        backoff_seconds=0.0,
+    )
+    with (
+        FakeProviderServer(
+            faults=dict.fromkeys(routes, faults), payloads=payloads, seed=args.seed
+        ) as server,
+        tempfile.TemporaryDirectory(prefix="loadtest-cache-") as cache_dir,
+    ):
+        cache = ConditionsCache(Path(cache_dir)) if args.cache else None
+        aggregator = server.aggregator(session=session, cache=cache, deadline_seconds=args.deadline)
+        try:
+            report = run_load(
+                aggregator, spread_sites(args.sites), callers=args.callers, calls=args.calls
+            )
+        finally:
+            aggregator.close()
+            if cache is not None:
+                cache.close()
+    print(report.format())
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI
+    main()
@@ -2,18 +2,45 @@
 
 from __future__ import annotations
 
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
 from datetime import UTC, datetime
+from typing import Any
 
+import numpy as np
 import pytest
 
+from auto_telescope.catalog.columnar import CatalogTable
 from auto_telescope.catalog.curated import CURATED_TARGETS, get_curated_target
-from auto_telescope.catalog.feasibility import assess_feasibility
+from auto_telescope.catalog.feasibility import (
+    FeasibilityReason,
+    assess_feasibility,
+    assess_feasibility_many,
+)
+from auto_telescope.catalog.name_index import (
+    NameIndex,
+    default_index,
+    normalize_name,
+    search_targets,
+)
+from auto_telescope.catalog.resolve_cache import (
+    ResolveCache,
+    clear_resolve_cache,
+    resolve_cache_stats,
+)
+from auto_telescope.catalog.resolver import (
+    ResolutionStatus,
+    TargetPendingError,
+    TargetResolver,
+)
 from auto_telescope.catalog.solar_system import (
     SOLAR_SYSTEM_BODIES,
     is_solar_system_body,
     lookup_solar_system,
 )
-from auto_telescope.catalog.targets import Tier, resolve_target
+from auto_telescope.catalog.targets import Target, TargetType, Tier, resolve_target
 from auto_telescope.config.site import MVHS_SITE
 
 
@@ -91,6 +118,317 @@ class TestResolveTarget:
             resolve_target("definitelynotastar_xyz_zz")
 
 
+class TestResolveCache:
+    def test_lru_eviction_and_counters(self) -> None:
+        cache = ResolveCache(max_size=2)
+        m13, m31, m57 = (get_curated_target(n) for n in ("M13", "M31", "M57"))
+        assert m13 and m31 and m57
+        for target in (m13, m31):
+            cache.put(target.id, target, when_utc=None, site=None)
+        assert cache.get("m 13", when_utc=None, site=None) is m13  # normalized key
+        cache.put("M57", m57, when_utc=None, site=None)  # evicts M31, the LRU entry
+        assert cache.get("M31", when_utc=None, site=None) is None
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.evictions, stats.size) == (1, 1, 1, 2)
+
+    def test_lookups_it_cannot_answer_are_not_misses(self) -> None:
+        disabled = ResolveCache(max_size=0)
+        assert disabled.get("M13", when_utc=None, site=None) is None
+        assert disabled.stats().misses == 0
+        cache = ResolveCache()
+        assert cache.get(" - ", when_utc=None, site=None) is None  # normalizes to nothing
+        assert cache.get("M13", when_utc=None, site=None) is None
+        assert cache.stats().misses == 1
+
+    def test_moving_bodies_are_bucketed_by_time(self) -> None:
+        cache = ResolveCache(bucket_seconds=60.0)
+        when = datetime(2026, 7, 4, 5, 30, 10, tzinfo=UTC)
+        jupiter = lookup_solar_system("Jupiter", when_utc=when, site=MVHS_SITE)
+        cache.put("Jupiter", jupiter, when_utc=when, site=MVHS_SITE)
+        same_tick = when.replace(second=50)
+        assert cache.get("jupiter", when_utc=same_tick, site=MVHS_SITE) is jupiter
+        next_tick = when.replace(minute=31)
+        assert cache.get("jupiter", when_utc=next_tick, site=MVHS_SITE) is None
+        other_site = replace(MVHS_SITE, name="elsewhere", latitude=-30.0)
+        assert cache.get("jupiter", when_utc=same_tick, site=other_site) is None
+
+    def test_repeat_resolutions_within_a_tick_are_hits(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        import auto_telescope.catalog.solar_system as solar_system
+
+        clear_resolve_cache()
+        calls = []
+        real = solar_system.lookup_solar_system
+
+        def counting(name: str, **kwargs: Any) -> Target:
+            calls.append(name)
+            return real(name, **kwargs)
+
+        monkeypatch.setattr(solar_system, "lookup_solar_system", counting)
+        when = datetime(2026, 7, 4, 5, 30, tzinfo=UTC)
+        before = resolve_cache_stats()
+        first = resolve_target("Saturn", when_utc=when, site=MVHS_SITE)
+        for _ in range(5):
+            assert resolve_target("saturn", when_utc=when, site=MVHS_SITE) is first
+        assert calls == ["Saturn"]
+        assert resolve_cache_stats().hits - before.hits == 5
+
+
+class TestNameIndex:
+    @pytest.mark.parametrize(
+        ("raw", "key"),
+        [
+            ("M 13", "m13"),
+            ("Messier 13", "m13"),
+            ("Messier13", "m13"),
+            ("ngc6205", "ngc6205"),
+            ("NGC 6205", "ngc6205"),
+            ("Herschel 400", "h400"),
+            ("Herschel's Garnet Star", "herschelsgarnetstar"),  # not a designation
+        ],
+    )
+    def test_normalize_name(self, raw: str, key: str) -> None:
+        assert normalize_name(raw) == key
+
+    @pytest.mark.parametrize("name", ["m 13", "Messier 13", "ngc6205", "M-13"])
+    def test_curated_lookup_forgives_formatting(self, name: str) -> None:
+        m13 = get_curated_target(name)
+        assert m13 is not None
+        assert m13.id == "M13"
+
+    def test_prefix_search_ranks_leading_word_first(self) -> None:
+        hits = search_targets("andro")
+        assert hits[0].target.id == "M31"
+        assert hits[0].kind == "prefix"
+        assert "NGC891" in [h.target.id for h in hits]
+
+    def test_typos_resolve_locally(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        import auto_telescope.catalog.simbad as simbad
+
+        def forbidden(name: str, **kwargs: object) -> Target | None:
+            raise AssertionError("SIMBAD called for a locally resolvable name")
+
+        monkeypatch.setattr(simbad, "lookup_simbad", forbidden)
+        assert resolve_target("andromeda").id == "M31"
+        assert resolve_target("Whirlpol").id == "M51"
+        assert resolve_target("jupitr").id == "jupiter"
+
+    def test_designations_never_fuzzy_match(self) -> None:
+        index = NameIndex(CURATED_TARGETS)
+        assert index.best_match("M42") is not None  # unique prefix of M42_core
+        # "M 1" is a prefix of M10, M11, ... — ambiguous, so no guess.
+        assert index.best_match("M 1") is None
+        assert index.best_match("NGC 9999") is None
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "Saturn Nebula",
+            "Jupiters Ghost",
+            "Andromeda II",
+            "Andromeda I",
+            "Andromeda XIX",
+            "Sirius B",
+            "Polaris Australis",
+            "Orion Bar",
+            "Cygnus A",
+            "Hercules A",
+            "Sa",
+            "Ju",
+            "Me",
+            "Cat",
+        ],
+    )
+    def test_partial_names_are_not_auto_accepted(self, query: str) -> None:
+        # These are other objects (or too short to tell); SIMBAD gets to answer.
+        assert default_index().best_match(query) is None
+
+    def test_partial_names_fall_through_to_simbad(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        import auto_telescope.catalog.simbad as simbad
+
+        monkeypatch.setattr(simbad, "lookup_simbad", lambda name, **_: _simbad_stub(name))
+        clear_resolve_cache()
+        assert resolve_target("Saturn Nebula").id == "Saturn Nebula"
+        assert resolve_target("Andromeda II").id == "Andromeda II"
+
+    def test_search_still_ranks_partial_names(self) -> None:
+        assert search_targets("Andromeda II")[0].target.id == "M31"
+        assert search_targets("Sa")[0].target.id == "saturn"
+
+    def test_leading_words_and_their_typos_are_accepted(self) -> None:
+        index = default_index()
+        for query, target_id in [
+            ("andro", "M31"),
+            ("whirlpool gal", "M51"),
+            ("Cats Eye", "NGC6543"),
+            ("Pleiads", "M45"),
+        ]:
+            match = index.best_match(query)
+            assert match is not None and match.id == target_id, query
+
+    def test_searches_during_ingest_see_whole_catalogs(self) -> None:
+        index = NameIndex(CURATED_TARGETS)
+        batches = [[_simbad_stub(f"NGC {n}") for n in range(b, b + 50)] for b in range(0, 2000, 50)]
+        errors: list[BaseException] = []
+
+        def ingest() -> None:
+            for batch in batches:
+                index.add(batch)
+
+        writer = threading.Thread(target=ingest)
+        writer.start()
+        while writer.is_alive():
+            try:
+                size = len(index)
+                assert (size - len(CURATED_TARGETS)) % 50 == 0  # never a partial batch
+                assert index.search("NGC 1", limit=5)
+                assert index.lookup("m13") is not None
+            except BaseException as exc:
+                errors.append(exc)
+                break
+        writer.join()
+        assert not errors
+        assert len(index) == len(CURATED_TARGETS) + 2000
+
+    def test_ingested_targets_are_searchable(self) -> None:
+        index = NameIndex(CURATED_TARGETS)
+        index.add([_simbad_stub("NGC 2403")])
+        assert index.lookup("ngc2403") is not None
+        assert index.search("NGC 240")[0].target.id == "NGC 2403"
+
+    @pytest.mark.slow  # a wall-clock benchmark: too noisy for a loaded CI runner or the Pi
+    def test_search_is_sub_millisecond(self) -> None:
+        search_targets("warmup")
+        t0 = time.perf_counter()
+        for q in ("andro", "m1", "ring nebla", "whirlpol") * 50:
+            search_targets(q)
+        assert (time.perf_counter() - t0) / 200 < 1e-3
+
+
+def _simbad_stub(name: str) -> Target:
+    return Target(
+        id=name,
+        display_name=name,
+        target_type=TargetType.GALAXY,
+        ra_deg=148.888,
+        dec_deg=69.065,
+        magnitude=6.9,
+        angular_size_arcmin=None,
+        tier=Tier.CHALLENGING,
+    )
+
+
+class TestTargetResolver:
+    def test_local_targets_never_touch_network(self) -> None:
+        def forbidden(name: str) -> Target | None:
+            raise AssertionError("network lookup for a local target")
+
+        with TargetResolver(lookup=forbidden) as resolver:
+            r = resolver.resolve("M13")
+            assert r.status == ResolutionStatus.RESOLVED
+            assert r.source == "local"
+            assert resolver.resolve("Jupiter").require().id == "jupiter"
+
+    def test_slow_lookup_returns_pending_then_resolves(self) -> None:
+        release = threading.Event()
+
+        def slow(name: str) -> Target | None:
+            release.wait(5.0)
+            return _simbad_stub(name)
+
+        with TargetResolver(lookup=slow, budget_seconds=0.01) as resolver:
+            r = resolver.resolve("NGC 2403")
+            assert r.status == ResolutionStatus.PENDING
+            with pytest.raises(TargetPendingError):
+                r.require()
+            release.set()
+            done = r.wait(timeout=5.0)
+            assert done.status == ResolutionStatus.RESOLVED
+            assert done.require().id == "NGC 2403"
+            # Remembered: the next call doesn't wait on anything.
+            assert resolver.resolve("ngc 2403").source == "simbad"
+
+    def test_concurrent_requests_share_one_lookup(self) -> None:
+        release = threading.Event()
+        calls: list[str] = []
+
+        def slow(name: str) -> Target | None:
+            calls.append(name)
+            release.wait(5.0)
+            return _simbad_stub(name)
+
+        with TargetResolver(lookup=slow, budget_seconds=0.0) as resolver:
+            first = resolver.resolve("NGC 2403")
+            second = resolver.resolve("NGC 2403")
+            release.set()
+            assert first.wait(5.0).status == ResolutionStatus.RESOLVED
+            assert second.wait(5.0).status == ResolutionStatus.RESOLVED
+        assert calls == ["NGC 2403"]
+
+    def test_hung_lookup_is_retried_after_its_timeout(self) -> None:
+        release = threading.Event()
+        calls: list[str] = []
+
+        def first_hangs(name: str) -> Target | None:
+            calls.append(name)
+            if len(calls) == 1:
+                release.wait(5.0)
+                return None
+            return _simbad_stub(name)
+
+        with TargetResolver(lookup=first_hangs, budget_seconds=0.0, timeout_seconds=0.05) as r:
+            assert r.resolve("NGC 2403").status == ResolutionStatus.PENDING
+            time.sleep(0.1)  # past the lookup timeout
+            retried = r.resolve("NGC 2403", budget_seconds=5.0)
+            assert retried.status == ResolutionStatus.RESOLVED
+            release.set()  # the abandoned lookup finishes late, with a miss
+            assert r.resolve("NGC 2403").require().id == "NGC 2403"
+        assert len(calls) == 2
+
+    def test_worker_threads_get_their_own_simbad_client(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        import auto_telescope.catalog.simbad as simbad
+
+        monkeypatch.setattr(simbad, "_CLIENTS", threading.local())
+        monkeypatch.setattr(simbad, "_new_simbad_client", lambda timeout: object())
+        mine = simbad._simbad_client(15.0)
+        assert simbad._simbad_client(15.0) is mine
+        assert simbad._simbad_client(5.0) is not mine
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            theirs = pool.submit(simbad._simbad_client, 15.0).result()
+        assert theirs is not mine
+
+    def test_miss_is_not_found_and_retried(self) -> None:
+        calls: list[str] = []
+
+        def miss(name: str) -> Target | None:
+            calls.append(name)
+            return None
+
+        with TargetResolver(lookup=miss, budget_seconds=1.0) as resolver:
+            r = resolver.resolve("nothing_here")
+            assert r.status == ResolutionStatus.NOT_FOUND
+            with pytest.raises(KeyError):
+                r.require()
+            resolver.resolve("nothing_here")
+        assert len(calls) == 2
+
+    def test_lookup_past_timeout_reports_not_found(self) -> None:
+        release = threading.Event()
+
+        def stuck(name: str) -> Target | None:
+            release.wait(5.0)
+            return None
+
+        with TargetResolver(lookup=stuck, budget_seconds=0.05, timeout_seconds=0.01) as resolver:
+            r = resolver.resolve("NGC 2403")
+            assert r.status == ResolutionStatus.NOT_FOUND
+            assert "exceeded" in r.detail
+            release.set()
+
+
 class TestFeasibility:
     def test_tier1_target_is_feasible(self) -> None:
         m13 = get_curated_target("M13")
@@ -115,6 +453,72 @@ class TestFeasibility:
         verdict_strict = assess_feasibility(m4, site=MVHS_SITE, safety_horizon_deg=30.0)
         assert not verdict_strict.feasible
 
+
+def _synthetic_targets(n: int) -> list[Target]:
+    rng = np.random.default_rng(7)
+    out = []
+    for i in range(n):
+        out.append(
+            Target(
+                id=f"X{i}",
+                display_name=f"Synthetic {i}",
+                target_type=TargetType.GALAXY,
+                ra_deg=float(rng.uniform(0, 360)),
+                dec_deg=float(rng.uniform(-90, 90)),
+                magnitude=None if i % 7 == 0 else float(rng.uniform(2, 16)),
+                angular_size_arcmin=None if i % 5 == 0 else float(rng.uniform(0.1, 60)),
+                tier=Tier.SKIP if i % 11 == 0 else Tier.EASY,
+            )
+        )
+    return out
+
+
+class TestFeasibilityMany:
+    @pytest.mark.parametrize(
+        ("magnitude_limit", "horizon"), [(12.0, 20.0), (9.5, 30.0), (20.0, 0.0)]
+    )
+    def test_matches_scalar_assessment(self, magnitude_limit: float, horizon: float) -> None:
+        targets = [*CURATED_TARGETS, *_synthetic_targets(300)]
+        table = assess_feasibility_many(
+            CatalogTable.from_targets(targets),
+            site=MVHS_SITE,
+            magnitude_limit=magnitude_limit,
+            safety_horizon_deg=horizon,
+        )
+        for i, target in enumerate(targets):
+            expected = assess_feasibility(
+                target,
+                site=MVHS_SITE,
+                magnitude_limit=magnitude_limit,
+                safety_horizon_deg=horizon,
+            )
+            assert table.verdict(i) == expected
+            assert bool(table.feasible[i]) == expected.feasible
+
+    def test_reason_codes_and_counts(self) -> None:
+        table = assess_feasibility_many(CatalogTable.from_targets(CURATED_TARGETS), site=MVHS_SITE)
+        horsehead = table.catalog.ids.index("Horsehead")
+        assert table.reason[horsehead] == FeasibilityReason.TIER_SKIP
+        assert sum(table.counts().values()) == len(CURATED_TARGETS)
+        assert len(table.feasible_targets()) == table.counts()[FeasibilityReason.OK]
+
+    def test_rerun_with_a_new_horizon(self) -> None:
+        catalog = CatalogTable.from_targets(_synthetic_targets(2_000))
+        first = assess_feasibility_many(catalog, site=MVHS_SITE)
+        table = assess_feasibility_many(catalog, site=MVHS_SITE, safety_horizon_deg=30.0)
+        assert sum(table.counts().values()) == len(catalog)
+        below = FeasibilityReason.BELOW_HORIZON
+        assert table.counts()[below] > first.counts().get(below, 0)
+
+    @pytest.mark.slow  # a wall-clock benchmark: too noisy for a loaded CI runner or the Pi
+    def test_rerun_on_100k_rows_is_fast(self) -> None:
+        catalog = CatalogTable.from_targets(_synthetic_targets(100_000))
+        assess_feasibility_many(catalog, site=MVHS_SITE)
+        t0 = time.perf_counter()
+        table = assess_feasibility_many(catalog, site=MVHS_SITE, safety_horizon_deg=30.0)
+        assert time.perf_counter() - t0 < 0.05
+        assert table.counts()[FeasibilityReason.BELOW_HORIZON] > 0
+
     def test_faint_target_rejected_by_magnitude_limit(self) -> None:
         m13 = get_curated_target("M13")
         assert m13 is not None
@@ -0,0 +1,192 @@
+"""Columnar forecast archive and ReplayProvider."""
+
+from __future__ import annotations
+
+import json
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from auto_telescope.conditions.aggregator import ConditionsAggregator, ConditionsForecast
+from auto_telescope.conditions.archive import ForecastArchive, ReplayProvider
+from auto_telescope.conditions.http_cache import Validators
+from auto_telescope.conditions.nws import NWSSlot
+from auto_telescope.conditions.open_meteo import OpenMeteoSlot
+from auto_telescope.conditions.seven_timer import SevenTimerSlot
+
+SITE = (37.366, -122.077)
+T0 = datetime(2026, 4, 1, 3, tzinfo=UTC)
+
+
+def _seven(cloud: float) -> list[SevenTimerSlot]:
+    return [
+        SevenTimerSlot(T0 + timedelta(hours=3 * i), cloud, 1.0, 0.5, 2.0, 40.0, 15.0)
+        for i in range(4)
+    ]
+
+
+def _nws() -> list[NWSSlot]:
+    return [
+        NWSSlot(T0, T0 + timedelta(hours=1), 12.0, 3.0, None, "Mostly Clear", 10.0, None),
+        NWSSlot(
+            T0 + timedelta(hours=1), T0 + timedelta(hours=2), 11.0, 2.0, 270.0, "Clear", 0.0, 5.0
+        ),
+    ]
+
+
+class TestForecastArchive:
+    def test_slots_round_trip(self, tmp_path: Path) -> None:
+        archive = ForecastArchive(tmp_path)
+        run = datetime(2026, 4, 1, 0, tzinfo=UTC)
+        archive.append_slots("7timer", *SITE, _seven(20.0), fetched_at=T0, model_run_utc=run)
+        archive.append_slots("nws", *SITE, _nws(), fetched_at=T0)
+
+        seven = archive.latest("7timer", *SITE)
+        assert seven is not None
+        assert seven.records == _seven(20.0)
+        assert (seven.fetched_at, seven.model_run_utc) == (T0, run)
+        nws = archive.latest("nws", *SITE)
+        assert nws is not None and nws.records == _nws()  # None and strings survive
+        assert archive.latest("open-meteo", *SITE) is None
+        assert archive.latest("7timer", 0.0, 0.0) is None
+
+    def test_columns_are_memory_mapped(self, tmp_path: Path) -> None:
+        archive = ForecastArchive(tmp_path)
+        archive.append_slots("7timer", *SITE, _seven(20.0), fetched_at=T0)
+        cols = ForecastArchive(tmp_path).columns("7timer", T0.date())
+        assert isinstance(cols["cloud_cover_pct"], np.memmap)
+        assert cols["cloud_cover_pct"].tolist() == [20.0] * 4
+
+    def test_latest_at_and_batches(self, tmp_path: Path) -> None:
+        archive = ForecastArchive(tmp_path)
+        later = T0 + timedelta(days=1)
+        archive.append_slots("7timer", *SITE, _seven(20.0), fetched_at=T0)
+        archive.append_slots("7timer", *SITE, _seven(80.0), fetched_at=later)
+        assert archive.days("7timer") == [T0.date(), later.date()]
+
+        at_t0 = archive.latest("7timer", *SITE, at=T0 + timedelta(hours=1))
+        assert at_t0 is not None and at_t0.records[0].cloud_cover_pct == 20.0
+        newest = archive.latest("7timer", *SITE)
+        assert newest is not None and newest.records[0].cloud_cover_pct == 80.0
+        assert archive.latest("7timer", *SITE, at=T0 - timedelta(seconds=1)) is None
+        assert [b.fetched_at for b in archive.batches("7timer")] == [T0, later]
+        assert [b.fetched_at for b in archive.batches("7timer", start=later.date())] == [later]
+
+    def test_torn_append_is_repaired(self, tmp_path: Path) -> None:
+        archive = ForecastArchive(tmp_path)
+        archive.append_slots("7timer", *SITE, _seven(20.0), fetched_at=T0)
+        part = tmp_path / "7timer" / T0.date().isoformat()
+        with open(part / "fetched_at.bin", "ab") as fh:  # one column got a row, then a crash
+            fh.write(b"\x00" * 8)
+
+        reopened = ForecastArchive(tmp_path)
+        assert len(reopened.columns("7timer", T0.date())["fetched_at"]) == 4
+        reopened.append_slots("7timer", *SITE, _seven(50.0), fetched_at=T0 + timedelta(hours=1))
+        clouds = [b.records[0].cloud_cover_pct for b in reopened.batches("7timer")]
+        assert clouds == [20.0, 50.0]
+
+    def test_torn_vocabulary_line_is_repaired(self, tmp_path: Path) -> None:
+        archive = ForecastArchive(tmp_path)
+        archive.append_slots("nws", *SITE, _nws(), fetched_at=T0)
+        vocab = tmp_path / "nws" / T0.date().isoformat() / "short_forecast.vocab"
+        with open(vocab, "ab") as fh:  # a crash half-way through writing a new word
+            fh.write(b'"Partly Clou')
+
+        reopened = ForecastArchive(tmp_path)
+        assert [b.records for b in reopened.batches("nws")] == [_nws()]  # readers skip it
+        later = [replace(s, short_forecast="Partly Cloudy") for s in _nws()]
+        reopened.append_slots("nws", *SITE, later, fetched_at=T0 + timedelta(hours=1))
+        assert [b.records for b in ForecastArchive(tmp_path).batches("nws")] == [_nws(), later]
+        assert vocab.read_text().splitlines()[-1] == '"Partly Cloudy"'
+
+    def test_old_partitions_are_pruned(self, tmp_path: Path) -> None:
+        archive = ForecastArchive(tmp_path, retention_days=2)
+        for days_ago in (4, 2):
+            archive.append_slots("7timer", *SITE, _seven(20.0), fetched_at=T0 - timedelta(days_ago))
+        assert archive.days("7timer") == [(T0 - timedelta(d)).date() for d in (4, 2)]
+
+        # Starting today's partition drops those more than two days older than it.
+        archive.append_slots("7timer", *SITE, _seven(50.0), fetched_at=T0)
+        archive.append_slots("7timer", *SITE, _seven(60.0), fetched_at=T0 + timedelta(hours=1))
+        assert archive.days("7timer") == [(T0 - timedelta(2)).date(), T0.date()]
+        assert len(list(archive.batches("7timer"))) == 3
+
+    def test_merged_series_only_appended_when_changed(self, tmp_path: Path) -> None:
+        archive = ForecastArchive(tmp_path)
+        forecast = ConditionsForecast(
+            hour_utc=T0,
+            cloud_cover_pct=20.0,
+            wind_speed_mps=2.0,
+            seeing_arcsec=None,
+            transparency_mag=None,
+            visibility_m=10000.0,
+            temperature_c=None,
+            relative_humidity_pct=None,
+            contributing_providers=("nws", "open-meteo"),
+            issued_utc=T0,
+        )
+        for _ in range(3):
+            archive.append_forecasts(*SITE, [forecast], fetched_at=T0)
+        assert archive.forecasts(*SITE) == [forecast]
+        assert len(list(archive.batches("merged"))) == 1
+
+
+class TestReplayProvider:
+    def test_replays_through_the_aggregator(self, tmp_path: Path) -> None:
+        archive = ForecastArchive(tmp_path)
+        archive.append_slots("7timer", *SITE, _seven(20.0), fetched_at=T0)
+        archive.append_slots("nws", *SITE, _nws(), fetched_at=T0)
+        meteo = [OpenMeteoSlot(T0, 30.0, 20000.0, 4.0)]
+        archive.append_slots("open-meteo", *SITE, meteo, fetched_at=T0)
+
+        agg = ConditionsAggregator(
+            seven_timer=ReplayProvider(archive, "7timer"),  # type: ignore[arg-type]
+            nws=ReplayProvider(archive, "nws"),  # type: ignore[arg-type]
+            open_meteo=ReplayProvider(archive, "open-meteo"),  # type: ignore[arg-type]
+        )
+        first = agg.fetch(*SITE)[0]
+        assert first.hour_utc == T0
+        assert first.cloud_cover_pct == 30.0
+        assert first.contributing_providers == ("7timer", "nws", "open-meteo")
+
+    def test_revalidates_until_at_moves_on(self, tmp_path: Path) -> None:
+        archive = ForecastArchive(tmp_path)
+        archive.append_slots("7timer", *SITE, _seven(20.0), fetched_at=T0)
+        archive.append_slots("7timer", *SITE, _seven(80.0), fetched_at=T0 + timedelta(hours=6))
+        replay = ReplayProvider(archive, "7timer", at=T0 + timedelta(hours=1))
+
+        first = replay.fetch_conditional(*SITE)
+        assert first.slots[0].cloud_cover_pct == 20.0
+        assert replay.fetch_conditional(*SITE, first.validators).not_modified
+        replay.at = T0 + timedelta(hours=7)
+        assert replay.fetch_conditional(*SITE, first.validators).slots[0].cloud_cover_pct == 80.0
+
+    def test_missing_site_raises(self, tmp_path: Path) -> None:
+        replay = ReplayProvider(ForecastArchive(tmp_path), "nws")
+        with pytest.raises(LookupError):
+            replay.fetch_conditional(*SITE, Validators())
+        with pytest.raises(ValueError):
+            ReplayProvider(ForecastArchive(tmp_path), "merged")
+
+    def test_partition_from_before_a_new_field(self, tmp_path: Path) -> None:
+        archive = ForecastArchive(tmp_path)
+        forecast = ConditionsForecast(
+            T0, 20.0, 2.0, None, None, 10000.0, None, None, ("open-meteo",), T0
+        )
+        archive.append_forecasts(*SITE, [forecast], fetched_at=T0)
+        # Rewind the partition to before ``missing_providers`` existed.
+        part = tmp_path / "merged" / T0.date().isoformat()
+        (part / "missing_providers.bin").unlink()
+        schema = json.loads((part / "schema.json").read_text())
+        del schema["columns"]["missing_providers"]
+        (part / "schema.json").write_text(json.dumps(schema))
+
+        reopened = ForecastArchive(tmp_path)
+        assert reopened.forecasts(*SITE) == [forecast]  # the field's default
+        newer = replace(forecast, cloud_cover_pct=30.0, missing_providers=("nws:failed",))
+        reopened.append_forecasts(*SITE, [newer], fetched_at=T0 + timedelta(hours=1))
+        records = [b.records[0] for b in ForecastArchive(tmp_path).batches("merged")]
+        assert records == [forecast, newer]
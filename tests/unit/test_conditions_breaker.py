@@ -0,0 +1,87 @@
+"""CircuitBreaker: closed / open / half-open transitions and exponential cooldown."""
+
+from __future__ import annotations
+
+import pytest
+
+from auto_telescope.conditions.breaker import BreakerOpenError, BreakerState, CircuitBreaker
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _fail() -> None:
+    raise OSError("provider down")
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def breaker(clock: FakeClock) -> CircuitBreaker:
+    return CircuitBreaker(
+        "7timer", failure_threshold=2, cooldown_seconds=10.0, max_cooldown_seconds=25.0, clock=clock
+    )
+
+
+class TestCircuitBreaker:
+    def test_opens_after_threshold_and_refuses_instantly(self, breaker: CircuitBreaker) -> None:
+        with pytest.raises(OSError):
+            breaker.call(_fail)
+        assert breaker.state is BreakerState.CLOSED
+        with pytest.raises(OSError):
+            breaker.call(_fail)
+        assert breaker.state is BreakerState.OPEN
+        calls = []
+        with pytest.raises(BreakerOpenError):
+            breaker.call(lambda: calls.append(1))
+        assert calls == []
+        assert breaker.status().retry_in_seconds == 10.0
+
+    def test_success_resets_the_count(self, breaker: CircuitBreaker) -> None:
+        with pytest.raises(OSError):
+            breaker.call(_fail)
+        assert breaker.call(lambda: "ok") == "ok"
+        with pytest.raises(OSError):
+            breaker.call(_fail)
+        assert breaker.state is BreakerState.CLOSED
+
+    def test_half_open_probe_and_exponential_cooldown(
+        self, breaker: CircuitBreaker, clock: FakeClock
+    ) -> None:
+        for _ in range(2):
+            with pytest.raises(OSError):
+                breaker.call(_fail)
+        clock.now = 10.0
+        assert breaker.allow()  # the probe
+        assert not breaker.allow()  # only one at a time
+        assert breaker.state is BreakerState.HALF_OPEN
+        breaker.record_failure()
+        assert breaker.status().retry_in_seconds == 20.0  # doubled
+        clock.now = 30.0
+        with pytest.raises(OSError):
+            breaker.call(_fail)
+        assert breaker.status().retry_in_seconds == 25.0  # capped
+        clock.now = 55.0
+        assert breaker.call(lambda: "ok") == "ok"
+        assert breaker.status().state is BreakerState.CLOSED
+        assert breaker.status().cooldown_seconds == 10.0
+
+    def test_slow_success_counts_as_failure(self, clock: FakeClock) -> None:
+        breaker = CircuitBreaker(
+            "nws", failure_threshold=1, latency_budget_seconds=2.0, clock=clock
+        )
+
+        def slow() -> str:
+            clock.now += 3.0
+            return "late"
+
+        assert breaker.call(slow) == "late"  # the data is still used
+        assert breaker.state is BreakerState.OPEN
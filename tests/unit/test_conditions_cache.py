@@ -0,0 +1,120 @@
+"""Two-tier ConditionsCache: in-process LRU in front of diskcache."""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from auto_telescope.conditions.cache import ConditionsCache
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> Iterator[ConditionsCache]:
+    with ConditionsCache(tmp_path, memory_max_entries=2) as c:
+        yield c
+
+
+class TestMemoryTier:
+    def test_hot_key_is_served_from_memory(self, cache: ConditionsCache) -> None:
+        value = [1, 2, 3]
+        cache.set("k", value)
+        assert cache.get("k") is value  # no unpickle: the same object
+        assert cache.get("missing") is None
+        stats = cache.stats()
+        assert (stats.memory_hits, stats.disk_hits, stats.misses) == (1, 0, 1)
+        assert stats.memory_hit_rate == 0.5
+
+    def test_written_through_to_disk(self, tmp_path: Path) -> None:
+        with ConditionsCache(tmp_path) as cache:
+            cache.set("k", {"slots": [1]})
+        with ConditionsCache(tmp_path) as reopened:
+            assert reopened.get("k") == {"slots": [1]}
+            assert reopened.get("k") == {"slots": [1]}
+            stats = reopened.stats()
+        assert (stats.memory_hits, stats.disk_hits) == (1, 1)  # promoted on first read
+
+    def test_lru_bounded_by_entries(self, cache: ConditionsCache) -> None:
+        for key in ("a", "b"):
+            cache.set(key, key)
+        cache.get("a")  # "b" is now least recently used
+        cache.set("c", "c")
+        stats = cache.stats()
+        assert (stats.entries, stats.evictions) == (2, 1)
+        assert cache.get("b") == "b"  # still on disk
+        assert cache.stats().disk_hits == 1
+
+    def test_lru_bounded_by_bytes(self, tmp_path: Path) -> None:
+        with ConditionsCache(tmp_path, memory_max_bytes=3000) as cache:
+            cache.set("a", b"x" * 1000)
+            cache.set("b", b"x" * 1000)
+            cache.set("c", b"x" * 1000)
+            cache.set("huge", b"x" * 5000)  # larger than the tier: disk only
+            stats = cache.stats()
+            assert stats.entries == 2
+            assert stats.bytes <= 3000
+            assert cache.get("huge") == b"x" * 5000
+
+    def test_memory_expires_with_disk(self, cache: ConditionsCache) -> None:
+        cache.set("k", "v", ttl_seconds=1)
+        assert cache.get("k") == "v"
+        time.sleep(1.05)
+        assert cache.get("k") is None
+        assert cache.stats().entries == 0
+
+    def test_delete_and_zero_ttl_drop_both_tiers(self, cache: ConditionsCache) -> None:
+        cache.set("k", "v")
+        cache.delete("k")
+        assert cache.get("k") is None
+        cache.set("k", "v")
+        cache.set("k", "v2", ttl_seconds=0)
+        assert cache.get("k") is None
+
+    def test_disabled_memory_tier(self, tmp_path: Path) -> None:
+        with ConditionsCache(tmp_path, memory_max_entries=0) as cache:
+            cache.set("k", [1])
+            assert cache.get("k") == [1]
+            assert cache.get("k") is not cache.get("k")
+            assert cache.stats().disk_hits == 3
+
+
+class TestGetOrSet:
+    def test_loader_runs_once_for_concurrent_misses(self, cache: ConditionsCache) -> None:
+        calls = 0
+
+        def load() -> str:
+            nonlocal calls
+            calls += 1
+            time.sleep(0.2)
+            return "loaded"
+
+        with ThreadPoolExecutor(max_workers=6) as pool:
+            results = list(pool.map(lambda _: cache.get_or_set("k", load), range(6)))
+        assert results == ["loaded"] * 6
+        assert calls == 1
+        assert cache.get_or_set("k", load) == "loaded"  # now a plain hit
+        assert calls == 1
+
+    def test_loader_error_reaches_every_waiter_and_is_not_cached(
+        self, cache: ConditionsCache
+    ) -> None:
+        def load() -> str:
+            time.sleep(0.2)
+            raise OSError("provider down")
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = [pool.submit(cache.get_or_set, "k", load) for _ in range(4)]
+            errors = [f.exception() for f in futures]
+        assert all(isinstance(e, OSError) for e in errors)
+        assert cache.get_or_set("k", lambda: None) is None
+        assert cache.get("k") is None
+
+    def test_racing_disk_read_does_not_resurrect_old_value(self, cache: ConditionsCache) -> None:
+        cache.set("k", "old")
+        writes = cache._writes  # a get() read "old" from disk here...
+        cache.set("k", "new")  # ...then another thread wrote before it promoted
+        cache._remember("k", "old", None, unless_written_since=writes)
+        assert cache.get("k") == "new"
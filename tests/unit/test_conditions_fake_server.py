@@ -0,0 +1,141 @@
+"""Fake provider server (fault injection) and the load-test harness."""
+
+from __future__ import annotations
+
+import logging
+import random
+from collections.abc import Iterator
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+import requests
+
+from auto_telescope.conditions.nws import NWSProvider
+from auto_telescope.conditions.open_meteo import OpenMeteoProvider
+from auto_telescope.conditions.seven_timer import SevenTimerProvider
+from auto_telescope.config.http import configure_session
+from tests.support.fake_server import (
+    FakeProviderServer,
+    Faults,
+    nws_hourly_payload,
+    open_meteo_payload,
+    payloads_from_cassette,
+    seven_timer_payload,
+)
+from tests.support.loadtest import main, run_load, spread_sites
+
+SITE = (37.366, -122.077)
+CASSETTE = (
+    Path(__file__).parents[1]
+    / "integration"
+    / "cassettes"
+    / "test_real_apis"
+    / "test_aggregator_real_call.yaml"
+)
+
+
+@pytest.fixture
+def server() -> Iterator[FakeProviderServer]:
+    with FakeProviderServer(seed=7) as fake:
+        yield fake
+
+
+def no_retries() -> requests.Session:
+    return configure_session(requests.Session(), retries=0, backoff_seconds=0.0)
+
+
+class TestPayloads:
+    def test_generated_payloads_parse_at_real_sizes(self) -> None:
+        now = datetime(2026, 4, 1, 5, 30, tzinfo=UTC)
+        assert len(SevenTimerProvider()._parse(seven_timer_payload(now))) == 32
+        assert len(NWSProvider()._parse(nws_hourly_payload(now))) == 156
+        assert len(OpenMeteoProvider()._parse(open_meteo_payload(now))) == 168
+
+    def test_cassette_bodies_are_served(self) -> None:
+        pytest.importorskip("yaml")
+        with FakeProviderServer(payloads=payloads_from_cassette(CASSETTE)) as fake:
+            slots = SevenTimerProvider(url=f"{fake.base_url}/7timer").fetch(*SITE)
+        assert slots[0].timestamp_utc.year == 2026 and slots[0].timestamp_utc.month == 4
+
+
+class TestFaults:
+    def test_healthy_server_feeds_every_provider(self, server: FakeProviderServer) -> None:
+        forecasts = server.aggregator().fetch(*SITE)
+        assert forecasts[0].missing_providers == ()
+        assert {p for f in forecasts for p in f.contributing_providers} == {
+            "7timer",
+            "nws",
+            "open-meteo",
+        }
+        assert server.hits == {"7timer": 1, "points": 1, "hourly": 1, "meteo": 1}
+
+    def test_multi_site_open_meteo(self, server: FakeProviderServer) -> None:
+        sites = [SITE, (37.5, -122.2), (34.2, -118.2)]
+        results = server.aggregator().fetch_many(sites)
+        assert all(not isinstance(r, Exception) for r in results.values())
+        assert server.hits["meteo"] == 1
+
+    def test_error_and_rate_limit_statuses(self) -> None:
+        faults = {
+            "7timer": Faults(error_rate=1.0),
+            "meteo": Faults(rate_limit_rate=1.0, retry_after_seconds=7),
+        }
+        with FakeProviderServer(faults=faults) as fake:
+            forecasts = fake.aggregator(session=no_retries()).fetch(*SITE)
+            response = requests.get(f"{fake.base_url}/meteo", timeout=5)
+        assert forecasts[0].missing_providers == ("7timer:failed", "open-meteo:failed")
+        assert fake.statuses["7timer", 503] == 1
+        assert response.status_code == 429 and response.headers["Retry-After"] == "7"
+
+    def test_truncated_body_fails_the_provider(self) -> None:
+        with FakeProviderServer(faults={"hourly": Faults(truncate_rate=1.0)}) as fake:
+            agg = fake.aggregator(session=no_retries())
+            forecasts = agg.fetch(*SITE)
+        assert forecasts[0].missing_providers == ("nws:failed",)
+        assert fake.truncated["hourly"] == 1
+        assert "IncompleteRead" in next(
+            h.last_error for h in agg.health().providers if h.provider == "nws"
+        )
+
+    def test_latency_is_log_normal_around_the_median(self) -> None:
+        rng = random.Random(1)
+        faults = Faults(latency_seconds=0.1, latency_sigma=0.5)
+        delays = sorted(faults.delay(rng) for _ in range(2000))
+        assert delays[1000] == pytest.approx(0.1, rel=0.1)
+        assert delays[1980] > 2.5 * delays[1000]  # the p99 tail
+
+    def test_unknown_route_is_rejected(self) -> None:
+        with pytest.raises(ValueError, match="unknown routes"):
+            FakeProviderServer(faults={"/7timer": Faults()})
+
+
+class TestLoadHarness:
+    def test_report_counts_every_call(self) -> None:
+        faults = dict.fromkeys(("7timer", "hourly", "meteo"), Faults(latency_seconds=0.02))
+        with FakeProviderServer(faults=faults) as fake:
+            agg = fake.aggregator()
+            report = run_load(agg, spread_sites(4), callers=4, calls=24)
+        assert report.calls == 24 and report.failed == 0 and report.degraded == 0
+        assert report.latency_p50_seconds >= 0.02
+        assert report.latency_p50_seconds <= report.latency_p95_seconds
+        assert report.latency_p99_seconds <= report.latency_max_seconds
+        assert report.throughput_per_second > 0
+        assert report.health is not None
+        assert "calls in" in report.format()
+
+    def test_all_down_counts_as_failed(self) -> None:
+        faults = dict.fromkeys(("7timer", "points", "meteo"), Faults(error_rate=1.0))
+        with FakeProviderServer(faults=faults) as fake:
+            report = run_load(fake.aggregator(session=no_retries()), [SITE], callers=2, calls=4)
+        assert report.failed == 4
+
+    def test_cli(self, capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(logging, "basicConfig", lambda **_: None)  # leave pytest's logging be
+        main(["--callers", "2", "--calls", "6", "--sites", "2", "--latency", "0", "--seed", "1"])
+        out = capsys.readouterr().out
+        assert out.startswith("6 calls in")
+        assert "open-meteo" in out
+
+    def test_spread_sites_are_distinct(self) -> None:
+        assert len(set(spread_sites(25))) == 25
@@ -0,0 +1,874 @@
+"""Aggregator fetch behaviour against local stand-in provider servers (no internet)."""
+
+from __future__ import annotations
+
+import json
+import shutil
+import ssl
+import subprocess
+import threading
+import time
+from collections import Counter
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+import requests
+import urllib3
+
+from auto_telescope.conditions.aggregator import AllProvidersDownError, ConditionsAggregator
+from auto_telescope.conditions.archive import ForecastArchive, ReplayProvider
+from auto_telescope.conditions.cache import ConditionsCache
+from auto_telescope.conditions.expiry import (
+    MIN_TTL_SECONDS,
+    ModelRunExpiry,
+    ScheduledExpiry,
+    fresh_until,
+)
+from auto_telescope.conditions.http_cache import (
+    CachedForecast,
+    ProviderResponse,
+    Validators,
+    freshness_lifetime,
+)
+from auto_telescope.conditions.metrics import InMemoryMetrics
+from auto_telescope.conditions.nws import NWSProvider
+from auto_telescope.conditions.open_meteo import OpenMeteoProvider
+from auto_telescope.conditions.series import ForecastSeries
+from auto_telescope.conditions.seven_timer import SevenTimerProvider
+from auto_telescope.config.http import configure_session
+from auto_telescope.config.settings import Settings
+from auto_telescope.safety.interlocks import check_wind
+from tests.support.fake_server import FakeProviderServer, Faults
+
+SITE = (37.366, -122.077)
+SITES = [SITE, (37.5, -122.2), (34.2, -118.2)]
+# Longest a held request waits, and a barrier for its parties, before giving up.
+HOLD_SECONDS = 10.0
+BARRIER_SECONDS = 5.0
+
+SEVEN_TIMER_PAYLOAD = {
+    "init": "2026040100",
+    "dataseries": [
+        {
+            "timepoint": 3,
+            "cloudcover": 2,
+            "seeing": 3,
+            "transparency": 3,
+            "wind10m": {"speed": 2},
+            "rh2m": "0",
+            "temp2m": 12,
+        }
+    ],
+}
+NWS_HOURLY_PAYLOAD = {
+    "properties": {
+        "periods": [
+            {
+                "startTime": "2026-04-01T03:00:00+00:00",
+                "endTime": "2026-04-01T04:00:00+00:00",
+                "temperature": 54,
+                "temperatureUnit": "F",
+                "windSpeed": "5 mph",
+                "windDirection": "NW",
+                "shortForecast": "Clear",
+            }
+        ]
+    }
+}
+OPEN_METEO_PAYLOAD = {
+    "hourly": {
+        "time": ["2026-04-01T03:00", "2026-04-01T04:00"],
+        "cloud_cover": [10, 20],
+        "visibility": [24000, 24000],
+        "wind_speed_10m": [2.0, 3.0],
+    }
+}
+
+
+class StandIn:
+    """One local HTTP server that answers for all three providers.
+
+    ``delays`` maps a path ("/7timer", "/points", "/hourly", "/meteo") to seconds slept
+    before responding; ``failures`` maps a path to status codes returned (in order)
+    before the real payload; ``redirects`` maps a path to a 301 target. ``headers`` adds
+    response headers per path; a matching ``If-None-Match`` / ``If-Modified-Since`` gets
+    a 304. ``holds`` maps a path to an event its requests wait for before answering;
+    ``barriers`` to a barrier they must all reach together (503 if it breaks), which
+    proves requests were in flight at once. ``connections`` counts accepted TCP (or TLS)
+    connections, ``hits`` requests, ``peak`` the most requests in flight at once and
+    ``not_modified`` 304s per path. A comma-separated ``latitude`` gets one payload per
+    site, as Open-Meteo answers.
+    """
+
+    def __init__(self, *, tls: ssl.SSLContext | None = None) -> None:
+        self.delays: dict[str, float] = {}
+        self.failures: dict[str, list[int]] = {}
+        self.redirects: dict[str, str] = {}
+        self.holds: dict[str, threading.Event] = {}
+        self.barriers: dict[str, threading.Barrier] = {}
+        self.connections = 0
+        self.headers: dict[str, dict[str, str]] = {}
+        self.hits: Counter[str] = Counter()
+        self.not_modified: Counter[str] = Counter()
+        self.peak: Counter[str] = Counter()
+        self._active: Counter[str] = Counter()
+        self._lock = threading.Lock()
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive
+            disable_nagle_algorithm = True  # else delayed ACKs add ~40 ms per response
+
+            def setup(self) -> None:
+                stand_in.connections += 1
+                super().setup()
+
+            def do_GET(self) -> None:
+                path = urlsplit(self.path).path
+                route = "/points" if path.startswith("/points") else path
+                with stand_in._lock:
+                    stand_in.hits[route] += 1
+                    stand_in._active[route] += 1
+                    stand_in.peak[route] = max(stand_in.peak[route], stand_in._active[route])
+                try:
+                    self.answer(route)
+                finally:
+                    with stand_in._lock:
+                        stand_in._active[route] -= 1
+
+            def answer(self, route: str) -> None:
+                time.sleep(stand_in.delays.get(route, 0.0))
+                if route in stand_in.holds:
+                    stand_in.holds[route].wait(timeout=HOLD_SECONDS)
+                if route in stand_in.barriers:
+                    try:
+                        stand_in.barriers[route].wait()
+                    except threading.BrokenBarrierError:
+                        self.send_error(503)
+                        return
+                pending = stand_in.failures.get(route)
+                if pending:
+                    self.send_error(pending.pop(0))
+                    return
+                if route in stand_in.redirects:
+                    self.send_response(301)
+                    self.send_header("Location", stand_in.base + stand_in.redirects[route])
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                body: Any = stand_in.payload(route)
+                if body is None:
+                    self.send_error(404)
+                    return
+                sites = parse_qs(urlsplit(self.path).query).get("latitude", [""])[0].count(",")
+                if sites:  # an Open-Meteo multi-location request
+                    body = [body] * (sites + 1)
+                extra = stand_in.headers.get(route, {})
+                etag, modified = extra.get("ETag"), extra.get("Last-Modified")
+                if (etag and self.headers.get("If-None-Match") == etag) or (
+                    modified and self.headers.get("If-Modified-Since") == modified
+                ):
+                    stand_in.not_modified[route] += 1
+                    self.send_response(304)
+                    data = b""
+                else:
+                    data = json.dumps(body).encode()
+                    self.send_response(200)
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("Content-Length", str(len(data)))
+                for name, value in extra.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        if tls is not None:
+            self.server.socket = tls.wrap_socket(self.server.socket, server_side=True)
+        scheme = "https" if tls is not None else "http"
+        self.base = f"{scheme}://127.0.0.1:{self.server.server_address[1]}"
+        self._thread = threading.Thread(
+            target=self.server.serve_forever, kwargs={"poll_interval": 0.02}, daemon=True
+        )
+        self._thread.start()
+
+    def payload(self, route: str) -> dict[str, Any] | None:
+        return {
+            "/7timer": SEVEN_TIMER_PAYLOAD,
+            "/points": {"properties": {"forecastHourly": f"{self.base}/hourly"}},
+            "/hourly": NWS_HOURLY_PAYLOAD,
+            "/hourly-v2": NWS_HOURLY_PAYLOAD,
+            "/meteo": OPEN_METEO_PAYLOAD,
+        }.get(route)
+
+    def aggregator(
+        self,
+        *,
+        deadline_seconds: float = 25.0,
+        session: requests.Session | None = None,
+        cache: ConditionsCache | None = None,
+        max_stale_seconds: int = 0,
+        max_data_age_seconds: float | None = None,
+        metrics: InMemoryMetrics | None = None,
+    ) -> ConditionsAggregator:
+        session = session or configure_session(requests.Session(), backoff_seconds=0.0)
+        metrics = metrics or InMemoryMetrics()
+        return ConditionsAggregator(
+            seven_timer=SevenTimerProvider(
+                url=f"{self.base}/7timer", session=session, metrics=metrics
+            ),
+            nws=NWSProvider(
+                points_url=self.base + "/points/{lat:.4f},{lon:.4f}",
+                session=session,
+                metrics=metrics,
+            ),
+            open_meteo=OpenMeteoProvider(
+                url=f"{self.base}/meteo", session=session, metrics=metrics
+            ),
+            cache=cache,
+            deadline_seconds=deadline_seconds,
+            max_stale_seconds=max_stale_seconds,
+            max_data_age_seconds=max_data_age_seconds,
+            metrics=metrics,
+        )
+
+    def close(self) -> None:
+        for hold in self.holds.values():
+            hold.set()  # let held requests finish
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def stand_in() -> Iterator[StandIn]:
+    server = StandIn()
+    yield server
+    server.close()
+
+
+@pytest.fixture(scope="module")
+def self_signed(tmp_path_factory: pytest.TempPathFactory) -> tuple[Path, Path]:
+    openssl = shutil.which("openssl")
+    if openssl is None:
+        pytest.skip("openssl not available to mint a test certificate")
+    tmp = tmp_path_factory.mktemp("tls")
+    cert, key = tmp / "cert.pem", tmp / "key.pem"
+    subprocess.run(
+        [openssl, "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1",
+         "-subj", "/CN=127.0.0.1", "-addext", "subjectAltName=IP:127.0.0.1",
+         "-keyout", str(key), "-out", str(cert)],
+        check=True,
+        capture_output=True,
+    )  # fmt: skip
+    return cert, key
+
+
+@pytest.fixture
+def tls_stand_in(self_signed: tuple[Path, Path]) -> Iterator[StandIn]:
+    cert, key = self_signed
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(cert, key)
+    server = StandIn(tls=context)
+    yield server
+    server.close()
+
+
+class TestConcurrentFetch:
+    def test_providers_are_fetched_at_once(self, stand_in: StandIn) -> None:
+        # Each provider's request answers only once all three are in flight.
+        barrier = threading.Barrier(3, timeout=BARRIER_SECONDS)
+        stand_in.barriers = dict.fromkeys(("/7timer", "/hourly", "/meteo"), barrier)
+        forecasts = stand_in.aggregator().fetch(*SITE)
+        providers = {p for f in forecasts for p in f.contributing_providers}
+        assert providers == {"7timer", "nws", "open-meteo"}
+        assert not barrier.broken
+
+    def test_deadline_drops_slow_provider(self, stand_in: StandIn) -> None:
+        stand_in.holds = {"/meteo": threading.Event()}
+        forecasts = stand_in.aggregator(deadline_seconds=0.5).fetch(*SITE)
+        assert forecasts[0].missing_providers == ("open-meteo:deadline",)
+        providers = {p for f in forecasts for p in f.contributing_providers}
+        assert providers == {"7timer", "nws"}
+
+    def test_failing_provider_is_still_fail_soft(self, stand_in: StandIn) -> None:
+        agg = stand_in.aggregator()
+        agg.nws = NWSProvider(points_url=stand_in.base + "/missing/{lat},{lon}")
+        forecasts = agg.fetch(*SITE)
+        providers = {p for f in forecasts for p in f.contributing_providers}
+        assert providers == {"7timer", "open-meteo"}
+
+
+class TestSingleFlight:
+    def test_concurrent_callers_share_one_fetch(self, stand_in: StandIn, tmp_path: Path) -> None:
+        stand_in.delays = {"/7timer": 0.3, "/hourly": 0.3, "/meteo": 0.3}
+        with ConditionsCache(tmp_path) as cache:
+            agg = stand_in.aggregator(cache=cache)
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                results = list(pool.map(lambda _: agg.fetch(*SITE), range(8)))
+        assert all(r == results[0] for r in results)
+        assert stand_in.hits["/7timer"] == stand_in.hits["/meteo"] == 1
+        assert stand_in.hits["/points"] == stand_in.hits["/hourly"] == 1
+
+    def test_callers_share_the_failure(self, stand_in: StandIn) -> None:
+        stand_in.delays = {"/7timer": 0.3}
+        stand_in.failures = {"/7timer": [404] * 8, "/points": [404] * 8, "/meteo": [404] * 8}
+        agg = stand_in.aggregator()
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = [pool.submit(agg.fetch, *SITE) for _ in range(4)]
+            errors = [f.exception() for f in futures]
+        assert all(isinstance(e, AllProvidersDownError) for e in errors)
+        assert stand_in.hits["/7timer"] == 1
+
+
+class TestFetchMany:
+    def test_sites_cost_about_one_fetch(self, stand_in: StandIn, tmp_path: Path) -> None:
+        # The three sites' 7Timer (and NWS) requests answer only once all are in flight.
+        stand_in.barriers = {
+            "/7timer": threading.Barrier(3, timeout=BARRIER_SECONDS),
+            "/hourly": threading.Barrier(3, timeout=BARRIER_SECONDS),
+        }
+        with ConditionsCache(tmp_path) as cache:
+            agg = stand_in.aggregator(cache=cache)
+            merged = agg.fetch_many([*SITES, SITE])
+            assert list(merged) == SITES  # duplicates collapse
+            assert stand_in.hits["/meteo"] == 1  # one batched request
+            assert stand_in.hits["/7timer"] == stand_in.hits["/hourly"] == 3
+
+            for series in merged.values():
+                assert isinstance(series, ForecastSeries)
+                providers = {p for f in series for p in f.contributing_providers}
+                assert providers == {"7timer", "nws", "open-meteo"}
+            assert agg.fetch_many(SITES).keys() == merged.keys()  # all cached now
+            assert stand_in.hits["/meteo"] == 1
+            assert cache.get(f"open-meteo:{SITE[0]:.4f},{SITE[1]:.4f}") is not None
+
+    def test_per_provider_concurrency_limit(self, stand_in: StandIn) -> None:
+        stand_in.delays = {"/7timer": 0.1}
+        agg = stand_in.aggregator()
+        agg.max_concurrency = 1
+        agg.fetch_many(SITES)
+        assert stand_in.hits["/7timer"] == 3
+        assert stand_in.peak["/7timer"] == 1  # one at a time
+        agg.close()
+
+    def test_concurrency_limit_spans_callers(self, stand_in: StandIn) -> None:
+        stand_in.delays = {"/7timer": 0.1}
+        agg = stand_in.aggregator()
+        agg.max_concurrency = 1
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            list(pool.map(agg.fetch_many, [SITES[:2], [SITES[2], (35.0, -117.0)]]))
+        assert stand_in.hits["/7timer"] == 4
+        assert stand_in.peak["/7timer"] == 1  # one at a time across both callers
+        agg.close()
+
+    def test_site_fetch_joins_a_running_batch(self, stand_in: StandIn, tmp_path: Path) -> None:
+        stand_in.delays = {"/meteo": 0.3}
+        with ConditionsCache(tmp_path) as cache:
+            agg = stand_in.aggregator(cache=cache)
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                batch = pool.submit(agg.fetch_many, SITES)
+                time.sleep(0.1)  # the batch request is in flight
+                single = agg.fetch(*SITE)
+                merged = batch.result()
+        assert stand_in.hits["/meteo"] == 1
+        assert single == merged[SITE].forecasts()
+
+    def test_failed_site_does_not_fail_the_batch(self, stand_in: StandIn) -> None:
+        agg = stand_in.aggregator()
+        agg.seven_timer = SevenTimerProvider(url=f"{stand_in.base}/missing")
+        agg.nws = NWSProvider(points_url=stand_in.base + "/missing/{lat},{lon}")
+        stand_in.failures = {"/meteo": [404]}
+        merged = agg.fetch_many(SITES[:2])
+        assert all(isinstance(r, AllProvidersDownError) for r in merged.values())
+
+
+class TestCircuitBreaker:
+    def test_down_provider_is_skipped_then_probed(self, stand_in: StandIn) -> None:
+        stand_in.failures = {"/7timer": [404] * 10}
+        agg = stand_in.aggregator()
+        agg.breaker_failure_threshold = 2
+        agg.breaker_cooldown_seconds = 0.3
+        assert agg.fetch(*SITE)[0].missing_providers == ("7timer:failed",)
+        # The failure that opens the breaker is still reported as a failure.
+        assert agg.fetch(*SITE)[0].missing_providers == ("7timer:failed",)
+        assert stand_in.hits["/7timer"] == 2
+        forecasts = agg.fetch(*SITE)
+        assert stand_in.hits["/7timer"] == 2  # skipped without a request
+        assert forecasts[0].missing_providers == ("7timer:breaker-open",)
+        assert forecasts[0].contributing_providers == ("nws", "open-meteo")
+        assert agg.breaker_status()["7timer"].state == "open"
+
+        stand_in.failures.clear()
+        time.sleep(0.3)  # cooldown over
+        forecasts = agg.fetch(*SITE)
+        assert stand_in.hits["/7timer"] == 3  # the probe
+        assert forecasts[0].missing_providers == ()
+        assert agg.breaker_status()["7timer"].state == "closed"
+
+    def test_fetch_many_counts_one_failure_per_call(self, stand_in: StandIn) -> None:
+        stand_in.failures = {"/7timer": [404] * 10}
+        agg = stand_in.aggregator()
+        agg.breaker_failure_threshold = 2
+        merged = agg.fetch_many(SITES)
+        assert stand_in.hits["/7timer"] == len(SITES)
+        for series in merged.values():
+            assert isinstance(series, ForecastSeries)
+            assert series.grid.missing_providers == ("7timer:failed",)
+        status = agg.breaker_status()["7timer"]
+        assert (status.state, status.consecutive_failures) == ("closed", 1)
+
+        agg.fetch_many(SITES)  # the second failing call opens it
+        assert agg.breaker_status()["7timer"].state == "open"
+
+    def test_deadline_miss_is_reported(self, stand_in: StandIn) -> None:
+        stand_in.delays = {"/meteo": 1.0}
+        forecasts = stand_in.aggregator(deadline_seconds=0.3).fetch(*SITE)
+        assert forecasts[0].missing_providers == ("open-meteo:deadline",)
+
+
+class TestHealth:
+    def test_report_covers_calls_latency_and_failures(self, stand_in: StandIn) -> None:
+        stand_in.delays = {"/meteo": 0.05}
+        stand_in.failures = {"/7timer": [404] * 10}
+        agg = stand_in.aggregator()
+        agg.breaker_failure_threshold = 2
+        for _ in range(3):
+            agg.fetch(*SITE)
+        health = {h.provider: h for h in agg.health().providers}
+
+        seven = health["7timer"]
+        assert (seven.ok, seven.errors, seven.skipped) == (0, 2, 1)
+        assert seven.error_rate == 1.0
+        assert seven.breaker == "open"
+        assert "404" in seven.last_error
+        assert seven.parse_mean_seconds is None  # nothing got as far as parsing
+
+        meteo = health["open-meteo"]
+        assert (meteo.ok, meteo.errors) == (3, 0)
+        assert meteo.request_p50_seconds is not None and meteo.request_p50_seconds >= 0.05
+        assert meteo.response_bytes > 0
+        assert meteo.parse_mean_seconds is not None
+        assert health["nws"].breaker == "closed"
+
+    def test_probe_asks_every_provider_now(self, stand_in: StandIn) -> None:
+        stand_in.failures = {"/hourly": [503] * 10}
+        agg = stand_in.aggregator()
+        report = agg.health(probe_site=SITE)
+        assert stand_in.hits["/7timer"] == 1 and stand_in.hits["/meteo"] == 1
+        health = {h.provider: h for h in report.providers}
+        assert health["nws"].errors == 1 and "503" in health["nws"].last_error
+        assert health["7timer"].ok == 1
+        assert "nws" in report.format()
+
+    def test_cache_tiers_are_counted(self, stand_in: StandIn, tmp_path: Path) -> None:
+        metrics = InMemoryMetrics()
+        cache = ConditionsCache(tmp_path, default_ttl_seconds=900, metrics=metrics)
+        agg = stand_in.aggregator(cache=cache, metrics=metrics)
+        agg.fetch(*SITE)
+        agg.fetch(*SITE)
+        lookups = agg.health().cache_lookups
+        assert lookups["miss"] >= 3  # three providers, plus the NWS gridpoint
+        assert lookups["memory"] == 3
+
+
+class TestPooledSession:
+    def test_keep_alive_reuses_one_tls_connection(
+        self, tls_stand_in: StandIn, self_signed: tuple[Path, Path]
+    ) -> None:
+        cert, _ = self_signed
+        url = f"{tls_stand_in.base}/7timer"
+
+        for _ in range(10):
+            requests.get(url, verify=str(cert), timeout=5).raise_for_status()
+        assert tls_stand_in.connections == 10  # a full TLS handshake per request
+
+        tls_stand_in.connections = 0
+        session = configure_session(requests.Session())
+        session.trust_env = False  # REQUESTS_CA_BUNDLE would override session.verify
+        session.verify = str(cert)
+        provider = SevenTimerProvider(url=url, session=session)
+        for _ in range(10):
+            assert provider.fetch(*SITE)
+        assert tls_stand_in.connections == 1
+
+    def test_retries_transient_errors(self, stand_in: StandIn) -> None:
+        stand_in.failures = {"/7timer": [503, 502], "/meteo": [429]}
+        forecasts = stand_in.aggregator().fetch(*SITE)
+        providers = {p for f in forecasts for p in f.contributing_providers}
+        assert providers == {"7timer", "nws", "open-meteo"}
+
+    def test_gives_up_after_retry_budget(self, stand_in: StandIn) -> None:
+        stand_in.failures = {"/7timer": [503, 503, 503]}
+        forecasts = stand_in.aggregator().fetch(*SITE)
+        providers = {p for f in forecasts for p in f.contributing_providers}
+        assert providers == {"nws", "open-meteo"}
+
+    def test_read_timeouts_are_not_retried(self, stand_in: StandIn) -> None:
+        stand_in.delays = {"/7timer": 0.5}
+        provider = SevenTimerProvider(
+            url=f"{stand_in.base}/7timer",
+            session=configure_session(requests.Session(), backoff_seconds=0.0),
+            timeout_seconds=(1.0, 0.2),
+        )
+        with pytest.raises(requests.ConnectionError):  # urllib3's ReadTimeoutError
+            provider.fetch(*SITE)
+        assert stand_in.hits["/7timer"] == 1
+
+    def test_retry_after_wait_is_capped(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        waits: list[float] = []
+        clock = SimpleNamespace(sleep=waits.append, time=time.time)
+        monkeypatch.setattr(urllib3.util.retry, "time", clock)  # record, don't sleep
+        faults = {"7timer": Faults(rate_limit_rate=1.0, retry_after_seconds=30)}
+        session = configure_session(requests.Session(), retries=1, max_wait_seconds=0.1)
+        with FakeProviderServer(faults=faults) as fake:
+            response = session.get(f"{fake.base_url}/7timer", timeout=5)
+        assert response.status_code == 429
+        assert fake.hits["7timer"] == 2  # retried once
+        assert waits == [0.1]  # rather than the 30 s the server asked for
+
+
+class TestNWSPointsCache:
+    def _provider(self, stand_in: StandIn, cache: ConditionsCache | None = None) -> NWSProvider:
+        return NWSProvider(
+            points_url=stand_in.base + "/points/{lat:.4f},{lon:.4f}",
+            session=configure_session(requests.Session(), backoff_seconds=0.0),
+            points_cache=cache,
+        )
+
+    def test_gridpoint_is_resolved_once(self, stand_in: StandIn) -> None:
+        provider = self._provider(stand_in)
+        for _ in range(3):
+            assert provider.fetch(*SITE)
+        assert stand_in.hits["/points"] == 1
+        assert stand_in.hits["/hourly"] == 3
+
+    def test_gridpoint_survives_restart_via_disk_cache(
+        self, stand_in: StandIn, tmp_path: Path
+    ) -> None:
+        with ConditionsCache(tmp_path) as cache:
+            self._provider(stand_in, cache).fetch(*SITE)
+        with ConditionsCache(tmp_path) as cache:
+            self._provider(stand_in, cache).fetch(*SITE)
+        assert stand_in.hits["/points"] == 1
+        assert stand_in.hits["/hourly"] == 2
+
+    @pytest.mark.parametrize("moved", ["404", "redirect"])
+    def test_moved_gridpoint_is_re_resolved(
+        self, stand_in: StandIn, tmp_path: Path, moved: str
+    ) -> None:
+        with ConditionsCache(tmp_path) as cache:
+            provider = self._provider(stand_in, cache)
+            cache.set(f"nws-points:{SITE[0]:.4f},{SITE[1]:.4f}", f"{stand_in.base}/hourly-v2")
+            if moved == "404":
+                stand_in.failures = {"/hourly-v2": [404]}
+            else:
+                stand_in.redirects = {"/hourly-v2": "/hourly"}
+
+            assert provider.fetch(*SITE)
+            assert stand_in.hits["/points"] == 1
+            assert cache.get(f"nws-points:{SITE[0]:.4f},{SITE[1]:.4f}") == f"{stand_in.base}/hourly"
+
+
+class TestConditionalRequests:
+    def test_fresh_entries_skip_the_network(self, stand_in: StandIn, tmp_path: Path) -> None:
+        with ConditionsCache(tmp_path) as cache:
+            agg = stand_in.aggregator(cache=cache)
+            first = agg.fetch(*SITE)
+            assert agg.fetch(*SITE) == first
+        assert stand_in.hits["/7timer"] == stand_in.hits["/meteo"] == stand_in.hits["/hourly"] == 1
+
+    def test_stale_entry_revalidates_with_etag(self, stand_in: StandIn, tmp_path: Path) -> None:
+        # max-age=0 is shorter than our 900 s default and must win.
+        stand_in.headers = {
+            "/meteo": {"ETag": '"v1"', "Cache-Control": "max-age=0"},
+            "/7timer": {
+                "Last-Modified": "Wed, 01 Apr 2026 00:00:00 GMT",
+                "Cache-Control": "no-cache",
+            },
+        }
+        with ConditionsCache(tmp_path) as cache:
+            agg = stand_in.aggregator(cache=cache)
+            first = agg.fetch(*SITE)
+            for _ in range(2):
+                again = agg.fetch(*SITE)
+                # Same data; a 304 re-confirms it, so only the issue time moves on.
+                assert [replace(f, issued_utc=None) for f in again] == [
+                    replace(f, issued_utc=None) for f in first
+                ]
+        assert stand_in.hits["/meteo"] == stand_in.hits["/7timer"] == 3
+        assert stand_in.not_modified["/meteo"] == stand_in.not_modified["/7timer"] == 2
+        assert stand_in.hits["/hourly"] == 1  # no cache headers: NWS's hourly schedule applies
+
+    def test_304_extends_freshness(self, stand_in: StandIn, tmp_path: Path) -> None:
+        stand_in.headers = {"/meteo": {"ETag": '"v1"', "Cache-Control": "max-age=7200"}}
+        key = f"open-meteo:{SITE[0]:.4f},{SITE[1]:.4f}"
+        with ConditionsCache(tmp_path, default_ttl_seconds=900) as cache:
+            agg = stand_in.aggregator(cache=cache)
+            agg.fetch(*SITE)
+            entry = cache.get(key)
+            assert isinstance(entry, CachedForecast)
+            # Longer than our default, so the server's 2 h wins.
+            assert (entry.fresh_until - entry.fetched_at).total_seconds() == pytest.approx(7200)
+
+            cache.set(key, replace(entry, fresh_until=entry.fetched_at))  # force staleness
+            agg.fetch(*SITE)
+            revalidated = cache.get(key)
+        assert stand_in.not_modified["/meteo"] == 1
+        assert revalidated.slots == entry.slots
+        assert revalidated.is_fresh()
+
+    def test_changed_payload_replaces_entry(self, stand_in: StandIn, tmp_path: Path) -> None:
+        stand_in.headers = {"/meteo": {"ETag": '"v1"', "Cache-Control": "max-age=0"}}
+        with ConditionsCache(tmp_path) as cache:
+            agg = stand_in.aggregator(cache=cache)
+            agg.fetch(*SITE)
+            stand_in.headers = {"/meteo": {"ETag": '"v2"', "Cache-Control": "max-age=0"}}
+            agg.fetch(*SITE)
+            entry = cache.get(f"open-meteo:{SITE[0]:.4f},{SITE[1]:.4f}")
+        assert stand_in.not_modified["/meteo"] == 0
+        assert entry.validators.etag == '"v2"'
+
+    @pytest.mark.parametrize(
+        ("headers", "expected"),
+        [
+            ({}, None),
+            ({"Cache-Control": "public, max-age=600"}, 600.0),
+            ({"Cache-Control": "max-age=600", "Age": "100"}, 500.0),
+            ({"Cache-Control": "no-cache, max-age=600"}, 0.0),
+            (
+                {
+                    "Expires": "Wed, 01 Apr 2026 01:00:00 GMT",
+                    "Date": "Wed, 01 Apr 2026 00:30:00 GMT",
+                },
+                1800.0,
+            ),
+            ({"Expires": "0"}, 0.0),
+        ],
+    )
+    def test_freshness_lifetime(self, headers: dict[str, str], expected: float | None) -> None:
+        assert freshness_lifetime(headers) == expected
+
+
+class TestStaleWhileRevalidate:
+    def test_stale_entry_is_served_while_refreshing(
+        self, stand_in: StandIn, tmp_path: Path
+    ) -> None:
+        stale = {"Cache-Control": "max-age=0"}
+        stand_in.headers = {"/7timer": stale, "/hourly": stale, "/meteo": stale}
+        with ConditionsCache(tmp_path) as cache:
+            agg = stand_in.aggregator(cache=cache, max_stale_seconds=3600)
+            first = agg.fetch(*SITE)
+            issued = first[0].issued_utc
+            assert issued is not None
+            assert abs((datetime.now(UTC) - issued).total_seconds()) < 5
+
+            # Refreshes are held until released; an inline one would return new data.
+            stand_in.holds = {
+                route: threading.Event() for route in ("/7timer", "/hourly", "/meteo")
+            }
+            second = agg.fetch(*SITE)
+            assert second == first  # same data, same issue time
+            agg.fetch(*SITE)  # refresh already in flight: not started twice
+            for hold in stand_in.holds.values():
+                hold.set()
+            agg.close()  # wait for the background refresh
+
+            third = agg.fetch(*SITE)
+            agg.close()
+        assert stand_in.hits["/7timer"] == stand_in.hits["/meteo"] == 3
+        assert third[0].issued_utc is not None and third[0].issued_utc > issued
+
+    def test_too_stale_entry_is_refetched_inline(self, stand_in: StandIn, tmp_path: Path) -> None:
+        key = f"open-meteo:{SITE[0]:.4f},{SITE[1]:.4f}"
+        with ConditionsCache(tmp_path) as cache:
+            agg = stand_in.aggregator(cache=cache, max_stale_seconds=3600)
+            agg.fetch(*SITE)
+            entry = cache.get(key)
+            long_ago = datetime.now(UTC) - timedelta(hours=3)
+            cache.set(key, replace(entry, fetched_at=long_ago, fresh_until=long_ago))
+
+            forecasts = agg.fetch(*SITE)
+        assert stand_in.hits["/meteo"] == 2  # refetched before returning
+        assert forecasts[0].age_seconds() is not None
+        assert forecasts[0].age_seconds() < 60
+
+
+class TestModelRunExpiry:
+    NOW = datetime(2026, 4, 1, 8, 20, tzinfo=UTC)
+
+    def test_fresh_until_next_run_is_published(self) -> None:
+        run = datetime(2026, 4, 1, 0, tzinfo=UTC)
+        due = ModelRunExpiry().next_update(model_run_utc=run, now=self.NOW)
+        assert due == datetime(2026, 4, 1, 11, tzinfo=UTC)  # 06Z run + 5 h publish lag
+
+    def test_overdue_run_is_polled(self) -> None:
+        run = datetime(2026, 3, 31, 18, tzinfo=UTC)
+        due = ModelRunExpiry(retry_seconds=900).next_update(model_run_utc=run, now=self.NOW)
+        assert due == self.NOW + timedelta(seconds=900)
+
+    def test_scheduled_expiry_next_boundary(self) -> None:
+        policy = ScheduledExpiry(every_minutes=60, offset_minutes=10)
+        assert policy.next_update(model_run_utc=None, now=self.NOW) == datetime(
+            2026, 4, 1, 9, 10, tzinfo=UTC
+        )
+        on_boundary = datetime(2026, 4, 1, 9, 10, tzinfo=UTC)
+        assert policy.next_update(model_run_utc=None, now=on_boundary) == datetime(
+            2026, 4, 1, 10, 10, tzinfo=UTC
+        )
+
+    @pytest.mark.parametrize(
+        ("max_age", "policy", "expected_seconds"),
+        [
+            (120.0, ModelRunExpiry(), 120.0),  # server headers win
+            (None, ModelRunExpiry(), 2 * 3600 + 40 * 60),  # until 11Z
+            (None, ScheduledExpiry(offset_minutes=20.5), MIN_TTL_SECONDS),  # due in 30 s
+            (None, None, 900.0),  # neither says: our default
+        ],
+    )
+    def test_fresh_until_precedence(
+        self, max_age: float | None, policy: Any, expected_seconds: float
+    ) -> None:
+        response = ProviderResponse(slots=[], validators=Validators(), max_age_seconds=max_age)
+        until = fresh_until(
+            response,
+            model_run_utc=datetime(2026, 4, 1, 0, tzinfo=UTC),
+            policy=policy,
+            default_ttl_seconds=900,
+            now=self.NOW,
+        )
+        assert (until - self.NOW).total_seconds() == expected_seconds
+
+    def test_seven_timer_not_refetched_until_next_run(
+        self, stand_in: StandIn, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        run = datetime.now(UTC).replace(minute=0, second=0, microsecond=0)
+        monkeypatch.setitem(SEVEN_TIMER_PAYLOAD, "init", run.strftime("%Y%m%d%H"))
+        with ConditionsCache(tmp_path, default_ttl_seconds=0) as cache:
+            agg = stand_in.aggregator(cache=cache)
+            agg.fetch(*SITE)
+            entry = cache.get(f"7timer:{SITE[0]:.4f},{SITE[1]:.4f}")
+            assert entry.model_run_utc == run
+            assert entry.fresh_until == run + timedelta(hours=11)
+            agg.fetch(*SITE)
+        assert stand_in.hits["/7timer"] == 1
+
+    def test_freshness_is_capped_below_the_safety_age_limit(
+        self, stand_in: StandIn, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        run = datetime.now(UTC).replace(minute=0, second=0, microsecond=0)
+        monkeypatch.setitem(SEVEN_TIMER_PAYLOAD, "init", run.strftime("%Y%m%d%H"))
+        key = f"7timer:{SITE[0]:.4f},{SITE[1]:.4f}"
+        with ConditionsCache(tmp_path, default_ttl_seconds=0) as cache:
+            agg = stand_in.aggregator(cache=cache, max_data_age_seconds=7200)
+            agg.fetch(*SITE)
+            entry = cache.get(key)
+            # The next 7Timer run is 11 h away, but the data may not get 2 h old.
+            assert entry.fresh_until - entry.fetched_at <= timedelta(seconds=7200)
+
+            # Two hours and a bit later, as far as the cache can tell.
+            later = timedelta(hours=2, minutes=5)
+            cache.set(
+                key,
+                replace(
+                    entry,
+                    fetched_at=entry.fetched_at - later,
+                    fresh_until=entry.fresh_until - later,
+                ),
+            )
+            forecast = agg.fetch(*SITE)[0]
+        assert stand_in.hits["/7timer"] == 2
+        wind = check_wind(forecast, max_wind_speed_mps=100.0, max_forecast_age_seconds=7200)
+        assert wind.safe, wind.detail
+
+    def test_model_run_expiry_outlives_the_default_refresh_margin(
+        self, stand_in: StandIn, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        run = datetime.now(UTC).replace(minute=0, second=0, microsecond=0)
+        monkeypatch.setitem(SEVEN_TIMER_PAYLOAD, "init", run.strftime("%Y%m%d%H"))
+        key = f"7timer:{SITE[0]:.4f},{SITE[1]:.4f}"
+        defaults = Settings()
+        with ConditionsCache(tmp_path, default_ttl_seconds=0) as cache:
+            agg = stand_in.aggregator(
+                cache=cache,
+                max_stale_seconds=defaults.cache_max_stale_seconds,
+                max_data_age_seconds=defaults.max_forecast_age_seconds,
+            )
+            agg.fetch(*SITE)
+            entry = cache.get(key)
+            lifetime = entry.fresh_until - entry.fetched_at
+            assert lifetime > timedelta(minutes=45)
+
+            def age_entry_by(delta: timedelta) -> None:
+                cache.set(
+                    key,
+                    replace(
+                        entry,
+                        fetched_at=entry.fetched_at - delta,
+                        fresh_until=entry.fresh_until - delta,
+                    ),
+                    ttl_seconds=86400,
+                )
+
+            age_entry_by(timedelta(minutes=50))
+            agg.fetch(*SITE)
+            assert stand_in.hits["/7timer"] == 1  # still fresh: no request
+
+            # Stale but young enough: served while a refresh runs in the background.
+            age_entry_by(lifetime + timedelta(minutes=5))
+            agg.fetch(*SITE)
+            agg.close()
+            assert stand_in.hits["/7timer"] == 2
+
+            # Past the safety age limit: refetched inline, never served stale.
+            age_entry_by(timedelta(seconds=defaults.max_forecast_age_seconds + 60))
+            forecast = agg.fetch(*SITE)[0]
+            agg.close()
+        assert stand_in.hits["/7timer"] == 3
+        wind = check_wind(
+            forecast,
+            max_wind_speed_mps=100.0,
+            max_forecast_age_seconds=defaults.max_forecast_age_seconds,
+        )
+        assert wind.safe, wind.detail
+
+    def test_overdue_seven_timer_run_is_polled(self, stand_in: StandIn, tmp_path: Path) -> None:
+        with ConditionsCache(tmp_path) as cache:
+            stand_in.aggregator(cache=cache).fetch(*SITE)  # payload init is 2026040100
+            entry = cache.get(f"7timer:{SITE[0]:.4f},{SITE[1]:.4f}")
+        ttl = (entry.fresh_until - entry.fetched_at).total_seconds()
+        assert ttl == pytest.approx(ModelRunExpiry().retry_seconds, abs=5)
+
+
+class TestArchiveReplay:
+    def test_recorded_fetch_replays_without_http(self, stand_in: StandIn, tmp_path: Path) -> None:
+        archive = ForecastArchive(tmp_path / "archive")
+        with ConditionsCache(tmp_path / "cache") as cache:
+            agg = stand_in.aggregator(cache=cache)
+            agg.archive = archive
+            live = agg.fetch(*SITE)
+            agg.fetch(*SITE)  # served from cache: nothing new to archive
+        assert [len(list(archive.batches(s))) for s in ("7timer", "nws", "open-meteo")] == [1, 1, 1]
+        assert archive.forecasts(*SITE) == live
+
+        hits = sum(stand_in.hits.values())
+        replay = ConditionsAggregator(
+            seven_timer=ReplayProvider(archive, "7timer"),  # type: ignore[arg-type]
+            nws=ReplayProvider(archive, "nws"),  # type: ignore[arg-type]
+            open_meteo=ReplayProvider(archive, "open-meteo"),  # type: ignore[arg-type]
+        )
+        replayed = replay.fetch(*SITE)
+        assert [replace(f, issued_utc=None) for f in replayed] == [
+            replace(f, issued_utc=None) for f in live
+        ]
+        assert sum(stand_in.hits.values()) == hits
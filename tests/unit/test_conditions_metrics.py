@@ -0,0 +1,93 @@
+"""In-memory metrics sink and the provider health summary."""
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from auto_telescope.conditions.metrics import (
+    PARSE_SECONDS,
+    PROVIDER_CALLS,
+    REQUEST_SECONDS,
+    RESPONSE_BYTES,
+    InMemoryMetrics,
+    default_metrics,
+    timed,
+)
+
+
+class TestInMemoryMetrics:
+    def test_counters_are_kept_per_label_set(self) -> None:
+        m = InMemoryMetrics()
+        m.increment(PROVIDER_CALLS, provider="nws", outcome="ok")
+        m.increment(PROVIDER_CALLS, provider="nws", outcome="ok")
+        m.increment(PROVIDER_CALLS, outcome="error", provider="nws")  # label order is irrelevant
+        assert m.counter(PROVIDER_CALLS, provider="nws", outcome="ok") == 2
+        assert m.counter(PROVIDER_CALLS, provider="nws", outcome="error") == 1
+        assert m.counter(PROVIDER_CALLS, provider="7timer", outcome="ok") == 0
+
+    def test_histogram_merges_extra_labels(self) -> None:
+        m = InMemoryMetrics()
+        m.observe(REQUEST_SECONDS, 0.2, provider="nws", endpoint="points")
+        m.observe(REQUEST_SECONDS, 0.4, provider="nws", endpoint="hourly")
+        m.observe(REQUEST_SECONDS, 9.0, provider="7timer", endpoint="astro")
+        nws = m.histogram(REQUEST_SECONDS, provider="nws")
+        assert nws.count == 2
+        assert nws.mean == pytest.approx(0.3)
+        assert nws.maximum == 0.4
+        assert m.histogram(REQUEST_SECONDS, provider="nws", endpoint="hourly").count == 1
+
+    def test_quantiles_stay_within_their_bucket(self) -> None:
+        m = InMemoryMetrics()
+        for _ in range(95):
+            m.observe(REQUEST_SECONDS, 0.03)  # (0.025, 0.05] bucket
+        for _ in range(5):
+            m.observe(REQUEST_SECONDS, 4.0)  # (2.5, 5.0] bucket
+        h = m.histogram(REQUEST_SECONDS)
+        p50, p95, p99 = h.quantile(0.5), h.quantile(0.95), h.quantile(0.99)
+        assert p50 is not None and 0.025 < p50 <= 0.05
+        assert p95 is not None and p95 <= 0.05
+        assert p99 is not None and 2.5 < p99 <= 4.0  # capped at the largest sample
+        assert m.histogram(PARSE_SECONDS).quantile(0.5) is None
+
+    def test_timed_records_a_failed_body(self) -> None:
+        m = InMemoryMetrics()
+        with pytest.raises(RuntimeError), timed(m, REQUEST_SECONDS, provider="nws"):
+            raise RuntimeError("connection reset")
+        assert m.histogram(REQUEST_SECONDS, provider="nws").count == 1
+
+    def test_concurrent_increments_are_not_lost(self) -> None:
+        m = InMemoryMetrics()
+
+        def bump() -> None:
+            for _ in range(1000):
+                m.increment(RESPONSE_BYTES, 2, provider="open-meteo")
+
+        threads = [threading.Thread(target=bump) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert m.counter(RESPONSE_BYTES, provider="open-meteo") == 16000
+
+    def test_summary_and_reset(self) -> None:
+        m = InMemoryMetrics()
+        m.increment(PROVIDER_CALLS, provider="nws", outcome="ok")
+        m.increment(PROVIDER_CALLS, provider="nws", outcome="error")
+        m.increment(PROVIDER_CALLS, provider="nws", outcome="skipped")
+        m.observe(REQUEST_SECONDS, 0.12, provider="nws", endpoint="hourly")
+        m.increment(RESPONSE_BYTES, 48_000, provider="nws")
+        report = m.summary()
+        nws = next(h for h in report.providers if h.provider == "nws")
+        assert (nws.calls, nws.errors, nws.skipped) == (2, 1, 1)
+        assert nws.error_rate == 0.5
+        text = report.format()
+        assert "48.0" in text  # kB
+        assert "cache lookups: none" in text
+
+        m.reset()
+        assert m.summary().providers[0].calls == 0
+
+    def test_default_is_shared(self) -> None:
+        assert default_metrics() is default_metrics()
@@ -0,0 +1,94 @@
+"""ForecastSeries: hour lookup, slicing and interpolation over the merged grid."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta
+
+import numpy as np
+import pytest
+
+from auto_telescope.conditions.grid import merge_hourly
+from auto_telescope.conditions.open_meteo import OpenMeteoSlot
+from auto_telescope.conditions.series import ForecastSeries
+
+T0 = datetime(2026, 4, 1, tzinfo=UTC)
+
+
+def _series(hours: list[int], *, cloud_step: float = 10.0) -> ForecastSeries:
+    slots = [OpenMeteoSlot(T0 + timedelta(hours=h), cloud_step * h, 10000.0, 2.0) for h in hours]
+    return ForecastSeries(merge_hourly([], [], slots, issued_utc=T0))
+
+
+class TestForecastSeries:
+    def test_at_hour(self) -> None:
+        series = _series([0, 1, 2, 5])
+        assert len(series) == 4
+        f = series.at(T0 + timedelta(hours=1, minutes=59))
+        assert f is not None and f.hour_utc == T0 + timedelta(hours=1)
+        assert f.issued_utc == T0
+        assert series.at(T0 + timedelta(hours=3)) is None  # gap
+        assert series.at(T0 - timedelta(minutes=1)) is None
+        assert series.at(T0 + timedelta(hours=6)) is None
+
+    def test_nearest_skips_gaps_and_prefers_earlier_on_tie(self) -> None:
+        series = _series([0, 1, 2, 5])
+        nearest = series.nearest
+        assert nearest(T0 + timedelta(hours=3, minutes=20)).hour_utc == T0 + timedelta(hours=2)
+        assert nearest(T0 + timedelta(hours=3, minutes=30)).hour_utc == T0 + timedelta(hours=2)
+        assert nearest(T0 + timedelta(hours=4)).hour_utc == T0 + timedelta(hours=5)
+        assert nearest(T0 - timedelta(days=1)).hour_utc == T0
+        assert nearest(T0 + timedelta(days=1)).hour_utc == T0 + timedelta(hours=5)
+
+    def test_between_is_a_view(self) -> None:
+        series = _series(list(range(24)))
+        window = series.between(T0 + timedelta(hours=5, minutes=1), T0 + timedelta(hours=9))
+        assert [f.hour_utc.hour for f in window] == [6, 7, 8]
+        column = window.column("cloud_cover_pct")
+        assert np.shares_memory(column, series.column("cloud_cover_pct"))
+        assert window.at(T0 + timedelta(hours=6)) == series.at(T0 + timedelta(hours=6))
+        assert not series.between(T0 + timedelta(days=2), T0 + timedelta(days=3))
+
+    def test_interpolate(self) -> None:
+        series = _series([0, 1, 2, 5])
+        assert series.interpolate("cloud_cover_pct", T0 + timedelta(minutes=90)) == 15.0
+        assert series.interpolate("cloud_cover_pct", T0 + timedelta(hours=5)) == 50.0
+        assert series.interpolate("cloud_cover_pct", T0 + timedelta(hours=3)) is None  # gap
+        assert series.interpolate("cloud_cover_pct", T0 + timedelta(hours=2, minutes=30)) is None
+        assert series.interpolate("seeing_arcsec", T0) is None  # no 7Timer
+        assert series.interpolate("cloud_cover_pct", T0 + timedelta(hours=9)) is None
+        with pytest.raises(ValueError):
+            series.interpolate("contributing_providers", T0)
+
+    def test_from_forecasts_round_trips(self) -> None:
+        forecasts = _series([0, 1, 2, 5]).forecasts()
+        hand_made = replace(forecasts[0], seeing_arcsec=1.2, contributing_providers=("nws",))
+        rebuilt = ForecastSeries.from_forecasts([hand_made, *forecasts[1:]])
+        assert rebuilt.forecasts() == [hand_made, *forecasts[1:]]
+        assert rebuilt.at(T0 + timedelta(hours=3)) is None
+        assert not ForecastSeries.from_forecasts([])
+        with pytest.raises(ValueError):
+            ForecastSeries.from_forecasts([replace(hand_made, contributing_providers=("x",))])
+
+    def test_window_means_are_time_weighted(self) -> None:
+        series = _series([0, 1, 2, 5])  # cloud 0, 10, 20, -, -, 50
+        means = series.window_means(
+            ["cloud_cover_pct"],
+            [T0, T0 + timedelta(minutes=45), T0 + timedelta(hours=2), T0 + timedelta(hours=3)],
+            [T0 + timedelta(hours=3), T0 + timedelta(hours=2), T0 + timedelta(hours=6), T0],
+        )["cloud_cover_pct"]
+        assert means[0] == pytest.approx(10.0)
+        assert means[1] == pytest.approx((0.25 * 0 + 1.0 * 10) / 1.25)
+        assert means[2] == pytest.approx(35.0)  # the gap hours don't count
+        assert np.isnan(means[3])  # empty range
+        hour = series.window_means(["seeing_arcsec"], [T0], [T0 + timedelta(hours=1)])
+        assert np.isnan(hour["seeing_arcsec"][0])
+
+    def test_wild_timestamp_is_dropped_not_gridded(self, caplog: pytest.LogCaptureFixture) -> None:
+        slots = [OpenMeteoSlot(T0 + timedelta(hours=h), 10.0, 10000.0, 2.0) for h in range(3)]
+        garbled = OpenMeteoSlot(datetime(9999, 1, 1, tzinfo=UTC), 90.0, 10000.0, 2.0)
+        epoch = OpenMeteoSlot(datetime(1970, 1, 1, tzinfo=UTC), 90.0, 10000.0, 2.0)
+        grid = merge_hourly([], [], [epoch, *slots, garbled], issued_utc=T0)
+        assert len(grid) == 3
+        assert [f.hour_utc for f in grid.forecasts()] == [s.timestamp_utc for s in slots]
+        assert "dropping 2 open-meteo slot(s)" in caplog.text
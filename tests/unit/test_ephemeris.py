@@ -0,0 +1,85 @@
+"""Tests for catalog.ephemeris: Chebyshev tables must reproduce get_body."""
+
+from __future__ import annotations
+
+import time
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+import pytest
+from astropy import units as u
+from astropy.coordinates import SkyCoord, get_body, get_sun
+from astropy.time import Time
+
+from auto_telescope.catalog.ephemeris import SolarSystemEphemeris, to_unix_seconds
+from auto_telescope.catalog.solar_system import lookup_solar_system
+from auto_telescope.config.site import MVHS_SITE
+
+START = datetime(2026, 7, 4, 0, tzinfo=UTC)
+END = START + timedelta(days=3)
+
+
+@pytest.fixture(scope="module")
+def ephemeris() -> SolarSystemEphemeris:
+    return SolarSystemEphemeris.build(
+        MVHS_SITE, START, END, bodies=("sun", "moon", "mars", "jupiter")
+    )
+
+
+def _random_instants(n: int) -> np.ndarray:
+    rng = np.random.default_rng(42)
+    return to_unix_seconds(START) + rng.random(n) * (END - START).total_seconds()
+
+
+@pytest.mark.parametrize("body", ["sun", "moon", "mars", "jupiter"])
+def test_matches_get_body(ephemeris: SolarSystemEphemeris, body: str) -> None:
+    unix = _random_instants(200)
+    ra, dec = ephemeris.radec(body, unix)
+
+    t = Time(unix, format="unix", scale="utc")
+    truth = get_sun(t) if body == "sun" else get_body(body, t, MVHS_SITE.to_earth_location())
+    fitted = SkyCoord(ra=ra * u.deg, dec=dec * u.deg)
+    truth_icrs = SkyCoord(ra=truth.ra, dec=truth.dec)
+    err_arcsec = fitted.separation(truth_icrs).to(u.arcsec).value
+    assert err_arcsec.max() < 0.05
+
+
+def test_ra_stays_in_range(ephemeris: SolarSystemEphemeris) -> None:
+    ra, dec = ephemeris.radec("moon", _random_instants(500))
+    assert np.all((ra >= 0.0) & (ra < 360.0))
+    assert np.all(np.abs(dec) <= 90.0)
+
+
+def test_out_of_range_raises(ephemeris: SolarSystemEphemeris) -> None:
+    late = END + timedelta(days=2)
+    assert not ephemeris.covers("moon", late)
+    with pytest.raises(ValueError):
+        ephemeris.radec("moon", late)
+
+
+def test_lookup_solar_system_uses_tables(ephemeris: SolarSystemEphemeris) -> None:
+    when = START + timedelta(hours=30, minutes=7)
+    fast = lookup_solar_system("Jupiter", when_utc=when, site=MVHS_SITE, ephemeris=ephemeris)
+    slow = lookup_solar_system("Jupiter", when_utc=when, site=MVHS_SITE)
+    assert fast.ra_deg == pytest.approx(slow.ra_deg, abs=1e-5)
+    assert fast.dec_deg == pytest.approx(slow.dec_deg, abs=1e-5)
+
+
+def test_save_load_round_trip(ephemeris: SolarSystemEphemeris, tmp_path: Path) -> None:
+    path = tmp_path / "eph.npz"
+    ephemeris.save(path)
+    loaded = SolarSystemEphemeris.load(path)
+    assert loaded.site == MVHS_SITE
+    unix = _random_instants(20)
+    np.testing.assert_allclose(loaded.radec("mars", unix), ephemeris.radec("mars", unix))
+
+
+@pytest.mark.slow  # a wall-clock benchmark: too noisy for a loaded CI runner or the Pi
+def test_vectorized_evaluation_is_microseconds(ephemeris: SolarSystemEphemeris) -> None:
+    unix = _random_instants(10_000)
+    ephemeris.radec("moon", unix[:10])
+    t0 = time.perf_counter()
+    ephemeris.radec("moon", unix)
+    per_instant = (time.perf_counter() - t0) / unix.size
+    assert per_instant < 20e-6
@@ -0,0 +1,217 @@
+"""Tests for catalog.minor_bodies: MPC parsing and two-body propagation."""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Iterator
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta
+
+import numpy as np
+import pytest
+from astropy import units as u
+from astropy.coordinates import SkyCoord, get_body, get_body_barycentric_posvel
+from astropy.time import Time
+
+from auto_telescope.catalog import minor_bodies
+from auto_telescope.catalog.ephemeris import SolarSystemEphemeris
+from auto_telescope.catalog.minor_bodies import (
+    GAUSS_K,
+    OBLIQUITY_J2000_DEG,
+    MinorBodyCatalog,
+    OrbitalElements,
+    parse_mpc_elements,
+    perifocal_position,
+    register_minor_bodies,
+    screen_minor_bodies,
+)
+from auto_telescope.catalog.resolve_cache import clear_resolve_cache
+from auto_telescope.catalog.targets import TargetType, resolve_target
+from auto_telescope.config.site import MVHS_SITE
+from auto_telescope.visibility.windows import compute_windows
+
+CERES_LINE = (
+    "00001    3.34  0.12 K205V 162.68631   73.73161   80.28698   10.58862  0.0775571"
+    "  0.21406009   2.7676569 0 MPO492748  6751 115 1801-2019 0.60 M-v 30h Williams"
+    "   0000  (1) Ceres                   20190915"
+)
+HALLEY_LINE = (
+    "0001P         1986 02  9.4589  0.586254  0.967143  111.8466   58.1441  162.2635"
+    "  20200530   4.0  6.0  1P/Halley                                                 "
+    "MPEC 2020-K61"
+)
+
+EPOCH = datetime(2026, 7, 4, 6, tzinfo=UTC)
+
+
+def _elements_from_state(name: str, when: datetime) -> OrbitalElements:
+    """Osculating heliocentric elements for a planet from astropy's ephemeris."""
+    t = Time(when)
+    pos, vel = get_body_barycentric_posvel(name, t)
+    sun_pos, sun_vel = get_body_barycentric_posvel("sun", t)
+    r = (pos - sun_pos).xyz.to(u.au).value
+    v = (vel - sun_vel).xyz.to(u.au / u.day).value
+    eps = np.radians(OBLIQUITY_J2000_DEG)
+    to_ecl = np.array([[1, 0, 0], [0, np.cos(eps), np.sin(eps)], [0, -np.sin(eps), np.cos(eps)]])
+    r, v = to_ecl @ r, to_ecl @ v
+
+    mu = GAUSS_K**2
+    h = np.cross(r, v)
+    node = np.cross([0.0, 0.0, 1.0], h)
+    e_vec = np.cross(v, h) / mu - r / np.linalg.norm(r)
+    e = float(np.linalg.norm(e_vec))
+    h_hat = h / np.linalg.norm(h)
+    a = 1.0 / (2.0 / np.linalg.norm(r) - v @ v / mu)
+    nu = np.arctan2(np.cross(e_vec, r) @ h_hat, e_vec @ r)
+    ecc = 2.0 * np.arctan(np.sqrt((1 - e) / (1 + e)) * np.tan(nu / 2))
+    mean = ecc - e * np.sin(ecc)
+    return OrbitalElements(
+        designation=name,
+        kind=TargetType.ASTEROID,
+        perihelion_au=float(a * (1 - e)),
+        eccentricity=e,
+        inclination_deg=float(np.degrees(np.arccos(h_hat[2]))),
+        node_deg=float(np.degrees(np.arctan2(node[1], node[0]))),
+        peri_deg=float(np.degrees(np.arctan2(np.cross(node, e_vec) @ h_hat, node @ e_vec))),
+        perihelion_jd_tt=float(t.tt.jd - mean / (GAUSS_K / a**1.5)),
+    )
+
+
+@pytest.fixture
+def fresh_registry() -> Iterator[None]:
+    saved = minor_bodies._DEFAULT
+    minor_bodies._DEFAULT = MinorBodyCatalog([])
+    yield
+    minor_bodies._DEFAULT = saved
+    clear_resolve_cache()
+
+
+class TestParsing:
+    def test_asteroid_and_comet_lines(self) -> None:
+        ceres, halley = parse_mpc_elements(["MPCORB header", CERES_LINE, "", HALLEY_LINE])
+        assert ceres.designation == "(1) Ceres"
+        assert ceres.name == "Ceres"
+        assert ceres.kind == TargetType.ASTEROID
+        assert ceres.eccentricity == pytest.approx(0.0775571)
+        # Epoch 2020-05-31 minus M/n puts perihelion on 2018-05-01.
+        assert ceres.perihelion_jd_tt == pytest.approx(2458240.5, abs=0.5)
+        assert halley.designation == "1P/Halley"
+        assert halley.name == "Halley"
+        assert halley.kind == TargetType.COMET
+        assert halley.perihelion_jd_tt == pytest.approx(2446470.9589)
+
+    def test_catalog_lookup_by_any_name(self) -> None:
+        catalog = MinorBodyCatalog(parse_mpc_elements([CERES_LINE, HALLEY_LINE]))
+        assert catalog.find("ceres") == catalog.find("(1) Ceres") == 0
+        assert catalog.find("1P/Halley") == catalog.find("halley") == 1
+        assert catalog.find("vesta") is None
+
+
+class TestPropagation:
+    def test_mars_matches_get_body(self) -> None:
+        catalog = MinorBodyCatalog([_elements_from_state("mars", EPOCH)])
+        times = [EPOCH + timedelta(days=d) for d in (-5, -1, 0, 2, 5)]
+        ra, dec = catalog.radec(np.array(times, dtype=object), site=MVHS_SITE)
+        truth = get_body("mars", Time(times), MVHS_SITE.to_earth_location())
+        ours = SkyCoord(ra=ra[0] * u.deg, dec=dec[0] * u.deg)
+        err = ours.separation(SkyCoord(ra=truth.ra, dec=truth.dec)).to(u.arcsec).value
+        # Astrometric vs apparent place differ by aberration (~20").
+        assert err.max() < 60.0
+
+    @pytest.mark.parametrize("dt", [-40.0, -3.0, 0.0, 0.5, 25.0])
+    def test_near_parabolic_orbits_are_continuous(self, dt: float) -> None:
+        q = 0.8
+        para = np.array(perifocal_position(q, 1.0, dt))
+        ell = np.array(perifocal_position(q, 1.0 - 1e-7, dt))
+        hyp = np.array(perifocal_position(q, 1.0 + 1e-7, dt))
+        np.testing.assert_allclose(ell, para, atol=1e-6)
+        np.testing.assert_allclose(hyp, para, atol=1e-6)
+
+    @pytest.mark.parametrize("e", [0.0, 0.5, 0.97, 1.0, 1.3, 4.0])
+    def test_perihelion_and_symmetry(self, e: float) -> None:
+        x0, y0 = perifocal_position(1.2, e, 0.0)
+        assert (float(x0), float(y0)) == pytest.approx((1.2, 0.0), abs=1e-12)
+        xa, ya = perifocal_position(1.2, e, 30.0)
+        xb, yb = perifocal_position(1.2, e, -30.0)
+        assert float(xa) == pytest.approx(float(xb), abs=1e-12)
+        assert float(ya) == pytest.approx(-float(yb), abs=1e-12)
+        assert np.hypot(xa, ya) > 1.2 or e == 0.0
+
+    def test_screening_ranks_the_visible_bodies(self) -> None:
+        catalog = _random_asteroids(200)
+        start = datetime(2026, 7, 4, 4, tzinfo=UTC)
+        results = screen_minor_bodies(
+            catalog, site=MVHS_SITE, start_utc=start, end_utc=start + timedelta(hours=9)
+        )
+        assert 0 < len(results) < len(catalog)
+        minutes = [r.visible_minutes for r in results]
+        assert minutes == sorted(minutes, reverse=True)
+
+    @pytest.mark.slow  # a wall-clock benchmark: too noisy for a loaded CI runner or the Pi
+    def test_many_objects_many_epochs_are_vectorized(self) -> None:
+        catalog = _random_asteroids(1000)
+        start = datetime(2026, 7, 4, 4, tzinfo=UTC)
+        t0 = time.perf_counter()
+        results = screen_minor_bodies(
+            catalog, site=MVHS_SITE, start_utc=start, end_utc=start + timedelta(hours=9)
+        )
+        assert time.perf_counter() - t0 < 5.0
+        assert 0 < len(results) < len(catalog)
+        assert results[0].visible_minutes >= results[-1].visible_minutes
+
+
+def _random_asteroids(n: int) -> MinorBodyCatalog:
+    """``n`` main-belt-like asteroids on random orbits."""
+    rng = np.random.default_rng(1)
+    return MinorBodyCatalog(
+        [
+            OrbitalElements(
+                designation=f"A{i}",
+                kind=TargetType.ASTEROID,
+                perihelion_au=float(rng.uniform(1.1, 3.0)),
+                eccentricity=float(rng.uniform(0.0, 0.4)),
+                inclination_deg=float(rng.uniform(0, 30)),
+                node_deg=float(rng.uniform(0, 360)),
+                peri_deg=float(rng.uniform(0, 360)),
+                perihelion_jd_tt=2461000.0 + float(rng.uniform(-1500, 0)),
+                abs_magnitude=float(rng.uniform(5, 18)),
+                slope=0.15,
+            )
+            for i in range(n)
+        ]
+    )
+
+
+class TestIntegration:
+    @pytest.mark.usefixtures("fresh_registry")
+    def test_resolve_target_finds_registered_bodies(self) -> None:
+        mars = _elements_from_state("mars", EPOCH)
+        register_minor_bodies([replace(mars, designation="(99999) Testroid")])
+        target = resolve_target("Testroid", when_utc=EPOCH, site=MVHS_SITE)
+        assert target.target_type == TargetType.ASTEROID
+        assert target.id == "(99999) Testroid"
+        live = get_body("mars", Time(EPOCH), MVHS_SITE.to_earth_location())
+        sep = SkyCoord(ra=target.ra_deg * u.deg, dec=target.dec_deg * u.deg).separation(
+            SkyCoord(ra=live.ra, dec=live.dec)
+        )
+        assert sep.to(u.arcsec).value < 60.0
+
+    @pytest.mark.usefixtures("fresh_registry")
+    def test_curated_names_are_not_shadowed(self) -> None:
+        mars = _elements_from_state("mars", EPOCH)
+        register_minor_bodies([replace(mars, designation="(99998) Albireo")])
+        curated = resolve_target("Albireo", when_utc=EPOCH, site=MVHS_SITE)
+        assert curated.target_type == TargetType.DOUBLE_STAR
+        asteroid = resolve_target("(99998) Albireo", when_utc=EPOCH, site=MVHS_SITE)
+        assert asteroid.target_type == TargetType.ASTEROID
+
+    def test_provider_feeds_compute_windows(self) -> None:
+        catalog = MinorBodyCatalog([_elements_from_state("jupiter", EPOCH)])
+        end = EPOCH + timedelta(days=3)
+        kwargs = {"site": MVHS_SITE, "start_utc": EPOCH, "end_utc": end, "step_minutes": 10}
+        ours = compute_windows(catalog.provider("jupiter", site=MVHS_SITE), **kwargs)
+        ephemeris = SolarSystemEphemeris.build(MVHS_SITE, EPOCH, end, bodies=("jupiter",))
+        truth = compute_windows(ephemeris.provider("jupiter"), **kwargs)
+        assert len(ours) == len(truth)
+        for a, b in zip(ours, truth, strict=True):
+            assert abs((a.start_utc - b.start_utc).total_seconds()) <= 600
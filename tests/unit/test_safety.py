@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
-from datetime import UTC, datetime
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta
 
 from auto_telescope.conditions.aggregator import ConditionsForecast
+from auto_telescope.conditions.grid import merge_hourly
+from auto_telescope.conditions.open_meteo import OpenMeteoSlot
+from auto_telescope.conditions.series import ForecastSeries
 from auto_telescope.config.site import MVHS_SITE
 from auto_telescope.safety.interlocks import (
     check_can_slew,
@@ -26,6 +30,7 @@ def _good_forecast() -> ConditionsForecast:
         temperature_c=20.0,
         relative_humidity_pct=40.0,
         contributing_providers=("7timer", "nws", "open-meteo"),
+        issued_utc=datetime.now(UTC),
     )
 
 
@@ -104,6 +109,30 @@ class TestCheckWind:
         r = check_wind(_good_forecast(), max_wind_speed_mps=15.0)
         assert r.safe
 
+    def test_stale_forecast_blocks(self) -> None:
+        now = datetime(2026, 7, 4, 9, tzinfo=UTC)
+        stale = replace(_good_forecast(), issued_utc=now - timedelta(hours=3))
+        r = check_wind(stale, max_wind_speed_mps=15.0, max_forecast_age_seconds=7200, now=now)
+        assert not r.safe
+        assert r.code == "forecast_too_old"
+
+        fresh = replace(stale, issued_utc=now - timedelta(minutes=30))
+        r = check_wind(fresh, max_wind_speed_mps=15.0, max_forecast_age_seconds=7200, now=now)
+        assert r.safe
+
+        # check_can_slew applies the configured limit against the wall clock.
+        polaris = EquatorialCoord(ra_deg=37.95, dec_deg=89.26)
+        old = replace(_good_forecast(), issued_utc=datetime.now(UTC) - timedelta(hours=3))
+        r = check_can_slew(polaris, when_utc=datetime(2026, 1, 15, 8, tzinfo=UTC), forecast=old)
+        assert r.code == "forecast_too_old"
+
+    def test_unknown_age_blocks_when_a_limit_is_set(self) -> None:
+        undated = replace(_good_forecast(), issued_utc=None)
+        r = check_wind(undated, max_wind_speed_mps=15.0, max_forecast_age_seconds=7200)
+        assert not r.safe
+        assert r.code == "forecast_age_unknown"
+        assert check_wind(undated, max_wind_speed_mps=15.0).safe  # no limit, no age needed
+
 
 class TestCheckCanSlew:
     def test_passes_when_all_clear(self) -> None:
@@ -131,3 +160,19 @@ class TestCheckCanSlew:
         r = check_can_slew(deep_south, when_utc=when, site=MVHS_SITE, forecast=bad_wind)
         assert not r.safe
         assert r.code == "below_horizon"
+
+    def test_series_is_checked_at_the_slew_hour(self) -> None:
+        polaris = EquatorialCoord(ra_deg=37.95, dec_deg=89.26)
+        base = datetime(2026, 1, 15, 7, tzinfo=UTC)
+        slots = [
+            OpenMeteoSlot(base + timedelta(hours=h), 10.0, 20000.0, wind)
+            for h, wind in enumerate((3.0, 20.0, 3.0))
+        ]
+        series = ForecastSeries(merge_hourly([], [], slots, issued_utc=datetime.now(UTC)))
+
+        calm = check_can_slew(polaris, when_utc=base + timedelta(minutes=10), forecast=series)
+        assert calm.safe, calm.detail
+        windy = check_can_slew(polaris, when_utc=base + timedelta(minutes=90), forecast=series)
+        assert windy.code == "wind_too_high"
+        beyond = check_can_slew(polaris, when_utc=base + timedelta(hours=5), forecast=series)
+        assert beyond.code == "no_forecast"
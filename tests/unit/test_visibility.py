@@ -4,6 +4,9 @@ from __future__ import annotations
 
 from datetime import UTC, datetime, timedelta
 
+import numpy as np
+
+from auto_telescope.catalog.ephemeris import SolarSystemEphemeris
 from auto_telescope.config.site import MVHS_SITE
 from auto_telescope.visibility.coordinates import EquatorialCoord
 from auto_telescope.visibility.horizons import (
@@ -108,3 +111,38 @@ class TestComputeWindows:
             end_utc=when,
         )
         assert windows == []
+
+    def test_fixed_coord_and_constant_provider_agree(self) -> None:
+        class Fixed:
+            def radec_many(self, unix_seconds: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+                return np.full(unix_seconds.shape, 250.42), np.full(unix_seconds.shape, 36.46)
+
+        start = datetime(2026, 7, 4, tzinfo=UTC)
+        kwargs = {"site": MVHS_SITE, "start_utc": start, "end_utc": start + timedelta(days=2)}
+        expected = compute_windows(EquatorialCoord(250.42, 36.46), **kwargs)
+        assert compute_windows(Fixed(), **kwargs) == expected
+
+    def test_moving_body_uses_per_step_positions(self) -> None:
+        start = datetime(2026, 7, 4, tzinfo=UTC)
+        end = start + timedelta(days=5)
+        ephemeris = SolarSystemEphemeris.build(MVHS_SITE, start, end, bodies=("moon",))
+        windows = compute_windows(
+            ephemeris.provider("moon"),
+            site=MVHS_SITE,
+            start_utc=start,
+            end_utc=end,
+            step_minutes=10,
+            min_moon_separation_deg=0.0,
+        )
+        assert len(windows) >= 3
+        # Freezing the Moon at its start position puts later nights' windows hours off.
+        ra, dec = ephemeris.radec_at("moon", start)
+        frozen = compute_windows(
+            EquatorialCoord(ra, dec),
+            site=MVHS_SITE,
+            start_utc=start,
+            end_utc=end,
+            step_minutes=10,
+            min_moon_separation_deg=0.0,
+        )
+        assert [w.start_utc for w in windows] != [w.start_utc for w in frozen]